@@ -0,0 +1,571 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🏁 SCENT DESTINATION 오프라인 크롤러 벤치마크
+구글 지도 대신 로컬 HTTP 서버(지도 페이지 대역 + googleusercontent 형태의 사진 URL)를 띄우고
+실제 크롤러(CrawlerPool + crawl_space + ImageDownloader)를 설정별로 돌려서
+places/min, images/s, CPU 시간, 최대 RSS를 비교 (네트워크 상태나 구글 쪽 변화와 무관하게 재현 가능)
+
+필요 패키지: pip install selenium requests numpy pillow (psutil이 있으면 Chrome 프로세스까지 포함해서 측정)
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import re
+import resource
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import quote, unquote, urlparse
+
+from crawler_downloads import ImageDownloader
+from crawler_metrics import Metrics
+from crawler_pool import CrawlerPool
+from crawler_ratelimit import RateLimiter, CircuitBreaker, host_of
+
+CRAWLER_PATH = Path(__file__).with_name('google-maps-crawler.py')
+
+# 사진 URL 경로 앞부분 (셀렉터와 크롤러의 URL 정규화가 실제 사진과 같은 방식으로 동작하도록)
+PHOTO_PREFIX = '/lh3.googleusercontent.com/p/'
+
+# 대역 서버가 만들어 줄 최대 사진 크기 (너무 큰 요청으로 서버가 병목이 되지 않도록)
+MAX_PHOTO_EDGE = 2048
+
+HOME_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Maps (benchmark)</title></head>
+<body>
+<input id="searchboxinput" autocomplete="off">
+<script>
+document.getElementById('searchboxinput').addEventListener('keydown', event => {
+    if (event.key === 'Enter') {
+        location.href = '/maps/search/' + encodeURIComponent(event.target.value);
+    }
+});
+</script>
+</body></html>
+"""
+
+RESULTS_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>{query} - Maps (benchmark)</title></head>
+<body>
+<div id="results"></div>
+<script>
+setTimeout(() => {{
+    document.getElementById('results').innerHTML =
+        '<div data-result-index="1" style="cursor:pointer" ' +
+        'onclick="location.href=\\'{place_path}\\'">{query}</div>' +
+        '<div data-result-index="2">{query} 2</div>';
+}}, {render_delay});
+</script>
+</body></html>
+"""
+
+PLACE_PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><title>{query} - Maps (benchmark)</title></head>
+<body>
+<div role="main" id="pane"></div>
+<script>
+setTimeout(() => {{
+    const photos = {photos};
+    document.getElementById('pane').innerHTML =
+        '<h1>{query}</h1><button data-tab-index="1">사진</button>' +
+        photos.map(src => '<img width="408" height="306" src="' + src + '">').join('');
+}}, {render_delay});
+</script>
+</body></html>
+"""
+
+
+def synthetic_spaces(count):
+    """벤치마크용 가상 공간 목록 (실제 공간 데이터와 같은 키)"""
+    return [
+        {"name": f"벤치마크 장소 {i + 1}", "region": "서울", "english_name": f"bench-place-{i + 1}"}
+        for i in range(count)
+    ]
+
+
+def render_photo(photo_id, width, height, quality=85):
+    """
+    사진 ID마다 다른 JPEG 생성 (저해상도 난수 격자를 키워서 유사 이미지 검사에 걸리지 않게 함)
+
+    Returns:
+        bytes: JPEG 바이트
+    """
+    import numpy as np
+    from PIL import Image
+
+    seed = int.from_bytes(hashlib.sha256(photo_id.encode()).digest()[:8], 'big')
+    rng = np.random.default_rng(seed)
+    grid = rng.integers(0, 256, size=(6, 8, 3), dtype=np.uint8)
+    image = Image.fromarray(grid, 'RGB').resize((width, height), Image.BICUBIC)
+    buffer = io.BytesIO()
+    image.save(buffer, 'JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+def parse_photo_size(suffix):
+    """'w1920-h1080-k-no' 같은 크기 접미사에서 (너비, 높이) 추출 (없으면 기본 408×306)"""
+    width = re.search(r'(?:^|-)w(\d+)', suffix)
+    height = re.search(r'(?:^|-)h(\d+)', suffix)
+    width = int(width.group(1)) if width else 408
+    height = int(height.group(1)) if height else round(width * 0.75)
+    return min(width, MAX_PHOTO_EDGE), min(height, MAX_PHOTO_EDGE)
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """지도 홈 / 검색 결과 / 장소 페이지 / 사진을 흉내 내는 요청 처리기"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _delay(self, latency):
+        options = self.server.options
+        time.sleep(latency + random.uniform(0, options["jitter"]))
+
+    def _send(self, status, body=b'', content_type='text/html; charset=utf-8', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        path = urlparse(self.path).path
+        options = self.server.options
+
+        if path.startswith(PHOTO_PREFIX):
+            self._delay(options["image_latency"])
+            return self._photo(path[len(PHOTO_PREFIX):])
+
+        self._delay(options["latency"])
+        if path in ('/maps', '/maps/'):
+            return self._send(200, HOME_PAGE.encode())
+        if path.startswith('/maps/search/'):
+            return self._search(unquote(path[len('/maps/search/'):]))
+        if path.startswith('/maps/place/'):
+            return self._place(unquote(path[len('/maps/place/'):]))
+        return self._send(404, b'not found', 'text/plain')
+
+    def _search(self, query):
+        place_path = '/maps/place/' + quote(query)
+        # 검색어마다 고정된 비율로 결과 목록 없이 장소 페이지로 바로 연결 (실제 지도처럼)
+        digest = hashlib.sha256(query.encode()).digest()[0]
+        if digest / 256 < self.server.options["direct_ratio"]:
+            return self._send(302, headers={'Location': place_path})
+        body = RESULTS_PAGE.format(
+            query=query, place_path=place_path, render_delay=self.server.options["render_delay_ms"]
+        )
+        return self._send(200, body.encode())
+
+    def _place(self, query):
+        key = hashlib.sha256(query.encode()).hexdigest()[:12]
+        photos = [
+            f"{PHOTO_PREFIX}{key}-{i + 1}=w408-h306-k-no"
+            for i in range(self.server.options["photos"])
+        ]
+        body = PLACE_PAGE.format(
+            query=query, photos=json.dumps(photos), render_delay=self.server.options["render_delay_ms"]
+        )
+        return self._send(200, body.encode())
+
+    def _photo(self, rest):
+        photo_id, _, suffix = rest.partition('=')
+        size = parse_photo_size(suffix)
+        etag = f'"{photo_id}-{size[0]}x{size[1]}"'
+        if self.headers.get('If-None-Match') == etag:
+            return self._send(304, headers={'ETag': etag})
+
+        cache = self.server.photo_cache
+        with self.server.cache_lock:
+            content = cache.get((photo_id, size))
+        if content is None:
+            content = render_photo(photo_id, *size)
+            with self.server.cache_lock:
+                cache[(photo_id, size)] = content
+        return self._send(200, content, 'image/jpeg', {'ETag': etag, 'Cache-Control': 'max-age=86400'})
+
+
+def serve_fixtures(options, ready):
+    """
+    대역 서버 실행 (크롤러와 CPU/메모리 측정이 섞이지 않도록 별도 프로세스에서 호출)
+
+    Args:
+        options (dict): latency, image_latency, jitter, render_delay_ms, photos, direct_ratio
+        ready (Queue): 서버가 뜨면 포트 번호를 넣을 큐
+    """
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FixtureHandler)
+    server.daemon_threads = True
+    server.options = options
+    server.photo_cache = {}
+    server.cache_lock = threading.Lock()
+    ready.put(server.server_address[1])
+    server.serve_forever()
+
+
+class FixtureServer:
+    def __init__(self, latency=0.05, image_latency=0.02, jitter=0.02, render_delay=0.2,
+                 photos=8, direct_ratio=0.5):
+        """
+        로컬 지도 대역 서버 설정
+
+        Args:
+            latency (float): 지도 페이지 응답 지연 (초)
+            image_latency (float): 사진 응답 지연 (초)
+            jitter (float): 응답마다 더할 무작위 지연 상한 (초)
+            render_delay (float): 페이지가 열린 뒤 결과/장소 패널이 렌더링되기까지 걸리는 시간 (초)
+            photos (int): 장소당 사진 수
+            direct_ratio (float): 검색 결과 목록 없이 장소 페이지로 바로 연결되는 검색어 비율 (0~1)
+        """
+        self.options = {
+            "latency": latency,
+            "image_latency": image_latency,
+            "jitter": jitter,
+            "render_delay_ms": int(render_delay * 1000),
+            "photos": photos,
+            "direct_ratio": direct_ratio,
+        }
+        self.process = None
+        self.port = None
+
+    @property
+    def maps_url(self):
+        return f"http://127.0.0.1:{self.port}/maps/"
+
+    def start(self):
+        context = multiprocessing.get_context('spawn')
+        ready = context.Queue()
+        self.process = context.Process(target=serve_fixtures, args=(self.options, ready), daemon=True)
+        self.process.start()
+        self.port = ready.get(timeout=30)
+        print(f"🧪 지도 대역 서버 시작: {self.maps_url}")
+        return self
+
+    def stop(self):
+        if self.process is not None:
+            self.process.terminate()
+            self.process.join(timeout=5)
+            self.process = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class ResourceSampler:
+    def __init__(self, interval=0.2, exclude_pids=()):
+        """
+        크롤러 프로세스 트리(Python + chromedriver + Chrome)의 CPU 시간과 최대 RSS 측정
+
+        psutil이 없으면 resource.getrusage로 대신함 (이 경우 최대 RSS는 Python 프로세스만)
+
+        Args:
+            interval (float): RSS 샘플링 간격 (초)
+            exclude_pids (iterable): 측정에서 뺄 자식 프로세스 (대역 서버)
+        """
+        self.interval = interval
+        self.exclude_pids = set(exclude_pids)
+        self.peak_rss = 0
+        self._cpu = {}
+        self._stop = threading.Event()
+        self._thread = None
+
+        try:
+            import psutil
+            self._process = psutil.Process(os.getpid())
+            self._psutil = psutil
+        except ImportError:
+            self._process = None
+            self._psutil = None
+
+    def _tree(self):
+        processes = [self._process]
+        try:
+            processes += self._process.children(recursive=True)
+        except self._psutil.Error:
+            pass
+        return [p for p in processes if p.pid not in self.exclude_pids]
+
+    def _sample(self):
+        rss = 0
+        for process in self._tree():
+            try:
+                rss += process.memory_info().rss
+                times = process.cpu_times()
+                # 중간에 종료된 Chrome 프로세스의 CPU 시간도 잃지 않도록 마지막 값을 보관
+                self._cpu[process.pid] = times.user + times.system
+            except self._psutil.Error:
+                continue
+        self.peak_rss = max(self.peak_rss, rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _rusage_cpu(self):
+        usage = [resource.getrusage(who) for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN)]
+        return sum(u.ru_utime + u.ru_stime for u in usage)
+
+    def start(self):
+        if self._psutil:
+            # 이전 설정에서 쓴 CPU 시간은 빼고 시작
+            self._sample()
+            self._baseline = dict(self._cpu)
+            self.peak_rss = 0
+            self._thread = threading.Thread(target=self._run, name="resource-sampler", daemon=True)
+            self._thread.start()
+        else:
+            self._baseline = self._rusage_cpu()
+        return self
+
+    def stop(self):
+        """
+        측정 종료
+
+        Returns:
+            dict: {cpu_seconds, peak_rss_mb, source}
+        """
+        if not self._psutil:
+            # ru_maxrss는 리눅스에서 KB, macOS에서 바이트
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            peak_mb = peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+            return {
+                "cpu_seconds": round(self._rusage_cpu() - self._baseline, 2),
+                "peak_rss_mb": round(peak_mb, 1),
+                "source": "getrusage",
+            }
+
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+        cpu = sum(value - self._baseline.get(pid, 0.0) for pid, value in self._cpu.items())
+        return {
+            "cpu_seconds": round(cpu, 2),
+            "peak_rss_mb": round(self.peak_rss / 1024 / 1024, 1),
+            "source": "psutil",
+        }
+
+
+def load_crawler_module():
+    """하이픈이 들어간 google-maps-crawler.py를 모듈로 로드"""
+    spec = importlib.util.spec_from_file_location('google_maps_crawler', CRAWLER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_configuration(crawler_module, maps_url, spaces, config, max_images=3, headless=True,
+                      extraction='dom', rank=False, candidates=8, rate=50.0, image_rate=200.0):
+    """
+    설정 하나로 가상 공간들을 크롤링하고 처리량 측정
+
+    Args:
+        crawler_module (module): google-maps-crawler 모듈
+        maps_url (str): 대역 서버의 지도 URL
+        spaces (list): 크롤링할 가상 공간들
+        config (dict): workers, download_workers, wait_ceiling
+        max_images (int): 장소당 받을 사진 수
+        headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+        extraction (str): 사진 URL 수집 방식 (대역 서버는 같은 호스트라 'dom'만 의미 있음)
+        rank (bool): 후보 썸네일 순위 매기기 사용 여부
+        candidates (int): rank 사용 시 장소당 후보 수
+        rate (float): 지도 이동 속도 제한 (초당, 대역 서버라 넉넉하게)
+        image_rate (float): 사진 호스트 요청 속도 제한 (초당)
+
+    Returns:
+        dict: 설정과 측정 결과
+    """
+    download_dir = Path(tempfile.mkdtemp(prefix='scent-bench-'))
+    metrics = Metrics()
+    limiter = RateLimiter(default_rate=image_rate, rates={host_of(maps_url): rate})
+    breaker = CircuitBreaker()
+    downloader = ImageDownloader(
+        max_workers=config["download_workers"], per_host=config["download_workers"],
+        limiter=limiter, breaker=breaker, metrics=metrics
+    )
+    ranker = None
+    if rank:
+        from crawler_ranking import CandidateRanker
+        ranker = CandidateRanker(downloader, max_workers=config["workers"])
+
+    ceilings = {name: config["wait_ceiling"] for name in ("search_panel", "search_results", "place_pane", "photos")}
+    pool = CrawlerPool(
+        factory=lambda: crawler_module.GoogleMapsImageCrawler(
+            headless=headless,
+            download_dir=str(download_dir),
+            wait_ceilings=ceilings,
+            extraction=extraction,
+            ranker=ranker,
+            candidates=candidates,
+            metrics=metrics,
+            maps_url=maps_url,
+            downloader=downloader,
+            background_downloads=True
+        ),
+        size=config["workers"],
+        is_healthy=lambda crawler: crawler.is_alive()
+    )
+
+    failed = []
+    crawl_started = None
+    sampler = ResourceSampler(exclude_pids=config.get("exclude_pids", ())).start()
+    started = time.monotonic()
+    try:
+        if pool.start() == 0:
+            raise RuntimeError("크롤러 세션을 만들 수 없음 (Chrome 설치 확인)")
+        crawl_started = time.monotonic()
+        results, leftover = pool.run(
+            spaces,
+            lambda crawler, space: crawler_module.crawl_space(crawler, space, max_images, None, limiter, breaker)
+        )
+        failed = [r["job"]["name"] for r in results if r["error"] is not None] + [s["name"] for s in leftover]
+    finally:
+        pool.close()
+        if ranker:
+            ranker.close()
+        downloader.close()
+        elapsed = time.monotonic() - started
+        crawl_elapsed = time.monotonic() - crawl_started if crawl_started else elapsed
+        resources = sampler.stop()
+        shutil.rmtree(download_dir, ignore_errors=True)
+
+    timings = metrics.summary()["timings"]
+    return {
+        **{key: value for key, value in config.items() if key != "exclude_pids"},
+        "rank": rank,
+        "places": len(spaces) - len(failed),
+        "failed_places": len(failed),
+        "images": downloader.stats["ok"],
+        "failed_images": downloader.stats["failed"],
+        "megabytes": round(downloader.stats["bytes"] / 1024 / 1024, 2),
+        "seconds": round(elapsed, 2),
+        "startup_seconds": round(elapsed - crawl_elapsed, 2),
+        "places_per_min": round((len(spaces) - len(failed)) / crawl_elapsed * 60, 1) if crawl_elapsed else 0.0,
+        "images_per_sec": round(downloader.stats["ok"] / crawl_elapsed, 2) if crawl_elapsed else 0.0,
+        "place_p50": timings.get("place", {}).get("p50", 0.0),
+        "place_p95": timings.get("place", {}).get("p95", 0.0),
+        **resources,
+    }
+
+
+def print_results(rows):
+    """설정별 결과 표 출력 (places/min 순)"""
+    print("\n🏁 벤치마크 결과")
+    print(
+        f"   {'워커':>4} {'다운로드':>8} {'대기상한':>8} {'장소/분':>8} {'이미지/s':>9} "
+        f"{'p50':>6} {'p95':>6} {'CPU(s)':>7} {'RSS(MB)':>8} {'실패':>5}"
+    )
+    for row in sorted(rows, key=lambda r: r["places_per_min"], reverse=True):
+        print(
+            f"   {row['workers']:>4} {row['download_workers']:>8} {row['wait_ceiling']:>8.1f} "
+            f"{row['places_per_min']:>8.1f} {row['images_per_sec']:>9.2f} "
+            f"{row['place_p50']:>6.2f} {row['place_p95']:>6.2f} {row['cpu_seconds']:>7.1f} "
+            f"{row['peak_rss_mb']:>8.0f} {row['failed_places']:>5}"
+        )
+    if rows and rows[0]["source"] != "psutil":
+        print("   💡 psutil이 없어 RSS는 Python 프로세스만 측정됨 (pip install psutil)")
+
+
+def run_benchmark(workers=(1, 2), download_workers=(4, 8), wait_ceilings=(10.0,), places=12,
+                  max_images=3, photos=8, latency=0.05, image_latency=0.02, jitter=0.02,
+                  render_delay=0.2, direct_ratio=0.5, headless=True, rank=False, candidates=8,
+                  output=None):
+    """
+    대역 서버를 띄우고 설정 조합(워커 수 × 다운로드 스레드 수 × 대기 상한)마다 크롤링 측정
+
+    Returns:
+        list: 설정별 측정 결과
+    """
+    crawler_module = load_crawler_module()
+    spaces = synthetic_spaces(places)
+    rows = []
+
+    with FixtureServer(latency, image_latency, jitter, render_delay, photos, direct_ratio) as server:
+        grid = list(itertools.product(workers, download_workers, wait_ceilings))
+        for index, (worker_count, download_count, ceiling) in enumerate(grid, 1):
+            config = {
+                "workers": worker_count,
+                "download_workers": download_count,
+                "wait_ceiling": ceiling,
+                "exclude_pids": (server.process.pid,),
+            }
+            print(f"\n🏃 [{index}/{len(grid)}] 워커 {worker_count}개, 다운로드 {download_count}개, 대기 상한 {ceiling}s")
+            try:
+                row = run_configuration(
+                    crawler_module, server.maps_url, spaces, config, max_images=max_images,
+                    headless=headless, rank=rank, candidates=candidates
+                )
+            except Exception as e:
+                print(f"❌ 설정 측정 실패: {e}")
+                continue
+            rows.append(row)
+
+    print_results(rows)
+    if output:
+        Path(output).parent.mkdir(parents=True, exist_ok=True)
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, ensure_ascii=False, indent=2)
+        print(f"📝 결과 저장: {output}")
+    return rows
+
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="SCENT DESTINATION 크롤러 오프라인 벤치마크")
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2], help="비교할 Chrome 세션 수들 (기본: 1 2)")
+    parser.add_argument('--download-workers', type=int, nargs='+', default=[4, 8], help="비교할 다운로드 스레드 수들 (기본: 4 8)")
+    parser.add_argument('--wait-ceiling', type=float, nargs='+', default=[10.0], help="비교할 준비 상태 대기 상한들 (초, 기본: 10)")
+    parser.add_argument('--places', type=int, default=12, help="설정마다 크롤링할 가상 장소 수 (기본: 12)")
+    parser.add_argument('--max-images', type=int, default=3, help="장소당 받을 사진 수 (기본: 3)")
+    parser.add_argument('--photos', type=int, default=8, help="대역 서버의 장소당 사진 수 (기본: 8)")
+    parser.add_argument('--latency', type=float, default=0.05, help="지도 페이지 응답 지연 (초, 기본: 0.05)")
+    parser.add_argument('--image-latency', type=float, default=0.02, help="사진 응답 지연 (초, 기본: 0.02)")
+    parser.add_argument('--jitter', type=float, default=0.02, help="응답마다 더할 무작위 지연 상한 (초, 기본: 0.02)")
+    parser.add_argument('--render-delay', type=float, default=0.2, help="패널이 렌더링되기까지 걸리는 시간 (초, 기본: 0.2)")
+    parser.add_argument('--direct-ratio', type=float, default=0.5, help="장소 페이지로 바로 연결되는 검색 비율 (기본: 0.5)")
+    parser.add_argument('--show-browser', action='store_true', help="브라우저 창을 띄워서 실행")
+    parser.add_argument('--rank', action='store_true', help="후보 썸네일 순위 매기기까지 포함해서 측정")
+    parser.add_argument('--candidates', type=int, default=8, help="--rank 사용 시 장소당 후보 수 (기본: 8)")
+    parser.add_argument('--output', metavar='PATH', help="결과를 JSON으로 저장할 경로")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    run_benchmark(
+        workers=args.workers,
+        download_workers=args.download_workers,
+        wait_ceilings=args.wait_ceiling,
+        places=args.places,
+        max_images=args.max_images,
+        photos=args.photos,
+        latency=args.latency,
+        image_latency=args.image_latency,
+        jitter=args.jitter,
+        render_delay=args.render_delay,
+        direct_ratio=args.direct_ratio,
+        headless=not args.show_browser,
+        rank=args.rank,
+        candidates=args.candidates,
+        output=args.output
+    )
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗃️ SCENT DESTINATION 사이트용 이미지 카탈로그
+크롤링이 끝날 때 public/images/places에 실제로 있는 이미지를 장소별로 정리한 JSON을 만듦
+(파일, 크기, 후처리 변형 포맷/너비, 내용 해시, 로딩 전에 그릴 플레이스홀더)
+사이트는 이 파일 하나를 정적으로 import해서 공간 카드마다 HEAD 요청을 보내지 않고 이미지를 찾음
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from crawler_postprocess import is_variant
+
+CATALOG_PATH = 'src/data/placeImages.json'
+
+# 카탈로그 형식이 바뀌면 올림 (사이트는 모르는 버전이면 HEAD 확인으로 돌아감)
+CATALOG_VERSION = 1
+
+# 사이트에서 쓰는 이미지 경로 앞부분
+BASE_PATH = '/images/places'
+
+# 캐시 무효화용 해시 길이 (SHA-256 앞 16자리)
+HASH_LENGTH = 16
+
+ORIGINAL_PATTERN = re.compile(r'^(?P<key>.+)-(?P<index>\d+)\.jpg$')
+
+
+def image_dimensions(path):
+    """이미지 헤더만 읽어서 (너비, 높이) 반환 (Pillow가 없거나 읽을 수 없으면 None)"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    try:
+        with Image.open(path) as image:
+            return image.size
+    except Exception:
+        return None
+
+
+def file_sha256(path):
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def variant_formats(directory, stem):
+    """
+    원본 하나의 후처리 변형 (osechill-1-640w.webp 등)
+
+    Returns:
+        dict: 포맷 -> 정렬된 너비 리스트
+    """
+    formats = {}
+    for path in directory.glob(f'{stem}-*w.*'):
+        if not is_variant(path) or path.stem.rsplit('-', 1)[0] != stem:
+            continue
+        width = int(path.stem.rsplit('-', 1)[1][:-1])
+        formats.setdefault(path.suffix[1:], []).append(width)
+    return {fmt: sorted(widths) for fmt, widths in sorted(formats.items())}
+
+
+def build_catalog(directory='public/images/places', spaces=(), checksums=None, previous=None, placeholders=True):
+    """
+    저장 디렉토리를 훑어서 장소별 이미지 카탈로그 생성
+
+    Args:
+        directory (str): 이미지 저장 디렉토리
+        spaces (iterable): 공간 데이터 (id가 있으면 id -> english_name 색인도 만듦)
+        checksums (ChecksumStore): 다운로드 때 기록한 SHA-256 (바뀌지 않은 파일은 다시 읽지 않음)
+        previous (dict): 이전 카탈로그 (해시가 같은 이미지는 크기/플레이스홀더를 다시 계산하지 않음)
+        placeholders (bool): 이미지마다 BlurHash / 인라인 썸네일 / 대표 색상을 계산할지 여부
+
+    Returns:
+        dict: {version, base_path, places: {english_name: {images: [...]}}, ids: {id: english_name}}
+    """
+    directory = Path(directory)
+    known = {}
+    for entry in (previous or {}).get("places", {}).values():
+        for image in entry["images"]:
+            known[image["hash"]] = image
+
+    places = {}
+    pending = {}
+    originals = sorted(directory.glob('*.jpg')) if directory.exists() else []
+    for path in originals:
+        match = ORIGINAL_PATTERN.match(path.name)
+        if not match or is_variant(path):
+            continue
+
+        sha256 = (checksums.current_sha256(path) if checksums else None) or file_sha256(path)
+        content_hash = sha256[:HASH_LENGTH]
+        cached = known.get(content_hash)
+        size = (cached["width"], cached["height"]) if cached and cached.get("width") else image_dimensions(path)
+
+        image = {"file": path.name, "hash": content_hash, "bytes": path.stat().st_size}
+        if size:
+            image["width"], image["height"] = size
+        formats = variant_formats(directory, path.stem)
+        if formats:
+            image["formats"] = formats
+        if cached and cached.get("placeholder"):
+            image["placeholder"] = cached["placeholder"]
+        elif placeholders:
+            pending[str(path)] = image
+
+        place = places.setdefault(match.group("key"), {"images": []})
+        place["images"].append((int(match.group("index")), image))
+
+    if pending:
+        attach_placeholders(pending)
+
+    for place in places.values():
+        place["images"] = [image for _, image in sorted(place["images"], key=lambda item: item[0])]
+
+    ids = {}
+    for space in spaces:
+        if space.get("id") and space["english_name"] in places:
+            ids[str(space["id"])] = space["english_name"]
+
+    return {
+        "version": CATALOG_VERSION,
+        "base_path": BASE_PATH,
+        "places": dict(sorted(places.items())),
+        "ids": dict(sorted(ids.items())),
+    }
+
+
+def attach_placeholders(pending):
+    """
+    새 이미지들의 플레이스홀더를 프로세스 풀에서 묶음으로 계산해서 카탈로그 항목에 붙임
+
+    Args:
+        pending (dict): 이미지 경로 -> 카탈로그 이미지 항목
+    """
+    try:
+        from crawler_placeholders import compute_placeholders
+    except ImportError:
+        print("⚠️ numpy가 없어 플레이스홀더를 건너뜀 (pip install numpy pillow)")
+        return
+
+    print(f"🎨 플레이스홀더 계산: {len(pending)}장")
+    for path, placeholder in compute_placeholders(list(pending)).items():
+        pending[path]["placeholder"] = placeholder
+
+
+def load_catalog(path=CATALOG_PATH):
+    """이전 카탈로그 (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def save_catalog(catalog, path=CATALOG_PATH, previous=None):
+    """
+    카탈로그를 원자적으로 저장 (바뀐 내용이 없으면 파일을 건드리지 않음 - 불필요한 빌드/커밋 방지)
+
+    Returns:
+        bool: 파일을 새로 썼는지 여부
+    """
+    if previous == catalog:
+        return False
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(catalog, f, ensure_ascii=False, separators=(',', ':'))
+        f.write('\n')
+    os.replace(tmp_path, path)
+    return True
+
+
+def update_catalog(directory='public/images/places', spaces=(), checksums=None, path=CATALOG_PATH, placeholders=True):
+    """카탈로그를 다시 만들어서 저장하고 요약 출력"""
+    previous = load_catalog(path)
+    catalog = build_catalog(directory, spaces, checksums, previous, placeholders)
+    written = save_catalog(catalog, path, previous)
+    images = sum(len(place["images"]) for place in catalog["places"].values())
+    print(
+        f"🗃️ 이미지 카탈로그: {len(catalog['places'])}개 장소, {images}장 "
+        f"({path}{'' if written else ', 변경 없음'})"
+    )
+    return catalog
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗂️ SCENT DESTINATION 크롤링 대상 데이터셋
+extract-spaces-data.mjs가 만든 spaces_data.json을 스트리밍으로 읽고,
+마지막으로 크롤링한 스냅샷과 id 기준으로 비교해서 바뀐 공간만 골라냄
+"""
+
+import json
+import os
+from pathlib import Path
+
+SPACES_DATA_PATH = 'scripts/spaces_data.json'
+SNAPSHOT_PATH = 'scripts/spaces_snapshot.json'
+
+# 스냅샷 비교에 쓰는 필드 (이 값들이 바뀌면 다시 크롤링)
+TRACKED_FIELDS = ("name", "english_name", "region")
+
+
+def iter_json_array(path, chunk_size=64 * 1024):
+    """
+    최상위가 배열인 JSON 파일을 원소 단위로 스트리밍 파싱
+
+    파일 전체를 한 번에 올리지 않고 chunk 단위로 읽으면서 JSONDecoder.raw_decode로 원소를 하나씩 꺼냄
+
+    Args:
+        path (str): JSON 파일 경로
+        chunk_size (int): 한 번에 읽을 글자 수
+
+    Yields:
+        배열의 각 원소
+    """
+    decoder = json.JSONDecoder()
+    with open(path, encoding='utf-8') as f:
+        buffer = ''
+        started = False
+        eof = False
+
+        while True:
+            if not eof and len(buffer) < chunk_size:
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+
+            buffer = buffer.lstrip()
+            if not started:
+                if not buffer:
+                    if eof:
+                        raise ValueError(f"{path}: 빈 파일입니다")
+                    continue
+                if buffer[0] != '[':
+                    raise ValueError(f"{path}: 최상위가 배열이 아닙니다")
+                buffer = buffer[1:]
+                started = True
+                continue
+
+            if buffer.startswith(','):
+                buffer = buffer[1:]
+                continue
+            if buffer.startswith(']'):
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                # 원소가 chunk 경계에 걸친 경우 더 읽어서 다시 시도
+                if eof:
+                    raise
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+
+            yield item
+            buffer = buffer[end:]
+
+
+def space_key(space):
+    """스냅샷 비교용 키 (id가 없는 예전 데이터는 english_name 사용)"""
+    return space.get("id") or space["english_name"]
+
+
+def load_spaces_json(path=SPACES_DATA_PATH):
+    """spaces_data.json에서 공간 목록 로드 (크롤러가 쓰는 필드만 유지)"""
+    spaces = []
+    for item in iter_json_array(path):
+        spaces.append({
+            "id": item.get("id"),
+            "name": item["name"],
+            "region": item.get("region", ""),
+            "english_name": item["english_name"],
+            "category": item.get("category"),
+        })
+    return spaces
+
+
+def load_snapshot(path=SNAPSHOT_PATH):
+    """마지막으로 크롤링한 공간 스냅샷 로드 (키 -> 공간)"""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_snapshot(snapshot, path=SNAPSHOT_PATH):
+    """스냅샷을 원자적으로 저장"""
+    path = Path(path)
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(snapshot, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def diff_spaces(spaces, snapshot):
+    """
+    현재 데이터셋과 스냅샷을 id 기준으로 비교
+
+    Args:
+        spaces (list): 현재 공간 목록
+        snapshot (dict): 마지막으로 크롤링한 스냅샷
+
+    Returns:
+        dict: added / renamed / moved / removed 별 공간 목록 (removed는 스냅샷의 공간)
+    """
+    changes = {"added": [], "renamed": [], "moved": [], "removed": []}
+    seen = set()
+
+    for space in spaces:
+        key = space_key(space)
+        seen.add(key)
+        previous = snapshot.get(key)
+
+        if previous is None:
+            changes["added"].append(space)
+        elif (previous.get("name"), previous.get("english_name")) != (space["name"], space["english_name"]):
+            changes["renamed"].append(space)
+        elif previous.get("region") != space["region"]:
+            changes["moved"].append(space)
+
+    changes["removed"] = [space for key, space in snapshot.items() if key not in seen]
+    return changes
+
+
+def snapshot_entry(space):
+    """스냅샷에 저장할 필드만 추림"""
+    return {field: space.get(field) for field in TRACKED_FIELDS}
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🔁 SCENT DESTINATION 유사 이미지 중복 제거
+저장된 모든 이미지의 64비트 dHash를 numpy uint64 배열 하나에 담아 두고,
+새로 받은 이미지와의 해밍 거리를 한 번의 벡터 연산으로 계산해서 거의 같은 사진을 걸러냄
+(같은 사진의 다른 크기/토큰 URL, 체인점끼리 공유하는 사진 등)
+
+필요 패키지: pip install numpy pillow
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from crawler_postprocess import is_variant
+
+HASH_INDEX_PATH = 'scripts/image_hashes.npz'
+
+# 64비트 중 이 거리 이하로 다르면 같은 사진으로 봄 (재압축/리사이즈는 보통 0~6)
+DEFAULT_THRESHOLD = 10
+
+
+def dhash(image, size=8):
+    """
+    difference hash 계산 (가로로 이웃한 픽셀의 밝기 비교 64비트)
+
+    Args:
+        image (PIL.Image): 원본 이미지
+        size (int): 해시 한 변의 크기 (8이면 64비트)
+
+    Returns:
+        int: 64비트 해시
+    """
+    from PIL import Image
+
+    gray = image.convert('L').resize((size + 1, size), Image.LANCZOS)
+    pixels = np.asarray(gray, dtype=np.int16)
+    bits = (pixels[:, 1:] > pixels[:, :-1]).flatten()
+    return int(np.packbits(bits).view('>u8')[0])
+
+
+def dhash_file(path):
+    """저장된 이미지 파일의 dHash (디코딩 실패 시 None)"""
+    from PIL import Image
+
+    try:
+        with Image.open(path) as image:
+            return dhash(image)
+    except Exception:
+        return None
+
+
+def hamming_distances(hashes, value):
+    """uint64 해시 배열과 해시 하나의 해밍 거리를 한 번에 계산"""
+    diff = np.bitwise_xor(hashes, np.uint64(value))
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(diff)
+    # numpy 2.0 미만: 바이트 단위로 펼쳐서 비트 수 합산
+    return np.unpackbits(diff.view(np.uint8).reshape(-1, 8), axis=1).sum(axis=1)
+
+
+def owner_of(file_name):
+    """파일명에서 장소 키 추출 (osechill-2.jpg -> osechill)"""
+    stem = Path(file_name).stem
+    key, _, index = stem.rpartition('-')
+    return key if index.isdigit() else stem
+
+
+class PerceptualIndex:
+    def __init__(self, path=HASH_INDEX_PATH, threshold=DEFAULT_THRESHOLD):
+        """
+        유사 이미지 해시 인덱스 로드
+
+        Args:
+            path (str): 인덱스 파일(npz) 경로 (hashes: uint64, files, mtimes)
+            threshold (int): 같은 사진으로 볼 최대 해밍 거리 (None이면 DEFAULT_THRESHOLD)
+        """
+        self.path = Path(path)
+        self.threshold = DEFAULT_THRESHOLD if threshold is None else threshold
+        self.stats = {"checked": 0, "duplicates": 0}
+
+        self._hashes = np.zeros(256, dtype=np.uint64)
+        self._size = 0
+        self.files = []
+        self.mtimes = {}
+        self._lock = threading.Lock()
+        self.dirty = False
+
+        if self.path.exists():
+            try:
+                with np.load(self.path, allow_pickle=False) as data:
+                    hashes = data["hashes"]
+                    self._grow(len(hashes))
+                    self._hashes[:len(hashes)] = hashes
+                    self._size = len(hashes)
+                    self.files = [str(f) for f in data["files"]]
+                    self.mtimes = dict(zip(self.files, data["mtimes"].tolist()))
+            except (OSError, KeyError, ValueError) as e:
+                print(f"⚠️ 이미지 해시 인덱스를 읽을 수 없어 새로 시작: {e}")
+                self._size = 0
+                self.files = []
+                self.mtimes = {}
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def hashes(self):
+        return self._hashes[:self._size]
+
+    def _grow(self, needed):
+        """배열 용량이 부족하면 두 배씩 늘림 (추가할 때마다 복사하지 않도록)"""
+        if needed <= len(self._hashes):
+            return
+        capacity = max(needed, len(self._hashes) * 2)
+        grown = np.zeros(capacity, dtype=np.uint64)
+        grown[:self._size] = self._hashes[:self._size]
+        self._hashes = grown
+
+    def _add(self, file_name, value, mtime=0.0):
+        if file_name in self.mtimes:
+            self._hashes[self.files.index(file_name)] = np.uint64(value)
+        else:
+            self._grow(self._size + 1)
+            self._hashes[self._size] = np.uint64(value)
+            self._size += 1
+            self.files.append(file_name)
+        self.mtimes[file_name] = mtime
+        self.dirty = True
+
+    def _remove(self, indexes):
+        keep = np.ones(self._size, dtype=bool)
+        keep[list(indexes)] = False
+        kept = self._hashes[:self._size][keep]
+        self._hashes[:len(kept)] = kept
+        self._size = len(kept)
+        for index in sorted(indexes, reverse=True):
+            self.mtimes.pop(self.files.pop(index), None)
+        self.dirty = True
+
+    def sync_directory(self, directory):
+        """
+        저장 디렉토리와 인덱스를 맞춤 (새로 생기거나 바뀐 원본만 해시하고, 사라진 파일은 제거)
+
+        Args:
+            directory (str): 이미지 저장 디렉토리
+
+        Returns:
+            int: 새로 해시한 파일 수
+        """
+        directory = Path(directory)
+        current = {
+            p.name: p.stat().st_mtime
+            for p in directory.glob('*.jpg') if not is_variant(p)
+        } if directory.exists() else {}
+
+        with self._lock:
+            gone = [i for i, name in enumerate(self.files) if name not in current]
+            if gone:
+                self._remove(gone)
+
+            hashed = 0
+            for name, mtime in sorted(current.items()):
+                if self.mtimes.get(name) == mtime:
+                    continue
+                value = dhash_file(directory / name)
+                if value is not None:
+                    self._add(name, value, mtime)
+                    hashed += 1
+            return hashed
+
+    def find_similar(self, value):
+        """
+        가장 가까운 기존 이미지 찾기
+
+        Args:
+            value (int): 새 이미지의 해시
+
+        Returns:
+            tuple: (파일명, 해밍 거리) - threshold 이내가 없으면 None
+        """
+        if self._size == 0:
+            return None
+        distances = hamming_distances(self.hashes, value)
+        index = int(np.argmin(distances))
+        distance = int(distances[index])
+        if distance > self.threshold:
+            return None
+        return self.files[index], distance
+
+    def claim(self, path, file_name):
+        """
+        다운로드한 이미지가 새 사진이면 인덱스에 등록 (확인과 등록을 한 번에 해서 동시 다운로드끼리도 중복 방지)
+
+        Args:
+            path (Path): 다운로드가 끝난 임시 파일 경로
+            file_name (str): 저장할 파일명
+
+        Returns:
+            tuple: 중복이면 (기존 파일명, 해밍 거리), 새 사진이면 None
+        """
+        value = dhash_file(path)
+        with self._lock:
+            self.stats["checked"] += 1
+            if value is None:
+                return None
+
+            match = self.find_similar(value)
+            if match:
+                self.stats["duplicates"] += 1
+                return match
+
+            self._add(file_name, value)
+            return None
+
+    def release(self, file_name):
+        """저장에 실패한 파일을 인덱스에서 제거"""
+        with self._lock:
+            if file_name in self.mtimes:
+                self._remove([self.files.index(file_name)])
+
+    def forget_owner(self, owner):
+        """
+        장소를 다시 받기 전에 그 장소의 이전 파일 항목 제거 (덮어쓸 파일과 비교해서 거부하지 않도록)
+        크롤링이 실패해서 파일이 그대로 남으면 다음 실행의 sync_directory()가 다시 등록함
+        """
+        with self._lock:
+            stale = [i for i, name in enumerate(self.files) if owner_of(name) == owner]
+            if stale:
+                self._remove(stale)
+
+    def save(self, directory=None):
+        """
+        인덱스를 원자적으로 저장
+
+        Args:
+            directory (str): 저장 디렉토리 (주면 파일 수정 시간을 갱신해서 다음 실행에서 다시 해시하지 않음)
+        """
+        with self._lock:
+            if directory is not None:
+                for name in self.files:
+                    path = Path(directory) / name
+                    if path.exists():
+                        self.mtimes[name] = path.stat().st_mtime
+            if not self.dirty and directory is None:
+                return
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            with open(tmp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    hashes=self.hashes.copy(),
+                    files=np.array(self.files, dtype=str),
+                    mtimes=np.array([self.mtimes[name] for name in self.files], dtype=np.float64)
+                )
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+    def print_summary(self):
+        print(
+            f"🔁 유사 이미지 검사: {self.stats['checked']}장 중 {self.stats['duplicates']}장 중복으로 건너뜀 "
+            f"(인덱스 {self._size}장, 기준 거리 {self.threshold})"
+        )
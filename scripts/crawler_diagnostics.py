@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🩺 SCENT DESTINATION 셀렉터 진단 리포트
+디버그 크롤러의 배치 진단(--batch)이 장소마다 남긴 결과(단계별 시간, 셀렉터 적중, 실패 시 DOM/스크린샷)를
+하나의 리포트로 모아서 가장 느린 단계와 가장 자주 깨지는 단계/셀렉터 순으로 정렬
+"""
+
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+from crawler_manifest import utc_now
+from crawler_metrics import percentile
+
+DIAGNOSTICS_DIR = 'scripts/diagnostics'
+REPORT_NAME = 'report.json'
+
+# 리포트에 보여줄 순위 개수
+TOP_STEPS = 5
+
+
+def artifact_stem(place_name, region=""):
+    """실패 산출물 파일 이름에 쓸 장소 이름 (공백/특수문자는 -로)"""
+    text = f"{place_name} {region}".strip()
+    return re.sub(r'[^\w]+', '-', text).strip('-') or 'place'
+
+
+class DiagnosticReport:
+    def __init__(self, output_dir=DIAGNOSTICS_DIR):
+        """
+        배치 진단 결과 모음
+
+        Args:
+            output_dir (str): 리포트와 실패 산출물(HTML/PNG)을 둘 디렉토리
+        """
+        self.output_dir = Path(output_dir)
+        self.places = []
+        self._lock = threading.Lock()
+
+    def add(self, diagnosis):
+        """
+        장소 하나의 진단 결과 추가
+
+        Args:
+            diagnosis (dict): {name, region, ok, failed_step, steps: [{name, ok, seconds}],
+                               waits: [{name, ok, seconds}], selectors: {그룹: {셀렉터: 적중 여부}}, artifacts}
+        """
+        with self._lock:
+            self.places.append(diagnosis)
+
+    def step_stats(self):
+        """
+        단계별 시간 분포와 실패율 (대기 조건은 wait.<이름>으로 함께 집계)
+
+        Returns:
+            dict: 단계 이름 -> {runs, failures, failure_rate, p50, p95, max}
+        """
+        samples = {}
+        for place in self.places:
+            entries = place["steps"] + [dict(t, name=f"wait.{t['name']}") for t in place.get("waits", [])]
+            for entry in entries:
+                samples.setdefault(entry["name"], []).append(entry)
+
+        stats = {}
+        for name, entries in samples.items():
+            seconds = sorted(e["seconds"] for e in entries if e.get("seconds") is not None)
+            failures = sum(1 for e in entries if not e["ok"])
+            stats[name] = {
+                "runs": len(entries),
+                "failures": failures,
+                "failure_rate": failures / len(entries),
+                "p50": percentile(seconds, 0.5),
+                "p95": percentile(seconds, 0.95),
+                "max": seconds[-1] if seconds else 0.0,
+            }
+        return stats
+
+    def selector_stats(self):
+        """
+        셀렉터별 적중률
+
+        Returns:
+            dict: 그룹 -> 셀렉터 -> {hits, misses, hit_rate}
+        """
+        stats = {}
+        for place in self.places:
+            for group, outcomes in place.get("selectors", {}).items():
+                for selector, hit in outcomes.items():
+                    entry = stats.setdefault(group, {}).setdefault(selector, {"hits": 0, "misses": 0})
+                    entry["hits" if hit else "misses"] += 1
+        for selectors in stats.values():
+            for entry in selectors.values():
+                entry["hit_rate"] = entry["hits"] / (entry["hits"] + entry["misses"])
+        return stats
+
+    def slowest(self, stats, limit=TOP_STEPS):
+        """p95 시간이 긴 순서"""
+        return sorted(stats, key=lambda name: stats[name]["p95"], reverse=True)[:limit]
+
+    def most_fragile(self, stats, limit=TOP_STEPS):
+        """실패율이 높은 순서 (실패가 없는 단계는 제외)"""
+        fragile = [name for name in stats if stats[name]["failures"]]
+        return sorted(fragile, key=lambda name: (stats[name]["failure_rate"], stats[name]["failures"]), reverse=True)[:limit]
+
+    def save(self):
+        """
+        리포트(JSON)를 원자적으로 저장
+
+        Returns:
+            Path: 리포트 경로
+        """
+        steps = self.step_stats()
+        report = {
+            "generated_at": utc_now(),
+            "places": self.places,
+            "steps": steps,
+            "selectors": self.selector_stats(),
+            "slowest": self.slowest(steps),
+            "most_fragile": self.most_fragile(steps),
+        }
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        path = self.output_dir / REPORT_NAME
+        tmp_path = path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        return path
+
+    def print_report(self):
+        if not self.places:
+            return
+
+        steps = self.step_stats()
+        ok = sum(1 for place in self.places if place["ok"])
+        print(f"\n🩺 배치 진단 결과: {ok}/{len(self.places)}개 장소 성공")
+
+        print("\n🐢 가장 느린 단계 (p95 기준)")
+        for name in self.slowest(steps):
+            entry = steps[name]
+            print(
+                f"   {name:<24} p50 {entry['p50'] * 1000:7.0f}ms  p95 {entry['p95'] * 1000:7.0f}ms  "
+                f"최대 {entry['max'] * 1000:7.0f}ms ({entry['runs']}회)"
+            )
+
+        fragile = self.most_fragile(steps)
+        print("\n💥 가장 자주 깨지는 단계")
+        if not fragile:
+            print("   (실패 없음)")
+        for name in fragile:
+            entry = steps[name]
+            print(f"   {name:<24} 실패율 {entry['failure_rate'] * 100:5.1f}% ({entry['failures']}/{entry['runs']})")
+
+        # 한 번도 맞지 않은 셀렉터 (페이지 구조가 바뀌었을 가능성)
+        for group, selectors in self.selector_stats().items():
+            dead = [selector for selector, entry in selectors.items() if not entry["hits"]]
+            if dead:
+                print(f"\n💀 {group} 셀렉터 중 한 번도 맞지 않음: {', '.join(dead)}")
+
+        failed = [place for place in self.places if not place["ok"]]
+        if failed:
+            print("\n❌ 실패한 장소")
+            for place in failed:
+                artifacts = f" -> {', '.join(place['artifacts'])}" if place.get("artifacts") else ""
+                print(f"   {place['name']} ({place['region']}): {place['failed_step']}{artifacts}")
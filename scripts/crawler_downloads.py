@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📥 SCENT DESTINATION 이미지 다운로더
+공유 requests.Session(keep-alive 커넥션 풀) 위에서 스레드 풀로 이미지를 백그라운드 다운로드
+브라우저가 다음 장소로 넘어가는 동안 이전 장소의 이미지를 받아옴
+
+응답은 청크 단위로 임시 파일에 받으면서 SHA-256을 계산하고, 검증(Content-Type, 매직 바이트,
+크기, 길이)을 통과한 경우에만 os.replace로 최종 파일과 교체 (중단되어도 잘린 .jpg가 남지 않음)
+이미 받은 파일은 ETag / Last-Modified로 조건부 요청을 보내서 바뀌지 않았으면(304) 헤더만 주고받음
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from crawler_ratelimit import RETRYABLE_STATUS, backoff_delay, retry_after_seconds
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+}
+
+CHECKSUMS_PATH = 'scripts/image_checksums.json'
+
+CHUNK_SIZE = 64 * 1024
+# 사진 한 장으로 보기에는 너무 큰 응답은 중간에 끊음
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+
+# 파일 앞부분으로 실제 이미지인지 확인 (HTML 오류 페이지 등이 .jpg로 저장되지 않도록)
+IMAGE_SIGNATURES = (
+    (b'\xff\xd8\xff', 'jpeg'),
+    (b'\x89PNG\r\n\x1a\n', 'png'),
+    (b'GIF87a', 'gif'),
+    (b'GIF89a', 'gif'),
+)
+
+
+def sniff_image_type(head):
+    """
+    파일 앞 12바이트로 이미지 형식 판별
+
+    Returns:
+        str: jpeg / png / gif / webp / avif, 이미지가 아니면 None
+    """
+    for signature, kind in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return kind
+    if head[:4] == b'RIFF' and head[8:12] == b'WEBP':
+        return 'webp'
+    if head[4:12] in (b'ftypavif', b'ftypavis'):
+        return 'avif'
+    return None
+
+
+class ChecksumStore:
+    def __init__(self, path=CHECKSUMS_PATH):
+        """
+        저장된 이미지별 SHA-256과 검증자(ETag, Last-Modified) 기록 로드
+
+        Args:
+            path (str): 기록 파일(JSON) 경로 (파일명 -> {sha256, bytes, mtime, url, etag, last_modified})
+        """
+        self.path = Path(path)
+        self.files = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self.files = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ 이미지 체크섬 기록을 읽을 수 없어 새로 시작: {e}")
+
+    def get(self, file_name):
+        return self.files.get(file_name)
+
+    def _on_disk(self, file_path, entry):
+        """디스크의 파일이 기록 이후 바뀌지 않았는지 (크기와 수정 시간만 확인, 파일은 읽지 않음)"""
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry["bytes"] and stat.st_mtime == entry["mtime"]
+
+    def is_unchanged(self, file_path, sha256):
+        """
+        디스크의 파일이 기록 이후 바뀌지 않았고 내용도 같은지 확인
+        (파일 크기와 수정 시간만 보고 기록된 해시를 믿으므로 기존 파일을 다시 읽지 않음)
+        """
+        entry = self.files.get(file_path.name)
+        return bool(entry) and entry["sha256"] == sha256 and self._on_disk(file_path, entry)
+
+    def current_sha256(self, file_path):
+        """기록 이후 바뀌지 않은 파일이면 기록된 SHA-256 (파일을 다시 읽지 않음), 아니면 None"""
+        entry = self.files.get(Path(file_path).name)
+        if entry and self._on_disk(Path(file_path), entry):
+            return entry["sha256"]
+        return None
+
+    def conditional_headers(self, file_path, url):
+        """
+        같은 URL로 받은 파일이 그대로 있으면 조건부 요청 헤더 생성
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since 헤더 (조건부 요청을 할 수 없으면 빈 dict)
+        """
+        entry = self.files.get(file_path.name)
+        if not entry or entry.get("url") != url or not self._on_disk(file_path, entry):
+            return {}
+
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def set(self, file_path, sha256, size, url, validators=None):
+        stat = file_path.stat()
+        with self._lock:
+            self.files[file_path.name] = {
+                "sha256": sha256,
+                "bytes": size,
+                "mtime": stat.st_mtime,
+                "url": url,
+                **(validators or {}),
+            }
+            self.dirty = True
+
+    def save(self):
+        """변경 사항이 있으면 원자적으로 저장"""
+        with self._lock:
+            if not self.dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.files, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+
+
+class ImageDownloader:
+    def __init__(self, max_workers=8, per_host=4, timeout=30, headers=None, dedup=None,
+                 checksums=None, max_bytes=DEFAULT_MAX_BYTES, limiter=None, breaker=None, retries=3,
+                 metrics=None):
+        """
+        이미지 다운로더 초기화
+
+        Args:
+            max_workers (int): 동시에 다운로드할 최대 파일 수
+            per_host (int): 호스트 하나에 동시에 보낼 최대 요청 수
+            timeout (int): 요청 타임아웃 (초)
+            headers (dict): 모든 요청에 붙일 헤더
+            dedup (PerceptualIndex): 이미 저장된 사진과 거의 같은 이미지를 거부할 유사 이미지 인덱스
+            checksums (ChecksumStore): 파일별 SHA-256 기록 (내용이 같으면 기존 파일을 건드리지 않음)
+            max_bytes (int): 이미지 한 장의 최대 크기 (넘으면 다운로드 중단)
+            limiter (RateLimiter): 호스트별 요청 속도 제한 (워커들과 공유)
+            breaker (CircuitBreaker): 오류율이 높아지면 모든 요청을 멈추는 회로 차단기
+            retries (int): 429/5xx/연결 오류 시 재시도 횟수 (지수 백오프 + jitter)
+            metrics (Metrics): 다운로드 시간/바이트/재시도를 기록할 계측 저장소
+        """
+        self.max_workers = max(1, int(max_workers))
+        self.per_host = max(1, int(per_host))
+        self.timeout = timeout
+        self.dedup = dedup
+        self.checksums = checksums
+        self.max_bytes = max_bytes
+        self.limiter = limiter
+        self.breaker = breaker
+        self.retries = max(0, int(retries))
+        self.metrics = metrics
+
+        # keep-alive 커넥션을 워커 수만큼 재사용
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="image-download")
+        self.stats = {
+            "ok": 0, "failed": 0, "duplicates": 0, "unchanged": 0, "not_modified": 0, "retries": 0, "bytes": 0
+        }
+
+        self._host_limits = {}
+        self._lock = threading.Lock()
+        self._pending = set()
+
+    def _host_semaphore(self, url):
+        """호스트별 동시 요청 제한용 세마포어"""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_limits[host]
+
+    def _record(self, ok, size=0):
+        self._count("ok" if ok else "failed")
+        self._count("bytes", size)
+
+    def _count(self, name, value=1):
+        """다운로드 통계와 계측 카운터를 함께 증가"""
+        with self._lock:
+            self.stats[name] += value
+        if self.metrics is not None and value:
+            self.metrics.count(f"download_{name}", value)
+
+    def fetch(self, img_url, file_path):
+        """
+        이미지 하나를 동기적으로 다운로드 (호스트별 동시성 제한 적용)
+
+        Args:
+            img_url (str): 이미지 URL
+            file_path (Path): 저장할 파일 경로
+
+        Returns:
+            dict: 성공 시 {file, url, sha256, bytes, unchanged}, 실패하거나 이미 저장된 사진과 거의 같으면 None
+        """
+        if self.metrics is None:
+            return self._fetch(img_url, file_path)
+
+        started = time.monotonic()
+        result = self._fetch(img_url, file_path)
+        self.metrics.observe(
+            "download", time.monotonic() - started, ok=result is not None,
+            file=Path(file_path).name, bytes=result["bytes"] if result else 0
+        )
+        return result
+
+    def _fetch(self, img_url, file_path):
+        file_path = Path(file_path)
+        tmp_path = file_path.with_name(f".{file_path.name}.part")
+        claimed = False
+        try:
+            conditional = self.checksums.conditional_headers(file_path, img_url) if self.checksums else {}
+            sha256, size, validators = self._with_retries(
+                img_url, lambda: self._stream_to(img_url, tmp_path, conditional)
+            )
+
+            if sha256 is None:
+                # 304: 서버의 이미지가 바뀌지 않았으므로 로컬 파일을 그대로 사용
+                return self._not_modified(img_url, file_path)
+
+            # 이미 저장된 사진과 거의 같으면 저장하지 않음 (확인과 등록을 원자적으로 처리)
+            if self.dedup is not None:
+                match = self.dedup.claim(tmp_path, file_path.name)
+                if match:
+                    self._count("duplicates")
+                    print(f"  🔁 중복 이미지 건너뜀 ({file_path.name} ≈ {match[0]}, 거리 {match[1]})")
+                    return None
+                claimed = True
+
+            # 이전 실행에서 받은 파일과 내용이 같으면 교체하지 않음 (수정 시간이 유지되어 후처리도 건너뜀)
+            unchanged = self.checksums is not None and self.checksums.is_unchanged(file_path, sha256)
+            if unchanged:
+                self._count("unchanged")
+                print(f"  ✔️ 변경 없음: {file_path.name}")
+            else:
+                os.replace(tmp_path, file_path)
+                print(f"  💾 저장 완료: {file_path.name}")
+            if self.checksums is not None:
+                self.checksums.set(file_path, sha256, size, img_url, validators)
+
+            self._record(True, size)
+            return {
+                "file": file_path.name,
+                "url": img_url,
+                "sha256": sha256,
+                "bytes": size,
+                "unchanged": unchanged,
+            }
+
+        except Exception as e:
+            if claimed:
+                self.dedup.release(file_path.name)
+            self._record(False)
+            print(f"  ❌ 다운로드 실패 ({file_path.name}): {e}")
+            return None
+
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    @staticmethod
+    def _retryable(error):
+        """
+        다시 시도할 만한 오류인지 판단
+
+        Returns:
+            tuple: (재시도 여부, Retry-After 초 또는 None)
+        """
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            return status in RETRYABLE_STATUS, retry_after_seconds(error.response.headers.get('Retry-After'))
+        transient = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError)
+        return isinstance(error, transient), None
+
+    def _with_retries(self, url, request):
+        """
+        속도 제한과 회로 차단기를 거쳐 요청하고, 일시적인 오류면 지수 백오프로 재시도
+
+        Args:
+            url (str): 요청 URL (호스트별 속도 제한 키)
+            request (callable): 실제 요청 함수
+
+        Returns:
+            request()의 반환값
+        """
+        attempt = 0
+        while True:
+            if self.breaker is not None:
+                self.breaker.wait()
+            if self.limiter is not None:
+                self.limiter.acquire(url)
+            try:
+                result = request()
+            except Exception as e:
+                retryable, retry_after = self._retryable(e)
+                if not retryable:
+                    raise
+                # 서버가 힘들어하는 신호: 이 호스트 속도를 줄이고 (Retry-After 동안은 멈춤) 오류율에 반영
+                if self.limiter is not None:
+                    self.limiter.failure(url, retry_after)
+                if self.breaker is not None:
+                    self.breaker.record(False)
+                if attempt >= self.retries:
+                    raise
+                delay = backoff_delay(attempt)
+                self._count("retries")
+                print(f"  🔄 재시도 {attempt + 1}/{self.retries} ({delay:.1f}s 후): {e}")
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            if self.limiter is not None:
+                self.limiter.success(url)
+            if self.breaker is not None:
+                self.breaker.record(True)
+            return result
+
+    def _not_modified(self, img_url, file_path):
+        """304 응답 처리: 기록된 해시로 결과를 만들고 유사 이미지 인덱스에도 다시 등록"""
+        entry = self.checksums.get(file_path.name)
+        if self.dedup is not None:
+            match = self.dedup.claim(file_path, file_path.name)
+            if match:
+                self._count("duplicates")
+                print(f"  🔁 중복 이미지 건너뜀 ({file_path.name} ≈ {match[0]}, 거리 {match[1]})")
+                return None
+
+        self._count("not_modified")
+        self._record(True)
+        print(f"  ✔️ 변경 없음 (304): {file_path.name}")
+        return {
+            "file": file_path.name,
+            "url": img_url,
+            "sha256": entry["sha256"],
+            "bytes": entry["bytes"],
+            "unchanged": True,
+        }
+
+    def _stream_to(self, img_url, tmp_path, conditional=None):
+        """
+        응답을 청크 단위로 임시 파일에 받으면서 검증하고 SHA-256 계산
+
+        Args:
+            img_url (str): 이미지 URL
+            tmp_path (Path): 임시 파일 경로
+            conditional (dict): 조건부 요청 헤더 (If-None-Match / If-Modified-Since)
+
+        Returns:
+            tuple: (sha256 hex, 받은 바이트 수, 검증자 dict) - 304면 sha256이 None
+
+        Raises:
+            ValueError: 이미지가 아니거나, 너무 크거나, 응답이 중간에 잘린 경우
+        """
+        digest = hashlib.sha256()
+        size = 0
+        head = b''
+
+        with self._host_semaphore(img_url):
+            with self.session.get(img_url, headers=conditional, timeout=self.timeout, stream=True) as response:
+                validators = {
+                    "etag": response.headers.get('ETag'),
+                    "last_modified": response.headers.get('Last-Modified'),
+                }
+                if response.status_code == 304:
+                    return None, 0, validators
+                response.raise_for_status()
+
+                content_type = response.headers.get('Content-Type', '')
+                if content_type and not content_type.startswith('image/'):
+                    raise ValueError(f"이미지가 아닌 응답 ({content_type})")
+
+                # 압축 전송이면 Content-Length가 본문 길이와 다르므로 길이 확인은 비압축 응답만
+                expected = None
+                if not response.headers.get('Content-Encoding'):
+                    expected = int(response.headers.get('Content-Length') or 0) or None
+                if expected and expected > self.max_bytes:
+                    raise ValueError(f"파일이 너무 큼 ({expected / 1024 / 1024:.1f}MB)")
+
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(CHUNK_SIZE):
+                        if len(head) < 12:
+                            head += chunk[:12 - len(head)]
+                            if len(head) >= 12 and not sniff_image_type(head):
+                                raise ValueError("이미지 형식이 아님 (매직 바이트 불일치)")
+                        size += len(chunk)
+                        if size > self.max_bytes:
+                            raise ValueError(f"파일이 너무 큼 ({self.max_bytes / 1024 / 1024:.0f}MB 초과)")
+                        digest.update(chunk)
+                        f.write(chunk)
+
+        if len(head) < 12 and not sniff_image_type(head):
+            raise ValueError("이미지 형식이 아님 (매직 바이트 불일치)")
+        if expected is not None and size != expected:
+            raise ValueError(f"응답이 잘림 ({size}/{expected} bytes)")
+        return digest.hexdigest(), size, validators
+
+    def fetch_bytes(self, url):
+        """
+        작은 응답(썸네일 등)을 메모리로 받음 (호스트별 동시성 제한 적용, 다운로드 통계에는 넣지 않음)
+
+        Returns:
+            bytes: 응답 본문, 실패 시 None
+        """
+        def request():
+            with self._host_semaphore(url):
+                response = self.session.get(url, timeout=self.timeout)
+                response.raise_for_status()
+                return response.content
+
+        try:
+            return self._with_retries(url, request)
+        except Exception:
+            return None
+
+    def fetch_slot(self, candidates, file_path):
+        """
+        파일 하나를 채울 때까지 후보 URL을 차례로 시도 (중복이거나 실패하면 다음 후보)
+
+        Args:
+            candidates (deque): 같은 장소의 슬롯들이 함께 꺼내 쓰는 후보 URL 큐
+            file_path (Path): 저장할 파일 경로
+
+        Returns:
+            dict: 저장에 성공한 fetch 결과, 후보가 다 떨어지면 None
+        """
+        while True:
+            try:
+                img_url = candidates.popleft()
+            except IndexError:
+                return None
+            result = self.fetch(img_url, file_path)
+            if result:
+                return result
+
+    def submit(self, img_url, file_path):
+        """다운로드를 백그라운드로 예약하고 Future 반환"""
+        future = self.executor.submit(self.fetch, img_url, file_path)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def submit_slot(self, candidates, file_path):
+        """예비 후보를 쓰는 슬롯 다운로드를 백그라운드로 예약하고 Future 반환"""
+        future = self.executor.submit(self.fetch_slot, candidates, file_path)
+        with self._lock:
+            self._pending.add(future)
+        future.add_done_callback(self._forget)
+        return future
+
+    def _forget(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def submit_place(self, place_name, downloads, on_complete=None, spare_urls=()):
+        """
+        한 장소의 이미지들을 백그라운드로 예약
+
+        Args:
+            place_name (str): 장소명 (로그용)
+            downloads (list): (img_url, file_path) 튜플 리스트
+            on_complete (callable): 모든 이미지가 끝나면 (place_name, fetch 결과 리스트)로 호출
+            spare_urls (iterable): 중복/실패한 슬롯을 대신 채울 예비 후보 URL
+
+        Returns:
+            list: Future 리스트
+        """
+        if spare_urls or self.dedup is not None:
+            # 슬롯마다 후보 큐에서 하나씩 꺼내고, 중복이면 다음 후보로 같은 파일명을 다시 채움
+            candidates = deque([url for url, _ in downloads] + list(spare_urls))
+            futures = [self.submit_slot(candidates, path) for _, path in downloads]
+        else:
+            futures = [self.submit(url, path) for url, path in downloads]
+        if not futures:
+            return futures
+
+        remaining = [len(futures)]
+        lock = threading.Lock()
+
+        def done(_):
+            with lock:
+                remaining[0] -= 1
+                finished = remaining[0] == 0
+            if finished:
+                success = sum(1 for f in futures if f.result())
+                print(f"✨ '{place_name}' 완료: {success}/{len(futures)} 이미지 저장")
+                if on_complete:
+                    try:
+                        on_complete(place_name, [f.result() for f in futures])
+                    except Exception as e:
+                        print(f"⚠️ '{place_name}' 완료 처리 중 오류: {e}")
+
+        for future in futures:
+            future.add_done_callback(done)
+        return futures
+
+    def drain(self):
+        """예약된 다운로드가 모두 끝날 때까지 대기"""
+        with self._lock:
+            pending = list(self._pending)
+        if pending:
+            print(f"⏳ 남은 다운로드 {len(pending)}개 마무리 중...")
+            wait(pending)
+
+    def close(self):
+        """남은 다운로드를 마무리하고 스레드 풀과 세션 종료"""
+        self.drain()
+        self.executor.shutdown(wait=True)
+        self.session.close()
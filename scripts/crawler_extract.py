@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧲 SCENT DESTINATION 페이지 일괄 추출
+후보 셀렉터들을 브라우저 안에서 한 번에 평가하는 JavaScript를 페이지당 한 번만 실행
+셀렉터마다 find_elements / .text / get_attribute를 따로 호출하던 WebDriver 왕복을 하나로 줄임
+"""
+
+EXTRACT_SCRIPT = """
+const resultSelectors = arguments[0] || [];
+const imageSelectors = arguments[1] || [];
+const maxPerSelector = arguments[2];
+
+function query(selector) {
+    try {
+        return { elements: Array.from(document.querySelectorAll(selector)), error: null };
+    } catch (e) {
+        return { elements: [], error: String(e) };
+    }
+}
+
+const results = resultSelectors.map(selector => {
+    const { elements, error } = query(selector);
+    const first = elements[0];
+    return {
+        selector: selector,
+        count: elements.length,
+        error: error,
+        element: first || null,
+        text: first ? (first.innerText || '').slice(0, 100) : null,
+        className: first ? String(first.className || '') : null,
+    };
+});
+
+const seen = new Set();
+const images = [];
+const imageCounts = {};
+for (const selector of imageSelectors) {
+    const { elements, error } = query(selector);
+    imageCounts[selector] = error ? -1 : elements.length;
+
+    let taken = 0;
+    for (const img of elements) {
+        if (maxPerSelector && taken >= maxPerSelector) break;
+        const src = img.currentSrc || img.src || img.getAttribute('src');
+        if (!src || src.startsWith('data:image') || seen.has(src)) continue;
+        seen.add(src);
+        taken += 1;
+        images.push({
+            src: src,
+            selector: selector,
+            width: img.naturalWidth || 0,
+            height: img.naturalHeight || 0,
+            decoded: Boolean(img.complete && img.naturalWidth > 0),
+        });
+    }
+}
+
+const matched = results.find(r => r.count > 0);
+return {
+    matched_selector: matched ? matched.selector : null,
+    results: results,
+    image_counts: imageCounts,
+    images: images,
+};
+"""
+
+
+def extract_page(driver, result_selectors=(), image_selectors=(), max_per_selector=None):
+    """
+    후보 셀렉터들을 한 번의 execute_script로 평가
+
+    Args:
+        driver (WebDriver): Selenium 드라이버
+        result_selectors (iterable): 검색 결과 후보 셀렉터 (순서대로 우선순위)
+        image_selectors (iterable): 이미지 후보 셀렉터
+        max_per_selector (int): 이미지 셀렉터 하나에서 가져올 최대 개수 (None이면 전부)
+
+    Returns:
+        dict: {
+            matched_selector: 요소가 있는 첫 번째 결과 셀렉터 (없으면 None),
+            results: [{selector, count, error, element, text, className}, ...],
+            image_counts: {셀렉터: 요소 수 (-1이면 잘못된 셀렉터)},
+            images: [{src, selector, width, height, decoded}, ...]  (src 기준 중복 제거)
+        }
+    """
+    return driver.execute_script(
+        EXTRACT_SCRIPT,
+        list(result_selectors),
+        list(image_selectors),
+        max_per_selector,
+    )
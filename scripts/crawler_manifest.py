@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📒 SCENT DESTINATION 크롤링 진행 기록 (manifest)
+장소별 상태, 이미지 URL, 파일 해시, 시각을 JSONL로 누적 기록해서 중단된 크롤링을 이어서 실행
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+STATUS_COMPLETE = "complete"
+STATUS_PARTIAL = "partial"
+STATUS_FAILED = "failed"
+
+
+def utc_now():
+    """기록용 UTC 타임스탬프"""
+    return datetime.now(timezone.utc).isoformat(timespec='seconds')
+
+
+class CrawlManifest:
+    def __init__(self, path='scripts/crawl_manifest.jsonl'):
+        """
+        크롤링 진행 기록 로드
+
+        기록은 한 줄에 장소 하나씩 추가만 하는 JSONL이라 실행 도중 중단되어도 앞선 줄은 안전하고,
+        같은 장소의 기록이 여러 줄이면 마지막 줄이 최신 상태
+
+        Args:
+            path (str): manifest 파일 경로
+        """
+        self.path = Path(path)
+        self.entries = {}
+        self._lock = threading.Lock()
+        self._needs_newline = False
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+
+        lines = 0
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # 중단 시점에 잘린 마지막 줄은 무시
+                    continue
+                lines += 1
+                self.entries[entry["key"]] = entry
+
+        # 잘린 줄 뒤에 새 기록이 붙지 않도록 줄바꿈 여부 확인
+        with open(self.path, 'rb') as f:
+            f.seek(0, os.SEEK_END)
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                self._needs_newline = f.read(1) != b'\n'
+
+        # 오래된 기록이 너무 많이 쌓이면 최신 상태만 남기고 다시 씀
+        if lines > 2 * len(self.entries) + 100:
+            self.compact()
+
+        print(f"📒 진행 기록 로드: {len(self.entries)}개 장소 ({self.path})")
+
+    def get(self, key):
+        """장소 기록 조회 (없으면 None)"""
+        return self.entries.get(key)
+
+    def is_complete(self, key):
+        """이미 모든 이미지를 받은 장소인지 확인 (O(1))"""
+        entry = self.entries.get(key)
+        return entry is not None and entry.get("status") == STATUS_COMPLETE
+
+    def record(self, key, status, **fields):
+        """
+        장소 상태를 기록하고 파일 끝에 한 줄 추가
+
+        Args:
+            key (str): 장소 키 (english_name)
+            status (str): complete / partial / failed
+            **fields: name, region, urls, files 등 추가 정보
+        """
+        entry = {"key": key, "status": status, **fields, "updated_at": utc_now()}
+        line = json.dumps(entry, ensure_ascii=False)
+
+        with self._lock:
+            self.entries[key] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                if self._needs_newline:
+                    f.write('\n')
+                    self._needs_newline = False
+                f.write(line + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+        return entry
+
+    def compact(self):
+        """최신 기록만 남기도록 파일을 원자적으로 다시 씀"""
+        with self._lock:
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for entry in self.entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            os.replace(tmp_path, self.path)
+            self._needs_newline = False
+
+
+def select_pending(spaces_data, manifest, resume=False, refresh_names=(), refresh_regions=(), refresh_only=True):
+    """
+    이번 실행에서 크롤링할 장소 선택
+    resume 없이 refresh 대상만 지정하면 그 장소들만 다시 크롤링 (refresh_only=False면 전체 목록에 더해짐)
+
+    Args:
+        spaces_data (list): 전체 공간 데이터
+        manifest (CrawlManifest): 진행 기록
+        resume (bool): 완료된 장소를 건너뛸지 여부
+        refresh_names (iterable): 완료 여부와 상관없이 다시 받을 장소 (name 또는 english_name)
+        refresh_regions (iterable): 완료 여부와 상관없이 다시 받을 지역
+        refresh_only (bool): resume 없이 refresh 대상이 있으면 그 장소들만 남길지 여부
+                             (이미 대상을 골라둔 --incremental 목록에는 False)
+
+    Returns:
+        tuple: (크롤링할 장소 리스트, 건너뛴 장소 수)
+    """
+    refresh_names = set(refresh_names or ())
+    refresh_regions = set(refresh_regions or ())
+    only_forced = refresh_only and not resume and bool(refresh_names or refresh_regions)
+
+    pending, skipped = [], 0
+    for space in spaces_data:
+        forced = (
+            space["name"] in refresh_names
+            or space["english_name"] in refresh_names
+            or space["region"] in refresh_regions
+        )
+        if not forced and (only_forced or (resume and manifest.is_complete(space["english_name"]))):
+            skipped += 1
+            continue
+        pending.append(space)
+    return pending, skipped
+
+
+def _file_problem(path, expected):
+    """
+    manifest에 기록된 파일 하나를 로컬에서만 검사
+
+    Returns:
+        str: 문제 설명 (이상이 없으면 None)
+    """
+    from crawler_downloads import sniff_image_type
+
+    if not path.exists():
+        return "파일 없음"
+    size = path.stat().st_size
+    if expected.get("bytes") is not None and size != expected["bytes"]:
+        return f"크기 불일치 ({size}/{expected['bytes']} bytes)"
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        head = f.read(12)
+        digest.update(head)
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    if not sniff_image_type(head):
+        return "이미지 형식이 아님"
+    if expected.get("sha256") and digest.hexdigest() != expected["sha256"]:
+        return "SHA-256 불일치"
+    return None
+
+
+def verify_manifest(manifest, download_dir='public/images/places', mark_broken=True):
+    """
+    네트워크 없이 로컬 파일을 manifest 기록(크기, SHA-256, 매직 바이트)과 대조
+    문제가 있는 완료 장소는 partial로 바꿔서 다음 --resume 실행에서 다시 받도록 함
+
+    Args:
+        manifest (CrawlManifest): 진행 기록
+        download_dir (str): 이미지 저장 디렉토리
+        mark_broken (bool): 문제가 있는 장소의 상태를 partial로 기록할지 여부
+
+    Returns:
+        dict: {checked: 검사한 파일 수, broken: {장소 키: [(파일명, 문제), ...]}}
+    """
+    download_dir = Path(download_dir)
+    checked = 0
+    broken = {}
+
+    for key, entry in list(manifest.entries.items()):
+        problems = []
+        for expected in entry.get("files") or []:
+            checked += 1
+            problem = _file_problem(download_dir / expected["file"], expected)
+            if problem:
+                problems.append((expected["file"], problem))
+        if not problems:
+            continue
+
+        broken[key] = problems
+        if mark_broken and entry.get("status") == STATUS_COMPLETE:
+            fields = {k: v for k, v in entry.items() if k not in ("key", "status", "updated_at")}
+            fields["verify_errors"] = [f"{name}: {problem}" for name, problem in problems]
+            manifest.record(key, STATUS_PARTIAL, **fields)
+
+    print(f"\n🔍 로컬 검증: {checked}개 파일, 문제 있는 장소 {len(broken)}개")
+    for key, problems in broken.items():
+        for name, problem in problems:
+            print(f"   ❌ {key}: {name} - {problem}")
+    if broken and mark_broken:
+        print("💡 문제 있는 장소는 partial로 기록됨 → --resume으로 다시 받을 수 있습니다")
+    return {"checked": checked, "broken": broken}
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧠 SCENT DESTINATION 브라우저 메모리 관리
+Google Maps는 무거운 단일 페이지 앱이라 세션 하나로 전체 목록을 돌면 chromedriver + Chrome 메모리가 계속 늘어남
+워커마다 chromedriver 프로세스 트리(Chrome, 렌더러, GPU 프로세스)의 RSS를 재고,
+일정 장소 수를 처리했거나 메모리 상한을 넘으면 장소 사이에서 드라이버를 새로 띄움
+(다운로드/순위/후처리는 공유 풀에서 계속 진행되므로 재시작해도 끊기지 않음)
+
+선택 패키지: pip install psutil (없으면 장소 수 기준 재시작만 동작)
+"""
+
+import threading
+
+DEFAULT_RECYCLE_AFTER = 100
+DEFAULT_MAX_BROWSER_MB = 1536
+
+
+def browser_rss(driver):
+    """
+    드라이버의 chromedriver 프로세스와 모든 하위 프로세스 RSS 합계
+
+    Returns:
+        int: 바이트 (psutil이 없거나 프로세스를 찾을 수 없으면 None)
+    """
+    try:
+        import psutil
+    except ImportError:
+        return None
+
+    process = getattr(getattr(getattr(driver, 'service', None), 'process', None), 'pid', None)
+    if process is None:
+        return None
+
+    try:
+        root = psutil.Process(process)
+        processes = [root] + root.children(recursive=True)
+    except psutil.Error:
+        return None
+
+    rss = 0
+    for child in processes:
+        try:
+            rss += child.memory_info().rss
+        except psutil.Error:
+            # 측정 도중 종료된 렌더러 프로세스
+            continue
+    return rss
+
+
+class RecyclePolicy:
+    def __init__(self, max_places=DEFAULT_RECYCLE_AFTER, max_rss_mb=DEFAULT_MAX_BROWSER_MB, metrics=None):
+        """
+        드라이버 재시작 기준
+
+        Args:
+            max_places (int): 세션 하나가 처리할 최대 장소 수 (None이나 0이면 제한 없음)
+            max_rss_mb (float): 브라우저 프로세스 트리 RSS 상한 (MB, None이나 0이면 확인 안 함)
+            metrics (Metrics): 재시작 횟수를 기록할 계측 저장소
+        """
+        self.max_places = max_places or None
+        self.max_rss = max_rss_mb * 1024 * 1024 if max_rss_mb else None
+        self.metrics = metrics
+        self.peak_rss = 0
+        self.recycled = {"places": 0, "memory": 0}
+        self._lock = threading.Lock()
+
+        if self.max_rss:
+            try:
+                import psutil  # noqa: F401
+            except ImportError:
+                print("⚠️ psutil이 없어 브라우저 메모리 상한을 확인할 수 없음 (pip install psutil)")
+                self.max_rss = None
+
+    def check(self, crawler):
+        """
+        장소 하나를 마친 세션을 재시작해야 하는지 확인 (CrawlerPool의 should_recycle)
+
+        Args:
+            crawler: places_done과 driver를 가진 크롤러 세션
+
+        Returns:
+            str: 재시작 이유 (재시작하지 않으면 None)
+        """
+        reason = None
+        if self.max_places and crawler.places_done >= self.max_places:
+            reason, kind = f"장소 {crawler.places_done}개 처리", "places"
+        elif self.max_rss:
+            rss = browser_rss(crawler.driver)
+            if rss is not None:
+                with self._lock:
+                    self.peak_rss = max(self.peak_rss, rss)
+                if rss >= self.max_rss:
+                    reason, kind = f"브라우저 메모리 {rss / 1024 / 1024:.0f}MB", "memory"
+
+        if reason:
+            with self._lock:
+                self.recycled[kind] += 1
+            if self.metrics is not None:
+                self.metrics.count("driver_recycled", reason=kind)
+        return reason
+
+    def print_summary(self):
+        total = sum(self.recycled.values())
+        if not total and not self.peak_rss:
+            return
+        peak = f"최대 {self.peak_rss / 1024 / 1024:.0f}MB" if self.peak_rss else "측정 안 함"
+        print(
+            f"🧠 브라우저 메모리: {peak}, 드라이버 재시작 {total}회 "
+            f"(장소 수 {self.recycled['places']}회, 메모리 상한 {self.recycled['memory']}회)"
+        )
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⏱️ SCENT DESTINATION 크롤러 계측
+단계별 monotonic 타이머, 카운터, 분위수(p50/p95/p99) 히스토그램을 스레드 안전하게 모으고
+JSON-lines 트레이스, 실행 요약 리포트(JSON), Prometheus 텍스트 파일로 내보냄
+장소 하나의 시간이 어디에 쓰이는지 보고, 실행 간 회귀를 비교하기 위한 용도
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+TRACE_PATH = 'scripts/crawl_trace.jsonl'
+REPORT_PATH = 'scripts/crawl_report.json'
+
+PROMETHEUS_PREFIX = 'scent_crawler'
+
+# 이전 실행 대비 이만큼 이상 느려지거나 빨라진 단계만 표시
+REGRESSION_RATIO = 0.2
+
+
+def percentile(sorted_values, q):
+    """정렬된 값들의 q 분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def _metric_name(name):
+    """Prometheus 메트릭 이름에 쓸 수 없는 문자를 _로 바꿈"""
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+
+def _label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Metrics:
+    def __init__(self, trace_path=None):
+        """
+        계측 저장소 초기화
+
+        Args:
+            trace_path (str): 이벤트를 한 줄씩 기록할 JSON-lines 파일 경로 (None이면 메모리에만 집계)
+        """
+        self.started = time.monotonic()
+        self.started_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        self.counters = {}
+        self.samples = {}
+        self.failures = {}
+        self._lock = threading.Lock()
+        self._trace = None
+
+        if trace_path:
+            Path(trace_path).parent.mkdir(parents=True, exist_ok=True)
+            self._trace = open(trace_path, 'w', encoding='utf-8', buffering=1)
+
+    def _emit(self, event):
+        if self._trace is None:
+            return
+        event["t"] = round(time.monotonic() - self.started, 4)
+        line = json.dumps(event, ensure_ascii=False, default=str)
+        with self._lock:
+            if self._trace is not None:
+                self._trace.write(line + '\n')
+
+    def count(self, name, value=1, **fields):
+        """카운터 증가 (bytes, retries 등)"""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+        if fields:
+            self._emit({"event": name, "value": value, **fields})
+
+    def observe(self, name, seconds, ok=True, **fields):
+        """
+        단계 하나의 소요 시간 기록
+
+        Args:
+            name (str): 단계 이름 (예: download, wait.photos)
+            seconds (float): 소요 시간
+            ok (bool): 성공 여부 (실패 횟수도 따로 집계)
+            **fields: 트레이스에만 남길 추가 정보 (장소명, 파일명 등)
+        """
+        with self._lock:
+            self.samples.setdefault(name, []).append(seconds)
+            if not ok:
+                self.failures[name] = self.failures.get(name, 0) + 1
+        self._emit({"event": name, "seconds": round(seconds, 4), "ok": ok, **fields})
+
+    @contextmanager
+    def timer(self, name, **fields):
+        """with 블록의 소요 시간을 기록 (예외가 나면 실패로 기록하고 다시 던짐)"""
+        started = time.monotonic()
+        ok = True
+        try:
+            yield
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            self.observe(name, time.monotonic() - started, ok=ok, **fields)
+
+    def summary(self):
+        """
+        집계 결과
+
+        Returns:
+            dict: {started_at, elapsed, counters, timings: {단계: {count, failures, total, p50, p95, p99, max}}}
+        """
+        with self._lock:
+            samples = {name: sorted(values) for name, values in self.samples.items()}
+            counters = dict(self.counters)
+            failures = dict(self.failures)
+
+        timings = {}
+        for name, values in samples.items():
+            timings[name] = {
+                "count": len(values),
+                "failures": failures.get(name, 0),
+                "total": round(sum(values), 4),
+                "p50": round(percentile(values, 0.50), 4),
+                "p95": round(percentile(values, 0.95), 4),
+                "p99": round(percentile(values, 0.99), 4),
+                "max": round(values[-1], 4),
+            }
+        return {
+            "started_at": self.started_at,
+            "elapsed": round(time.monotonic() - self.started, 3),
+            "counters": counters,
+            "timings": timings,
+        }
+
+    def print_summary(self, previous=None):
+        """
+        단계별 분위수 표 출력
+
+        Args:
+            previous (dict): 이전 실행의 요약 리포트 (있으면 p50 변화를 함께 표시)
+        """
+        summary = self.summary()
+        if not summary["timings"]:
+            return
+
+        print("\n⏱️ 단계별 소요 시간 (초)")
+        print(f"   {'단계':<28} {'횟수':>6} {'p50':>7} {'p95':>7} {'p99':>7} {'최대':>7} {'합계':>8}")
+        ordered = sorted(summary["timings"].items(), key=lambda item: item[1]["total"], reverse=True)
+        for name, entry in ordered:
+            change = ""
+            before = (previous or {}).get("timings", {}).get(name)
+            if before and before["p50"] > 0:
+                ratio = entry["p50"] / before["p50"] - 1
+                if abs(ratio) >= REGRESSION_RATIO:
+                    change = f"  {'🔺' if ratio > 0 else '🔻'} p50 {ratio * 100:+.0f}%"
+            failed = f" (실패 {entry['failures']})" if entry["failures"] else ""
+            print(
+                f"   {name:<28} {entry['count']:>6} {entry['p50']:>7.2f} {entry['p95']:>7.2f} "
+                f"{entry['p99']:>7.2f} {entry['max']:>7.2f} {entry['total']:>8.1f}{failed}{change}"
+            )
+
+        if summary["counters"]:
+            print("   " + ", ".join(f"{name} {value:,}" for name, value in sorted(summary["counters"].items())))
+
+    def save_report(self, path=REPORT_PATH):
+        """요약 리포트를 JSON으로 원자적으로 저장"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def write_prometheus(self, path):
+        """
+        Prometheus 텍스트 형식으로 저장 (node_exporter textfile collector 등에서 수집)
+
+        단계별 시간은 summary 타입 하나에 stage 라벨로, 카운터는 각각 _total 메트릭으로 기록
+        """
+        summary = self.summary()
+        lines = []
+
+        metric = f"{PROMETHEUS_PREFIX}_stage_seconds"
+        lines.append(f"# HELP {metric} Time spent per crawler stage.")
+        lines.append(f"# TYPE {metric} summary")
+        for name, entry in summary["timings"].items():
+            stage = _label_value(name)
+            for q in ("0.5", "0.95", "0.99"):
+                key = {"0.5": "p50", "0.95": "p95", "0.99": "p99"}[q]
+                lines.append(f'{metric}{{stage="{stage}",quantile="{q}"}} {entry[key]}')
+            lines.append(f'{metric}_sum{{stage="{stage}"}} {entry["total"]}')
+            lines.append(f'{metric}_count{{stage="{stage}"}} {entry["count"]}')
+
+        metric = f"{PROMETHEUS_PREFIX}_stage_failures_total"
+        lines.append(f"# TYPE {metric} counter")
+        for name, entry in summary["timings"].items():
+            lines.append(f'{metric}{{stage="{_label_value(name)}"}} {entry["failures"]}')
+
+        for name, value in sorted(summary["counters"].items()):
+            metric = f"{PROMETHEUS_PREFIX}_{_metric_name(name)}_total"
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        metric = f"{PROMETHEUS_PREFIX}_run_seconds"
+        lines.append(f"# TYPE {metric} gauge")
+        lines.append(f"{metric} {summary['elapsed']}")
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        os.replace(tmp_path, path)
+
+    def close(self):
+        with self._lock:
+            if self._trace is not None:
+                self._trace.close()
+                self._trace = None
+
+
+def load_report(path=REPORT_PATH):
+    """이전 실행의 요약 리포트 (없거나 읽을 수 없으면 None)"""
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
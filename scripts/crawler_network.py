@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🛰️ SCENT DESTINATION 네트워크 기반 사진 URL 수집
+Chrome DevTools Protocol 이벤트(performance 로그)에서 googleusercontent 사진 응답을 직접 수집
+DOM을 폴링하지 않으므로 화면에 그려지지 않은 사진도 찾고, 필요한 개수가 모이면 바로 반환
+"""
+
+import json
+import time
+from urllib.parse import urlparse
+
+PHOTO_HOST = 'googleusercontent.com'
+DEFAULT_PHOTO_SIZE = 'w1200-h800'
+
+# 프로필 사진/아이콘 경로 (장소 사진이 아님)
+AVATAR_PATH_PREFIXES = ('/a/', '/a-/')
+
+# lean 프로필에서 차단할 요청 (장소 패널과 사진 URL 수집에 필요 없는 것들)
+LEAN_BLOCKED_URLS = [
+    # 지도 타일 / 벡터 데이터 / 위성·스트리트뷰 이미지
+    '*google.com/maps/vt*',
+    '*googleapis.com/maps/vt*',
+    '*khms*.google.com/*',
+    '*streetviewpixels-pa.googleapis.com/*',
+    '*geo*.ggpht.com/*',
+    # 웹폰트
+    '*fonts.gstatic.com/*',
+    '*fonts.googleapis.com/*',
+    '*.woff',
+    '*.woff2',
+    '*.ttf',
+    # 동영상 / 오디오
+    '*.mp4',
+    '*.webm',
+    '*.m4a',
+    # 분석 / 트래킹
+    '*google-analytics.com/*',
+    '*googletagmanager.com/*',
+    '*doubleclick.net/*',
+    '*/gen_204*',
+    '*play.google.com/log*',
+    '*/maps/preview/log*',
+]
+
+# skip_images=True일 때 추가로 차단 (요청 URL은 이벤트로 남지만 바이트는 받지 않음)
+PHOTO_BLOCKED_URLS = ['*googleusercontent.com/*']
+
+LEAN_PREFS = {
+    'profile.default_content_setting_values.notifications': 2,
+    'profile.default_content_setting_values.geolocation': 2,
+    'profile.managed_default_content_settings.media_stream': 2,
+}
+
+
+def enable_performance_log(options):
+    """ChromeOptions에 Network 이벤트가 담기는 performance 로그를 켬"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+
+def apply_lean_options(options):
+    """lean 프로필용 Chrome 옵션 (브라우저 시작 전에 적용)"""
+    options.add_experimental_option('prefs', LEAN_PREFS)
+    options.add_argument('--mute-audio')
+    options.add_argument('--autoplay-policy=user-gesture-required')
+    options.add_argument('--disable-background-networking')
+    return options
+
+
+def apply_lean_blocking(driver, skip_images=False):
+    """
+    CDP Network.setBlockedURLs로 불필요한 요청 차단 (브라우저 시작 후 적용)
+
+    Args:
+        driver (WebDriver): Chrome 드라이버
+        skip_images (bool): 사진 바이트도 브라우저에서 받지 않을지 여부
+            (어차피 download_image()에서 다시 받으므로 브라우저에서는 URL만 있으면 됨)
+    """
+    patterns = LEAN_BLOCKED_URLS + (PHOTO_BLOCKED_URLS if skip_images else [])
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': patterns})
+    return patterns
+
+
+def normalize_photo_url(url, size=DEFAULT_PHOTO_SIZE):
+    """
+    googleusercontent 사진 URL을 요청한 해상도로 정규화
+
+    '=w408-h306-k-no' 같은 크기 접미사를 떼고 '=<size>'를 붙임
+    같은 사진의 다른 크기 변형들이 같은 URL로 합쳐지므로 중복 제거 키로도 사용
+
+    Args:
+        url (str): 원본 사진 URL
+        size (str): 요청할 크기 (예: 'w1200-h800')
+
+    Returns:
+        str: 정규화된 URL
+    """
+    parsed = urlparse(url)
+    base = parsed.path.split('=', 1)[0]
+    return f"{parsed.scheme}://{parsed.netloc}{base}={size}"
+
+
+def is_place_photo_url(url):
+    """장소 사진으로 볼 수 있는 googleusercontent URL인지 확인"""
+    parsed = urlparse(url)
+    if PHOTO_HOST not in parsed.netloc:
+        return False
+    return not parsed.path.startswith(AVATAR_PATH_PREFIXES)
+
+
+class NetworkPhotoCollector:
+    def __init__(self, driver, size=DEFAULT_PHOTO_SIZE):
+        """
+        네트워크 사진 수집기 초기화
+
+        Args:
+            driver (WebDriver): performance 로그가 켜진 Chrome 드라이버
+            size (str): 정규화할 사진 크기
+        """
+        self.driver = driver
+        self.size = size
+        self.urls = []
+        self.bytes_received = 0
+        self._seen = set()
+
+    def reset(self):
+        """이전 장소의 로그를 비우고 수집 상태 초기화"""
+        self.driver.get_log('performance')
+        self.urls = []
+        self.bytes_received = 0
+        self._seen = set()
+
+    def poll(self):
+        """
+        쌓인 performance 로그에서 새 사진 응답을 수집하고 전송량을 집계
+
+        사진 요청이 차단된 경우(skip_images)에도 요청 단계 이벤트에서 URL을 수집함
+
+        Returns:
+            list: 지금까지 수집한 (정규화된) 사진 URL
+        """
+        for entry in self.driver.get_log('performance'):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+
+            if method == 'Network.loadingFinished':
+                self.bytes_received += int(params.get('encodedDataLength', 0))
+                continue
+            if method == 'Network.responseReceived':
+                response = params.get('response', {})
+                url = response.get('url', '')
+                is_image = response.get('mimeType', '').startswith('image/')
+            elif method == 'Network.requestWillBeSent':
+                url = params.get('request', {}).get('url', '')
+                is_image = params.get('type') == 'Image'
+            else:
+                continue
+
+            if not is_image or not is_place_photo_url(url):
+                continue
+
+            normalized = normalize_photo_url(url, self.size)
+            if normalized not in self._seen:
+                self._seen.add(normalized)
+                self.urls.append(normalized)
+        return self.urls
+
+
+class network_photos_collected:
+    """
+    WebDriverWait 조건: 사진 응답이 max_images개 모이면 반환
+
+    그보다 적더라도 개수가 settle초 동안 변하지 않으면 사진이 더 없는 것으로 보고 반환
+    """
+
+    def __init__(self, collector, max_images=3, settle=0.8):
+        self.collector = collector
+        self.max_images = max(1, max_images)
+        self.settle = settle
+        self._last_count = None
+        self._stable_since = None
+
+    def __call__(self, driver):
+        urls = self.collector.poll()
+        count = len(urls)
+        if count >= self.max_images:
+            return urls[:self.max_images]
+
+        now = time.monotonic()
+        if count != self._last_count:
+            self._last_count = count
+            self._stable_since = now
+            return False
+
+        if count > 0 and now - self._stable_since >= self.settle:
+            return list(urls)
+        return False
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🎨 SCENT DESTINATION 이미지 플레이스홀더
+이미지마다 로딩 전에 바로 그릴 수 있는 작은 플레이스홀더를 미리 계산
+- BlurHash 문자열 (4x3 성분, 약 30자)
+- base64 인라인 마이크로 썸네일 (16px WebP data URI - next/image의 blurDataURL로 바로 사용)
+- 대표 색상 (#rrggbb)
+32x32로 줄인 픽셀을 여러 장씩 하나의 numpy 배열로 쌓아서 한 번의 einsum으로 BlurHash 성분을 계산하고,
+묶음(batch)을 ProcessPoolExecutor로 나눠서 모든 코어 사용
+
+필요 패키지: pip install numpy pillow
+"""
+
+import base64
+import io
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# BlurHash 계산용으로 줄이는 크기 (성분 4x3에는 이 정도면 충분)
+SAMPLE_SIZE = 32
+
+# BlurHash 성분 수 (가로, 세로)
+COMPONENTS = (4, 3)
+
+# 인라인 썸네일 너비와 품질
+LQIP_WIDTH = 16
+LQIP_QUALITY = 40
+
+# 프로세스 하나가 한 번에 처리할 이미지 수
+BATCH_SIZE = 16
+
+BASE83 = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz#$%*+,-.:;=?@[]^_{|}~'
+
+
+def encode_base83(value, length):
+    chars = []
+    for i in range(1, length + 1):
+        digit = (int(value) // 83 ** (length - i)) % 83
+        chars.append(BASE83[digit])
+    return ''.join(chars)
+
+
+def srgb_to_linear(pixels):
+    """0~255 sRGB 배열을 0~1 선형 RGB로 변환"""
+    v = pixels / 255.0
+    return np.where(v <= 0.04045, v / 12.92, ((v + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(value):
+    v = min(max(value, 0.0), 1.0)
+    if v <= 0.0031308:
+        return int(v * 12.92 * 255 + 0.5)
+    return int((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+
+def blurhash_factors(pixels, components=COMPONENTS):
+    """
+    여러 이미지의 BlurHash 성분을 한 번에 계산
+
+    Args:
+        pixels (np.ndarray): (N, H, W, 3) uint8 sRGB 픽셀
+        components (tuple): 성분 수 (가로, 세로)
+
+    Returns:
+        np.ndarray: (N, 세로 성분, 가로 성분, 3) 성분 값
+    """
+    count_x, count_y = components
+    _, height, width, _ = pixels.shape
+    linear = srgb_to_linear(pixels.astype(np.float64))
+
+    basis_x = np.cos(np.pi * np.outer(np.arange(count_x), np.arange(width)) / width)
+    basis_y = np.cos(np.pi * np.outer(np.arange(count_y), np.arange(height)) / height)
+    factors = np.einsum('jy,ix,nyxc->njic', basis_y, basis_x, linear) / (width * height)
+
+    # DC 성분을 제외한 나머지는 2배 (BlurHash 정규화)
+    scale = np.full((count_y, count_x), 2.0)
+    scale[0, 0] = 1.0
+    return factors * scale[None, :, :, None]
+
+
+def encode_blurhash(factors):
+    """
+    성분 값 하나를 BlurHash 문자열로 인코딩
+
+    Args:
+        factors (np.ndarray): (세로 성분, 가로 성분, 3) 성분 값
+
+    Returns:
+        str: BlurHash 문자열
+    """
+    count_y, count_x, _ = factors.shape
+    flat = factors.reshape(-1, 3)
+    dc, ac = flat[0], flat[1:]
+
+    result = encode_base83((count_x - 1) + (count_y - 1) * 9, 1)
+    if len(ac):
+        quantised_max = int(min(max(np.floor(np.abs(ac).max() * 166 - 0.5), 0), 82))
+        maximum = (quantised_max + 1) / 166
+        result += encode_base83(quantised_max, 1)
+    else:
+        maximum = 1.0
+        result += encode_base83(0, 1)
+
+    r, g, b = (linear_to_srgb(v) for v in dc)
+    result += encode_base83((r << 16) + (g << 8) + b, 4)
+
+    # AC 성분은 부호를 살린 제곱근으로 0~18 단계 양자화
+    scaled = ac / maximum
+    quantised = np.clip(np.floor(np.sign(scaled) * np.sqrt(np.abs(scaled)) * 9 + 9.5), 0, 18).astype(int)
+    for qr, qg, qb in quantised:
+        result += encode_base83(qr * 19 * 19 + qg * 19 + qb, 2)
+    return result
+
+
+def dominant_colors(pixels, bits=4):
+    """
+    여러 이미지의 대표 색상 (채널당 bits비트로 양자화한 색 중 가장 많은 칸의 평균색)
+
+    Args:
+        pixels (np.ndarray): (N, H, W, 3) uint8 sRGB 픽셀
+        bits (int): 채널당 양자화 비트 수
+
+    Returns:
+        list: '#rrggbb' 문자열 리스트
+    """
+    count = pixels.shape[0]
+    flat = pixels.reshape(count, -1, 3).astype(np.int64)
+    shift = 8 - bits
+    bins = (flat[..., 0] >> shift) << (2 * bits) | (flat[..., 1] >> shift) << bits | (flat[..., 2] >> shift)
+
+    colors = []
+    for i in range(count):
+        top = np.bincount(bins[i]).argmax()
+        r, g, b = flat[i][bins[i] == top].mean(axis=0).round().astype(int)
+        colors.append(f"#{r:02x}{g:02x}{b:02x}")
+    return colors
+
+
+def lqip_data_uri(image, width=LQIP_WIDTH):
+    """원본 비율을 유지한 아주 작은 WebP 썸네일을 data URI로 반환"""
+    from PIL import Image
+
+    height = max(1, round(image.height * width / image.width))
+    thumb = image.resize((width, height), Image.LANCZOS)
+    buffer = io.BytesIO()
+    thumb.save(buffer, 'WEBP', quality=LQIP_QUALITY, method=6)
+    return 'data:image/webp;base64,' + base64.b64encode(buffer.getvalue()).decode('ascii')
+
+
+def placeholder_batch(paths):
+    """
+    이미지 묶음의 플레이스홀더 계산 (프로세스 풀 워커에서 실행)
+
+    Args:
+        paths (list): 이미지 경로들
+
+    Returns:
+        list: 경로 순서대로 {blurhash, color, lqip} (디코딩 실패 시 None)
+    """
+    from PIL import Image, ImageOps
+
+    samples, thumbs, decoded = [], [], []
+    for path in paths:
+        try:
+            with Image.open(path) as original:
+                # JPEG는 디코딩 단계에서 바로 줄여서 읽음 (원본 해상도 전체를 풀지 않음)
+                original.draft('RGB', (SAMPLE_SIZE * 4, SAMPLE_SIZE * 4))
+                image = ImageOps.exif_transpose(original).convert('RGB')
+        except Exception:
+            decoded.append(False)
+            continue
+        samples.append(np.asarray(image.resize((SAMPLE_SIZE, SAMPLE_SIZE), Image.BOX), dtype=np.uint8))
+        thumbs.append(lqip_data_uri(image))
+        decoded.append(True)
+
+    results = []
+    if samples:
+        pixels = np.stack(samples)
+        hashes = [encode_blurhash(factors) for factors in blurhash_factors(pixels)]
+        colors = dominant_colors(pixels)
+        values = iter(zip(hashes, colors, thumbs))
+    for ok in decoded:
+        if not ok:
+            results.append(None)
+            continue
+        blurhash, color, lqip = next(values)
+        results.append({"blurhash": blurhash, "color": color, "lqip": lqip})
+    return results
+
+
+def compute_placeholders(paths, max_workers=None, batch_size=BATCH_SIZE):
+    """
+    여러 이미지의 플레이스홀더를 묶음 단위로 나눠서 계산
+
+    Args:
+        paths (list): 이미지 경로들
+        max_workers (int): 프로세스 수 (기본: CPU 코어 수)
+        batch_size (int): 묶음 하나의 이미지 수
+
+    Returns:
+        dict: 경로(str) -> {blurhash, color, lqip} (실패한 이미지는 빠짐)
+    """
+    paths = [str(path) for path in paths]
+    batches = [paths[i:i + batch_size] for i in range(0, len(paths), batch_size)]
+    if not batches:
+        return {}
+
+    if len(batches) == 1:
+        # 묶음 하나는 프로세스를 띄우는 비용이 더 큼
+        outputs = [placeholder_batch(batches[0])]
+    else:
+        workers = min(max_workers or os.cpu_count(), len(batches))
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as executor:
+            outputs = list(executor.map(placeholder_batch, batches))
+
+    placeholders = {}
+    for batch, results in zip(batches, outputs):
+        for path, result in zip(batch, results):
+            if result:
+                placeholders[path] = result
+    return placeholders
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧵 SCENT DESTINATION 크롤러 세션 풀
+미리 띄워둔 N개의 크롤러(Chrome 세션)를 재사용하면서 공유 큐의 작업을 나눠 처리
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CrawlerPool:
+    def __init__(self, factory, size=1, max_attempts=2, is_healthy=None, should_recycle=None):
+        """
+        크롤러 세션 풀 초기화
+
+        Args:
+            factory (callable): 새 크롤러 세션을 만드는 함수 (인자 없음)
+            size (int): 동시에 유지할 세션 수
+            max_attempts (int): 세션이 죽었을 때 한 작업을 다시 시도할 최대 횟수
+            is_healthy (callable): 세션 상태 확인 함수 (session -> bool)
+            should_recycle (callable): 작업 하나를 마친 세션을 새로 띄울지 확인 (session -> 이유 문자열 또는 None)
+        """
+        self.factory = factory
+        self.size = max(1, int(size))
+        self.max_attempts = max(1, int(max_attempts))
+        self.is_healthy = is_healthy or (lambda session: True)
+        self.should_recycle = should_recycle
+
+        self.sessions = []
+        self.replaced = 0
+        self.recycled = 0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self):
+        """세션들을 병렬로 미리 띄워둠 (웜업)"""
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            self.sessions = list(executor.map(lambda _: self._create_session(), range(self.size)))
+
+        alive = [s for s in self.sessions if s is not None]
+        print(f"🔥 워밍업 완료: {len(alive)}/{self.size}개 세션 준비됨")
+        return len(alive)
+
+    def _create_session(self):
+        """새 세션 생성 (실패 시 None)"""
+        try:
+            return self.factory()
+        except (Exception, SystemExit) as e:
+            # _setup_driver()는 실패 시 sys.exit(1)을 호출하므로 SystemExit도 잡음
+            print(f"❌ 크롤러 세션 생성 실패: {e}")
+            return None
+
+    def _close_session(self, session):
+        """세션 종료 (이미 죽은 세션이어도 무시)"""
+        if session is None:
+            return
+        try:
+            session.close()
+        except Exception:
+            pass
+
+    def _replace_session(self, slot):
+        """죽은 세션을 새 세션으로 교체"""
+        self._close_session(self.sessions[slot])
+        print(f"♻️ 워커 {slot + 1}: 세션 교체 중...")
+        self.sessions[slot] = self._create_session()
+        with self._lock:
+            self.replaced += 1
+        return self.sessions[slot]
+
+    def _worker(self, slot, jobs, handler, results):
+        """워커 스레드: 큐가 빌 때까지 작업을 꺼내 처리"""
+        while not self._stop.is_set():
+            session = self.sessions[slot]
+            if session is None:
+                session = self._replace_session(slot)
+                if session is None:
+                    print(f"💀 워커 {slot + 1}: 세션을 만들 수 없어 종료")
+                    return
+
+            try:
+                job, attempt = jobs.get_nowait()
+            except queue.Empty:
+                return
+
+            value, error = None, None
+            try:
+                value = handler(session, job)
+            except Exception as e:
+                error = e
+
+            # 크롤러 메서드들은 대부분 예외를 삼키므로, 작업 후 세션 상태를 직접 확인
+            if not self._is_session_alive(session):
+                self._replace_session(slot)
+                if attempt < self.max_attempts:
+                    print(f"🔁 워커 {slot + 1}: 세션 오류로 작업 재시도 ({attempt + 1}/{self.max_attempts})")
+                    jobs.put((job, attempt + 1))
+                    continue
+                error = error or RuntimeError("크롤러 세션이 반복적으로 종료됨")
+
+            results.put({
+                "job": job,
+                "value": value,
+                "error": error,
+                "attempts": attempt,
+                "worker": slot + 1,
+            })
+
+            # 메모리가 쌓인 세션은 작업 사이에서 새로 띄움 (다른 워커와 공유 다운로드는 그대로 진행)
+            if self.sessions[slot] is not session or self._stop.is_set():
+                continue
+            reason = self._recycle_reason(session)
+            if reason:
+                print(f"♻️ 워커 {slot + 1}: 세션 재시작 ({reason})")
+                self._close_session(session)
+                self.sessions[slot] = self._create_session()
+                with self._lock:
+                    self.recycled += 1
+
+    def _recycle_reason(self, session):
+        if self.should_recycle is None:
+            return None
+        try:
+            return self.should_recycle(session)
+        except Exception:
+            return None
+
+    def _is_session_alive(self, session):
+        try:
+            return bool(self.is_healthy(session))
+        except Exception:
+            return False
+
+    def run(self, jobs, handler, on_result=None, job_queue=None):
+        """
+        작업들을 공유 큐에 넣고 모든 세션이 나눠서 처리
+
+        Args:
+            jobs (iterable): 처리할 작업 목록
+            handler (callable): (session, job) -> value
+            on_result (callable): 결과가 하나 도착할 때마다 메인 스레드에서 호출
+            job_queue: jobs 대신 작업을 꺼낼 큐 (get_nowait/put/empty/close - 분산 작업 큐의 임대 어댑터 등)
+
+        Returns:
+            tuple: (결과 리스트, 처리되지 못한 작업 리스트)
+        """
+        if not self.sessions:
+            self.start()
+
+        external_queue = job_queue is not None
+        if not external_queue:
+            job_queue = queue.Queue()
+            for job in jobs:
+                job_queue.put((job, 1))
+
+        result_queue = queue.Queue()
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(slot, job_queue, handler, result_queue),
+                name=f"crawler-worker-{slot + 1}",
+                daemon=True,
+            )
+            for slot in range(self.size)
+        ]
+        for thread in threads:
+            thread.start()
+
+        results = []
+        try:
+            # 메인 스레드는 결과만 모음 (짧은 타임아웃으로 Ctrl+C에 반응)
+            while any(thread.is_alive() for thread in threads) or not result_queue.empty():
+                try:
+                    result = result_queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                results.append(result)
+                if on_result:
+                    on_result(result)
+        except KeyboardInterrupt:
+            # 진행 중인 작업은 끝까지 처리하고 새 작업은 받지 않음
+            print("\n⏳ 진행 중인 작업을 마무리하는 중...")
+            self._stop.set()
+            if external_queue:
+                # 다른 워커의 임대가 끝나기를 기다리는 워커도 깨움
+                job_queue.close()
+            for thread in threads:
+                thread.join()
+            while not result_queue.empty():
+                result = result_queue.get_nowait()
+                results.append(result)
+                if on_result:
+                    on_result(result)
+            raise
+
+        leftover = []
+        while not job_queue.empty():
+            leftover.append(job_queue.get_nowait()[0])
+        return results, leftover
+
+    def close(self):
+        """모든 세션 종료"""
+        self._stop.set()
+        for session in self.sessions:
+            self._close_session(session)
+        self.sessions = []
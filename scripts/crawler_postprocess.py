@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🖼️ SCENT DESTINATION 이미지 후처리
+다운로드된 원본 JPEG를 디코딩해서 메타데이터를 지우고, 반응형 너비(320/640/1200)별
+WebP / AVIF 변형을 원본 옆에 원자적으로 저장 (CPU 작업이라 ProcessPoolExecutor로 모든 코어 사용)
+
+필요 패키지: pip install pillow (AVIF는 Pillow 11.3+ 또는 pillow-avif-plugin)
+"""
+
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+DEFAULT_WIDTHS = (320, 640, 1200)
+DEFAULT_FORMATS = ('webp', 'avif')
+
+# 포맷별 품질 목표 (AVIF는 같은 화질에서 더 낮은 값이 적당)
+QUALITY = {
+    'jpg': 82,
+    'webp': 80,
+    'avif': 55,
+}
+
+PIL_FORMATS = {
+    'jpg': 'JPEG',
+    'webp': 'WEBP',
+    'avif': 'AVIF',
+}
+
+
+def variant_path(src_path, width, fmt):
+    """원본 옆에 저장할 변형 파일 경로 (예: osechill-1-640w.webp)"""
+    src_path = Path(src_path)
+    return src_path.with_name(f"{src_path.stem}-{width}w.{fmt}")
+
+
+def is_variant(path):
+    """후처리로 만들어진 변형 파일인지 확인 (다시 처리하지 않도록)"""
+    stem = Path(path).stem
+    suffix = stem.rsplit('-', 1)[-1]
+    return suffix.endswith('w') and suffix[:-1].isdigit()
+
+
+def supported_formats(formats):
+    """현재 Pillow에서 인코딩할 수 있는 포맷만 남김"""
+    from PIL import Image, features
+
+    try:
+        # 별도 플러그인으로 AVIF를 지원하는 경우
+        import pillow_avif  # noqa: F401
+    except ImportError:
+        pass
+
+    available = []
+    for fmt in formats:
+        if fmt == 'avif' and not (features.check('avif') or 'AVIF' in Image.SAVE):
+            print("⚠️ 현재 Pillow가 AVIF 인코딩을 지원하지 않아 건너뜀 (pip install -U pillow 또는 pillow-avif-plugin)")
+            continue
+        available.append(fmt)
+    return available
+
+
+def _save_atomic(image, path, fmt):
+    """임시 파일에 저장한 뒤 os.replace로 교체 (중단되어도 반쯤 쓴 파일이 남지 않음)"""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    options = {'quality': QUALITY[fmt]}
+    if fmt == 'jpg':
+        options.update(optimize=True, progressive=True)
+    elif fmt == 'webp':
+        options.update(method=6)
+    image.save(tmp_path, PIL_FORMATS[fmt], **options)
+    os.replace(tmp_path, path)
+    return path.stat().st_size
+
+
+def process_image(src_path, widths=DEFAULT_WIDTHS, formats=DEFAULT_FORMATS, force=False):
+    """
+    원본 이미지 하나를 후처리 (프로세스 풀 워커에서 실행)
+
+    Args:
+        src_path (str): 원본 이미지 경로
+        widths (tuple): 만들 너비들 (원본보다 큰 너비는 원본 너비로 한 번만 생성)
+        formats (tuple): 만들 포맷들 (jpg / webp / avif)
+        force (bool): 변형이 원본보다 새것이어도 다시 만들지 여부
+
+    Returns:
+        dict: {source, source_bytes, width, height, variants: [{file, width, height, format, bytes}], skipped}
+    """
+    from PIL import Image, ImageOps
+
+    src_path = Path(src_path)
+    source_mtime = src_path.stat().st_mtime
+    result = {
+        "source": src_path.name,
+        "source_bytes": src_path.stat().st_size,
+        "variants": [],
+        "skipped": 0,
+    }
+
+    with Image.open(src_path) as original:
+        # EXIF 회전 정보를 픽셀에 반영한 뒤 메타데이터 없이 새 이미지로 복사
+        image = ImageOps.exif_transpose(original).convert('RGB')
+
+    result["width"], result["height"] = image.size
+
+    targets = sorted({min(width, image.width) for width in widths})
+    for width in targets:
+        height = round(image.height * width / image.width)
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+
+        for fmt in formats:
+            path = variant_path(src_path, width, fmt)
+            if not force and path.exists() and path.stat().st_mtime >= source_mtime:
+                result["skipped"] += 1
+                size = path.stat().st_size
+            else:
+                size = _save_atomic(resized, path, fmt)
+            result["variants"].append({
+                "file": path.name,
+                "width": width,
+                "height": height,
+                "format": fmt,
+                "bytes": size,
+            })
+
+    return result
+
+
+class ImagePostProcessor:
+    def __init__(self, max_workers=None, widths=DEFAULT_WIDTHS, formats=DEFAULT_FORMATS, force=False):
+        """
+        이미지 후처리 프로세스 풀 초기화
+
+        Args:
+            max_workers (int): 프로세스 수 (기본: CPU 코어 수)
+            widths (tuple): 만들 너비들
+            formats (tuple): 만들 포맷들
+            force (bool): 이미 만들어진 변형도 다시 만들지 여부
+        """
+        self.widths = tuple(widths)
+        self.formats = tuple(supported_formats(formats))
+        self.force = force
+        self.results = []
+        self.errors = 0
+
+        # 크롤러가 Chrome/다운로드 스레드를 띄운 상태라 fork 대신 spawn 사용
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context('spawn')
+        )
+        self._futures = []
+
+    def submit(self, src_path):
+        """원본 이미지 하나의 후처리를 예약"""
+        future = self.executor.submit(process_image, str(src_path), self.widths, self.formats, self.force)
+        future.add_done_callback(self._collect)
+        self._futures.append(future)
+        return future
+
+    def _collect(self, future):
+        try:
+            self.results.append(future.result())
+        except Exception as e:
+            self.errors += 1
+            print(f"  ❌ 이미지 후처리 실패: {e}")
+
+    def submit_directory(self, directory):
+        """디렉토리의 모든 원본 JPEG를 예약 (이미 만들어진 변형 파일은 제외)"""
+        sources = [p for p in sorted(Path(directory).glob('*.jpg')) if not is_variant(p)]
+        for path in sources:
+            self.submit(path)
+        return len(sources)
+
+    def close(self):
+        """예약된 작업을 모두 마치고 요약 출력"""
+        self.executor.shutdown(wait=True)
+        self.print_summary()
+
+    def print_summary(self):
+        if not self.results and not self.errors:
+            return
+
+        source_bytes = sum(r["source_bytes"] for r in self.results)
+        print(f"\n🖼️ 이미지 후처리 완료: {len(self.results)}장 (실패 {self.errors}장)")
+        print(f"   원본 JPEG 합계: {source_bytes / 1024 / 1024:.1f}MB")
+
+        for fmt in self.formats:
+            for width in self.widths:
+                sizes = [
+                    v["bytes"] for r in self.results for v in r["variants"]
+                    if v["format"] == fmt and v["width"] == min(width, r["width"])
+                ]
+                if sizes:
+                    total = sum(sizes)
+                    ratio = total / source_bytes * 100 if source_bytes else 0
+                    print(f"   {fmt:<5} {width:>5}w: {total / 1024 / 1024:.1f}MB (원본 대비 {ratio:.0f}%)")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🗂️ SCENT DESTINATION 브라우저 프로필 풀
+매번 빈 Chrome 프로필로 시작하면 동의 페이지, 지도 JS 번들, 폰트를 다시 받아야 하므로
+--user-data-dir를 디스크에 남겨서 다음 실행에서 캐시와 쿠키를 그대로 씀 (warm 시작)
+Chrome은 프로필 하나를 동시에 한 프로세스만 쓸 수 있어서 워커마다 복사본(worker-N)을 둠
+"""
+
+import shutil
+import threading
+from pathlib import Path
+
+PROFILE_DIR = 'scripts/chrome-profile'
+
+# 복사하지 않을 파일 (실행 중인 Chrome의 잠금 파일, 크래시 덤프, 임시 파일)
+COPY_IGNORE = shutil.ignore_patterns('Singleton*', 'lockfile', 'Crashpad', 'BrowserMetrics*', '*.tmp')
+
+
+def is_warm(path):
+    """이전 실행에서 쓰던 프로필인지 (디렉토리가 있고 비어 있지 않음)"""
+    path = Path(path)
+    return path.is_dir() and any(path.iterdir())
+
+
+class ProfilePool:
+    def __init__(self, root=PROFILE_DIR, size=1):
+        """
+        워커별 프로필 디렉토리 모음
+
+        Args:
+            root (str): 프로필들을 둘 디렉토리 (root/worker-1, root/worker-2, ...)
+            size (int): 동시에 쓸 프로필 수 (워커 수)
+        """
+        self.root = Path(root)
+        self.size = max(1, int(size))
+        self.in_use = set()
+        self._lock = threading.Lock()
+
+    def slot_path(self, index):
+        return self.root / f"worker-{index}"
+
+    def prepare(self):
+        """
+        아직 없는 워커 프로필을 warm 프로필에서 복사 (Chrome을 띄우기 전에 호출)
+
+        Returns:
+            int: 복사로 만든 프로필 수
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        slots = [self.slot_path(i) for i in range(1, self.size + 1)]
+        seed = next((path for path in slots if is_warm(path)), None)
+        if seed is None:
+            # 다른 워커 수로 실행했을 때 만든 프로필이 남아 있으면 그것을 씀
+            seed = next((path for path in sorted(self.root.glob('worker-*')) if is_warm(path)), None)
+
+        copied = 0
+        for path in slots:
+            if seed is not None and not is_warm(path):
+                shutil.rmtree(path, ignore_errors=True)
+                shutil.copytree(seed, path, ignore=COPY_IGNORE)
+                copied += 1
+
+        warm = sum(1 for path in slots if is_warm(path))
+        print(
+            f"🗂️ 브라우저 프로필: {self.root} (warm {warm}개, 복사 {copied}개"
+            + (", 첫 실행이라 cold 시작" if seed is None else "") + ")"
+        )
+        return copied
+
+    def acquire(self):
+        """
+        쓰고 있지 않은 프로필 하나를 빌림 (세션 교체 중에는 size를 넘는 번호가 새로 생길 수 있음)
+
+        Returns:
+            Path: --user-data-dir로 쓸 디렉토리
+        """
+        with self._lock:
+            index = 1
+            while index in self.in_use:
+                index += 1
+            self.in_use.add(index)
+        path = self.slot_path(index)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def release(self, path):
+        """Chrome을 종료한 뒤 프로필 반납"""
+        index = int(Path(path).name.rsplit('-', 1)[1])
+        with self._lock:
+            self.in_use.discard(index)
@@ -0,0 +1,415 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📮 SCENT DESTINATION 분산 크롤링 작업 큐
+코디네이터가 장소들을 공유 큐에 넣으면 여러 머신/프로세스의 워커가 장소를 하나씩 임대(lease)해서 처리
+임대에는 만료 시간(visibility timeout)이 있고 워커가 처리하는 동안 하트비트로 연장하므로,
+워커가 죽으면 만료된 임대를 다른 워커가 다시 가져감
+
+기본 백엔드는 SQLite 파일 하나 (한 머신의 여러 프로세스, 또는 잠금을 지원하는 공유 파일 시스템)
+다른 백엔드(Redis 등)는 WorkQueue를 구현하고 register_backend()로 등록
+"""
+
+import json
+import os
+import queue
+import socket
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+from crawler_manifest import STATUS_COMPLETE, utc_now
+
+QUEUE_PATH = 'scripts/crawl_queue.sqlite'
+
+# 하트비트 없이 이 시간이 지나면 임대가 만료되어 다른 워커가 가져감 (초)
+DEFAULT_LEASE_TIMEOUT = 300.0
+
+# 임대 만료/실패가 이만큼 반복된 장소는 failed로 남김 (워커를 계속 죽이는 장소 방지)
+DEFAULT_MAX_ATTEMPTS = 3
+
+JOB_PENDING = "pending"
+JOB_LEASED = "leased"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+
+def worker_id():
+    """이 프로세스의 임대 주인 이름 (호스트명:PID)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class WorkQueue:
+    """
+    작업 큐 백엔드 인터페이스
+
+    임대 만료 시각은 벽시계(time.time) 기준이므로 워커 머신들의 시계가 대략 맞아야 함
+    """
+
+    def enqueue(self, jobs, key="english_name", reset=False):
+        """작업 추가 (이미 있는 키는 reset=True일 때만 pending으로 되돌림), 추가/초기화된 수 반환"""
+        raise NotImplementedError
+
+    def lease(self, owner, timeout=DEFAULT_LEASE_TIMEOUT):
+        """대기 중이거나 임대가 만료된 작업 하나를 임대, (key, payload, attempts) 또는 None"""
+        raise NotImplementedError
+
+    def heartbeat(self, key, owner, timeout=DEFAULT_LEASE_TIMEOUT):
+        """임대 연장, 다른 워커가 이미 가져갔으면 False"""
+        raise NotImplementedError
+
+    def complete(self, key, owner, result=None):
+        """작업 완료 보고, 임대를 잃었으면 False"""
+        raise NotImplementedError
+
+    def fail(self, key, owner, error, retry=True):
+        """작업 실패 보고 (retry면 시도 횟수가 남았을 때 다시 대기 상태로)"""
+        raise NotImplementedError
+
+    def release(self, key, owner):
+        """처리하지 못한 임대를 시도 횟수에 넣지 않고 반납"""
+        raise NotImplementedError
+
+    def outstanding(self):
+        """대기 중이거나 임대 중인 작업 수 (0이면 큐가 다 비워짐)"""
+        raise NotImplementedError
+
+    def status(self):
+        """상태별 작업 수와 임대 현황"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class SqliteWorkQueue(WorkQueue):
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS jobs (
+            key TEXT PRIMARY KEY,
+            payload TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            owner TEXT,
+            lease_expires REAL,
+            result TEXT,
+            error TEXT,
+            updated_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires);
+    """
+
+    def __init__(self, path=QUEUE_PATH, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        """
+        SQLite 작업 큐 열기 (없으면 생성)
+
+        임대는 BEGIN IMMEDIATE 트랜잭션 안에서 고르고 표시하므로 여러 프로세스가 동시에 불러도
+        같은 작업을 두 워커가 가져가지 않음
+
+        Args:
+            path (str): 큐 파일 경로
+            max_attempts (int): 장소 하나를 시도할 최대 횟수
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max(1, max_attempts)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), timeout=30, isolation_level=None, check_same_thread=False)
+        self._db.executescript(self.SCHEMA)
+
+    def _transaction(self, statements):
+        """statements(cursor)를 쓰기 잠금을 잡은 트랜잭션 안에서 실행"""
+        with self._lock:
+            cursor = self._db.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                value = statements(cursor)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            return value
+
+    def enqueue(self, jobs, key="english_name", reset=False):
+        rows = [(job[key], json.dumps(job, ensure_ascii=False), utc_now()) for job in jobs]
+        if reset:
+            sql = """
+                INSERT INTO jobs (key, payload, updated_at) VALUES (?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    payload = excluded.payload, status = 'pending', attempts = 0, owner = NULL,
+                    lease_expires = NULL, result = NULL, error = NULL, updated_at = excluded.updated_at
+            """
+        else:
+            sql = "INSERT OR IGNORE INTO jobs (key, payload, updated_at) VALUES (?, ?, ?)"
+
+        def statements(cursor):
+            before = self._db.total_changes
+            cursor.executemany(sql, rows)
+            return self._db.total_changes - before
+
+        return self._transaction(statements)
+
+    def requeue(self, statuses=(JOB_FAILED,)):
+        """지정한 상태의 작업을 시도 횟수를 초기화해서 다시 대기 상태로 (실패한 장소 재시도용)"""
+        marks = ','.join('?' * len(statuses))
+
+        def statements(cursor):
+            cursor.execute(
+                f"UPDATE jobs SET status = 'pending', attempts = 0, owner = NULL, lease_expires = NULL, "
+                f"error = NULL, updated_at = ? WHERE status IN ({marks})",
+                (utc_now(), *statuses)
+            )
+            return cursor.rowcount
+
+        return self._transaction(statements)
+
+    def lease(self, owner, timeout=DEFAULT_LEASE_TIMEOUT):
+        def statements(cursor):
+            now = time.time()
+            # 시도 횟수를 다 쓴 장소의 임대가 또 만료되면 다시 내주지 않고 실패로 남김
+            cursor.execute(
+                "UPDATE jobs SET status = 'failed', error = 'lease expired', owner = NULL, updated_at = ? "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (utc_now(), now, self.max_attempts)
+            )
+            row = cursor.execute(
+                "SELECT key, payload, attempts, status FROM jobs "
+                "WHERE status = 'pending' OR (status = 'leased' AND lease_expires < ?) "
+                "ORDER BY status = 'leased', rowid LIMIT 1",
+                (now,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            key, payload, attempts, previous = row
+            cursor.execute(
+                "UPDATE jobs SET status = 'leased', owner = ?, lease_expires = ?, attempts = attempts + 1, "
+                "updated_at = ? WHERE key = ?",
+                (owner, now + timeout, utc_now(), key)
+            )
+            if previous == JOB_LEASED:
+                print(f"♻️ 만료된 임대 회수: {key}")
+            return key, json.loads(payload), attempts + 1
+
+        return self._transaction(statements)
+
+    def _update_owned(self, key, owner, assignments, values):
+        """이 워커가 임대 중인 작업만 갱신 (임대를 잃었으면 False)"""
+        def statements(cursor):
+            cursor.execute(
+                f"UPDATE jobs SET {assignments}, updated_at = ? "
+                "WHERE key = ? AND owner = ? AND status = 'leased'",
+                (*values, utc_now(), key, owner)
+            )
+            return cursor.rowcount == 1
+
+        return self._transaction(statements)
+
+    def heartbeat(self, key, owner, timeout=DEFAULT_LEASE_TIMEOUT):
+        return self._update_owned(key, owner, "lease_expires = ?", (time.time() + timeout,))
+
+    def complete(self, key, owner, result=None):
+        return self._update_owned(
+            key, owner, "status = 'done', lease_expires = NULL, result = ?, error = NULL",
+            (json.dumps(result, ensure_ascii=False, default=str),)
+        )
+
+    def fail(self, key, owner, error, retry=True):
+        return self._update_owned(
+            key, owner,
+            "status = CASE WHEN ? AND attempts < ? THEN 'pending' ELSE 'failed' END, "
+            "owner = CASE WHEN ? AND attempts < ? THEN NULL ELSE owner END, lease_expires = NULL, error = ?",
+            (retry, self.max_attempts, retry, self.max_attempts, str(error))
+        )
+
+    def release(self, key, owner):
+        return self._update_owned(
+            key, owner, "status = 'pending', owner = NULL, lease_expires = NULL, attempts = MAX(0, attempts - 1)", ()
+        )
+
+    def outstanding(self):
+        with self._lock:
+            row = self._db.execute("SELECT COUNT(*) FROM jobs WHERE status IN ('pending', 'leased')").fetchone()
+        return row[0]
+
+    def status(self):
+        """
+        Returns:
+            dict: {counts: {상태: 수}, expired: 만료된 임대 수, owners: {워커: 임대 수}}
+        """
+        now = time.time()
+        with self._lock:
+            counts = dict(self._db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+            expired = self._db.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = 'leased' AND lease_expires < ?", (now,)
+            ).fetchone()[0]
+            owners = dict(self._db.execute(
+                "SELECT owner, COUNT(*) FROM jobs WHERE status = 'leased' AND lease_expires >= ? GROUP BY owner",
+                (now,)
+            ).fetchall())
+        return {"counts": counts, "expired": expired, "owners": owners}
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+
+# 큐 URL 스킴 -> 백엔드 클래스 (경로만 주면 sqlite)
+QUEUE_BACKENDS = {"sqlite": SqliteWorkQueue}
+
+
+def register_backend(scheme, factory):
+    """다른 작업 큐 백엔드 등록 (factory(location, **options) -> WorkQueue)"""
+    QUEUE_BACKENDS[scheme] = factory
+
+
+def open_work_queue(url=QUEUE_PATH, **options):
+    """
+    큐 URL로 작업 큐 열기
+
+    Args:
+        url (str): 'sqlite:///경로' 또는 파일 경로 (다른 스킴은 register_backend로 등록)
+        **options: 백엔드 생성 옵션 (max_attempts 등)
+    """
+    scheme, separator, location = url.partition('://')
+    if not separator:
+        scheme, location = "sqlite", url
+    if scheme not in QUEUE_BACKENDS:
+        raise ValueError(f"지원하지 않는 작업 큐: {scheme} (사용 가능: {', '.join(QUEUE_BACKENDS)})")
+    if scheme == "sqlite" and location.startswith('/') and separator:
+        # sqlite:///scripts/q.sqlite -> scripts/q.sqlite, sqlite:////abs/q.sqlite -> /abs/q.sqlite
+        location = location[1:]
+    return QUEUE_BACKENDS[scheme](location, **options)
+
+
+def print_queue_status(work_queue):
+    """큐 상태 요약 출력"""
+    status = work_queue.status()
+    counts = status["counts"]
+    print(
+        f"📮 작업 큐: 대기 {counts.get(JOB_PENDING, 0)}개, 임대 {counts.get(JOB_LEASED, 0)}개, "
+        f"완료 {counts.get(JOB_DONE, 0)}개, 실패 {counts.get(JOB_FAILED, 0)}개"
+    )
+    if status["expired"]:
+        print(f"   ⌛ 만료된 임대 {status['expired']}개 (다음 임대 때 다른 워커가 회수)")
+    for owner, count in sorted(status["owners"].items()):
+        print(f"   🖥️ {owner}: {count}개 처리 중")
+
+
+class LeaseQueue:
+    def __init__(self, work_queue, owner=None, lease_timeout=DEFAULT_LEASE_TIMEOUT, wait_for_leases=True):
+        """
+        공유 작업 큐를 CrawlerPool의 작업 큐(get_nowait/put/empty)처럼 쓰게 하는 임대 어댑터
+
+        꺼낸 작업은 백그라운드 하트비트로 임대를 연장하고, 장소 기록이 끝나면 finish()로 결과를 보고
+
+        Args:
+            work_queue (WorkQueue): 공유 작업 큐
+            owner (str): 임대 주인 이름 (기본: 호스트명:PID)
+            lease_timeout (float): 임대 만료 시간 (초, 하트비트는 이 시간의 1/3마다)
+            wait_for_leases (bool): 대기 작업이 없어도 다른 워커의 임대가 남아 있으면 만료될 때까지 기다릴지 여부
+        """
+        self.work_queue = work_queue
+        self.owner = owner or worker_id()
+        self.lease_timeout = lease_timeout
+        self.wait_for_leases = wait_for_leases
+        self.poll_interval = min(5.0, lease_timeout / 4)
+        self.held = {}
+        self.stats = {"leased": 0, "done": 0, "retried": 0, "lost": 0}
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._heartbeat = threading.Thread(target=self._beat, name="lease-heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    def _beat(self):
+        while not self._closed.wait(self.lease_timeout / 3):
+            with self._lock:
+                keys = list(self.held)
+            for key in keys:
+                if not self.work_queue.heartbeat(key, self.owner, self.lease_timeout):
+                    print(f"⚠️ '{key}' 임대를 잃음 (만료되어 다른 워커가 가져감)")
+                    self._drop(key)
+                    with self._lock:
+                        self.stats["lost"] += 1
+
+    def _drop(self, key):
+        with self._lock:
+            return self.held.pop(key, None) is not None
+
+    def get_nowait(self):
+        """
+        작업 하나 임대
+
+        Returns:
+            tuple: (공간 데이터, 시도 횟수)
+
+        Raises:
+            queue.Empty: 더 처리할 작업이 없음
+        """
+        while not self._closed.is_set():
+            leased = self.work_queue.lease(self.owner, self.lease_timeout)
+            if leased:
+                key, job, attempts = leased
+                with self._lock:
+                    self.held[key] = time.monotonic()
+                    self.stats["leased"] += 1
+                return job, attempts
+            if not self.wait_for_leases or not self.work_queue.outstanding():
+                break
+            # 다른 워커가 처리 중인 장소가 끝나거나 만료되기를 기다림
+            self._closed.wait(self.poll_interval)
+        raise queue.Empty
+
+    def put(self, item):
+        """세션이 죽어서 다시 시도할 작업: 실패로 보고해서 (시도 횟수가 남았으면) 아무 워커나 다시 가져가게 함"""
+        job, _ = item
+        self.fail(job["english_name"], "크롤러 세션 종료")
+
+    def empty(self):
+        # 로컬에 쌓아둔 작업이 없으므로 항상 비어 있음 (남은 작업은 공유 큐에 그대로 남음)
+        return True
+
+    def finish(self, key, status, result=None):
+        """
+        장소 기록이 끝난 작업의 결과 보고 (complete가 아니면 시도 횟수가 남았을 때 다시 대기 상태로)
+
+        Args:
+            key (str): english_name
+            status (str): manifest 상태 (complete / partial / failed)
+            result (dict): 함께 남길 결과 (저장된 파일 등)
+        """
+        if not self._drop(key):
+            return
+        if status == STATUS_COMPLETE:
+            if self.work_queue.complete(key, self.owner, {"status": status, **(result or {})}):
+                with self._lock:
+                    self.stats["done"] += 1
+        else:
+            self.work_queue.fail(key, self.owner, status)
+            with self._lock:
+                self.stats["retried"] += 1
+
+    def fail(self, key, error):
+        """처리 중 오류가 난 작업 보고"""
+        if self._drop(key):
+            self.work_queue.fail(key, self.owner, error)
+            with self._lock:
+                self.stats["retried"] += 1
+
+    def close(self):
+        """하트비트를 멈추고 아직 결과를 보고하지 못한 임대는 반납 (다른 워커가 바로 가져갈 수 있도록)"""
+        self._closed.set()
+        self._heartbeat.join()
+        with self._lock:
+            keys = list(self.held)
+            self.held.clear()
+        for key in keys:
+            self.work_queue.release(key, self.owner)
+        if keys:
+            print(f"📮 처리하지 못한 임대 {len(keys)}개 반납")
+
+    def print_summary(self):
+        print(
+            f"📮 작업 큐 ({self.owner}): 임대 {self.stats['leased']}개, 완료 {self.stats['done']}개, "
+            f"재시도/실패 보고 {self.stats['retried']}개, 임대 상실 {self.stats['lost']}개"
+        )
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🏅 SCENT DESTINATION 후보 사진 순위 매기기
+장소마다 후보 사진을 넉넉히 모은 뒤 작은 썸네일만 받아서 NumPy로 한 번에 점수를 매기고
+(해상도, 선명도 - 라플라시안 분산, 노출, 가로세로 비율) 상위 N장만 원본 크기로 다운로드
+DOM 순서대로 앞의 3장을 받을 때 섞이던 프로필 사진, 지도 썸네일, 작은 아이콘을 걸러냄
+
+필요 패키지: pip install numpy pillow
+"""
+
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from crawler_network import normalize_photo_url
+
+# 썸네일 요청 크기 (원본이 이보다 작으면 googleusercontent가 키우지 않으므로 해상도 판단에 사용)
+THUMBNAIL_EDGE = 400
+THUMBNAIL_SIZE = f'w{THUMBNAIL_EDGE}-h{THUMBNAIL_EDGE}'
+
+# 선명도/노출 계산용 공통 격자 크기
+GRID = 128
+
+# 사이트 카드에 맞는 가로세로 비율 (3:2 가로 사진)
+TARGET_ASPECT = 1.5
+
+SCORE_WEIGHTS = {
+    "resolution": 0.35,
+    "sharpness": 0.30,
+    "exposure": 0.20,
+    "aspect": 0.15,
+}
+
+
+def decode_thumbnail(content):
+    """
+    썸네일 바이트를 (원래 크기, GRID×GRID 밝기 배열)로 디코딩
+
+    Returns:
+        tuple: ((width, height), float32 배열) - 디코딩 실패 시 None
+    """
+    from PIL import Image
+
+    try:
+        with Image.open(io.BytesIO(content)) as image:
+            size = image.size
+            gray = image.convert('L').resize((GRID, GRID), Image.BILINEAR)
+            return size, np.asarray(gray, dtype=np.float32) / 255.0
+    except Exception:
+        return None
+
+
+def score_thumbnails(sizes, grays):
+    """
+    썸네일 묶음의 품질 점수를 한 번에 계산
+
+    Args:
+        sizes (ndarray): (N, 2) 썸네일 너비/높이
+        grays (ndarray): (N, GRID, GRID) 0~1 밝기
+
+    Returns:
+        dict: 항목별 점수 배열 (resolution, sharpness, exposure, aspect, total) - 모두 0~1
+    """
+    sizes = np.asarray(sizes, dtype=np.float32)
+    grays = np.asarray(grays, dtype=np.float32)
+
+    # 해상도: 썸네일이 요청 크기를 못 채우면 원본이 작은 사진 (아이콘, 프로필 사진)
+    resolution = np.clip(sizes.max(axis=1) / THUMBNAIL_EDGE, 0, 1)
+
+    # 선명도: 4-이웃 라플라시안의 분산 (흐리거나 단색인 이미지는 낮음), 로그 스케일로 묶음 안에서 정규화
+    laplacian = (
+        4 * grays[:, 1:-1, 1:-1]
+        - grays[:, :-2, 1:-1] - grays[:, 2:, 1:-1]
+        - grays[:, 1:-1, :-2] - grays[:, 1:-1, 2:]
+    )
+    sharpness = np.log1p(laplacian.var(axis=(1, 2)) * 1e4)
+    sharpness = sharpness / sharpness.max() if sharpness.max() > 0 else sharpness
+
+    # 노출: 평균 밝기가 중간에 가까울수록, 날아가거나 뭉개진 픽셀이 적을수록 높음
+    mean = grays.mean(axis=(1, 2))
+    clipped = ((grays < 0.02) | (grays > 0.98)).mean(axis=(1, 2))
+    exposure = np.clip(1 - 2 * np.abs(mean - 0.5) - clipped, 0, 1)
+
+    # 비율: 목표 비율에서 멀어질수록 낮음 (세로 사진, 극단적인 파노라마)
+    aspect = np.exp(-np.abs(np.log(sizes[:, 0] / np.maximum(sizes[:, 1], 1) / TARGET_ASPECT)))
+
+    scores = {
+        "resolution": resolution,
+        "sharpness": sharpness,
+        "exposure": exposure,
+        "aspect": aspect,
+    }
+    scores["total"] = sum(SCORE_WEIGHTS[name] * scores[name] for name in SCORE_WEIGHTS)
+    return scores
+
+
+class CandidateRanker:
+    def __init__(self, downloader, max_workers=2):
+        """
+        후보 사진 순위 매기기 초기화
+
+        Args:
+            downloader (ImageDownloader): 썸네일을 받을 공유 다운로더 (세션과 호스트별 제한을 같이 씀)
+            max_workers (int): 동시에 순위를 매길 장소 수
+        """
+        self.downloader = downloader
+        self.executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="photo-rank")
+        self.stats = {"places": 0, "candidates": 0, "thumbnail_bytes": 0, "rejected": 0}
+        self._lock = threading.Lock()
+
+    def rank(self, place_name, image_urls):
+        """
+        후보 URL들을 썸네일 품질 점수 순으로 정렬 (썸네일을 받지 못한 후보는 맨 뒤)
+
+        Args:
+            place_name (str): 장소명 (로그용)
+            image_urls (list): 원본 크기 후보 URL 리스트 (수집 순서)
+
+        Returns:
+            list: 점수 순으로 정렬된 URL 리스트
+        """
+        thumbnail_urls = [normalize_photo_url(url, THUMBNAIL_SIZE) for url in image_urls]
+        futures = [self.downloader.executor.submit(self.downloader.fetch_bytes, url) for url in thumbnail_urls]
+
+        decoded = []
+        thumbnail_bytes = 0
+        for url, future in zip(image_urls, futures):
+            content = future.result()
+            thumbnail = decode_thumbnail(content) if content else None
+            if thumbnail:
+                thumbnail_bytes += len(content)
+                decoded.append((url, *thumbnail))
+
+        with self._lock:
+            self.stats["places"] += 1
+            self.stats["candidates"] += len(image_urls)
+            self.stats["thumbnail_bytes"] += thumbnail_bytes
+            self.stats["rejected"] += len(image_urls) - len(decoded)
+
+        if not decoded:
+            return list(image_urls)
+
+        scores = score_thumbnails([d[1] for d in decoded], np.stack([d[2] for d in decoded]))
+        order = np.argsort(-scores["total"], kind='stable')
+        ranked = [decoded[i][0] for i in order]
+
+        best = order[0]
+        print(
+            f"  🏅 '{place_name}' 후보 {len(image_urls)}장 순위 결정 (1위 {scores['total'][best]:.2f}: "
+            f"해상도 {scores['resolution'][best]:.2f}, 선명도 {scores['sharpness'][best]:.2f}, "
+            f"노출 {scores['exposure'][best]:.2f}, 비율 {scores['aspect'][best]:.2f})"
+        )
+        return ranked + [url for url in image_urls if url not in ranked]
+
+    def submit(self, place_name, image_urls, then):
+        """
+        순위 매기기를 백그라운드로 예약 (브라우저는 다음 장소로 이동)
+
+        Args:
+            place_name (str): 장소명
+            image_urls (list): 후보 URL 리스트
+            then (callable): 정렬된 URL 리스트로 호출되어 다운로드를 예약하는 함수 (반환값이 Future 결과)
+
+        Returns:
+            Future: then()의 반환값을 결과로 가지는 Future
+        """
+        def job():
+            try:
+                started = time.monotonic()
+                ranked = self.rank(place_name, image_urls)
+                metrics = getattr(self.downloader, 'metrics', None)
+                if metrics is not None:
+                    metrics.observe("rank", time.monotonic() - started, place=place_name, candidates=len(image_urls))
+            except Exception as e:
+                print(f"⚠️ '{place_name}' 후보 순위 매기기 실패, 수집 순서대로 진행: {e}")
+                ranked = list(image_urls)
+            return then(ranked)
+
+        return self.executor.submit(job)
+
+    def close(self):
+        """예약된 순위 매기기를 모두 마침 (다운로더보다 먼저 닫아야 함)"""
+        self.executor.shutdown(wait=True)
+
+    def print_summary(self, max_images):
+        if not self.stats["places"]:
+            return
+        skipped = max(0, self.stats["candidates"] - self.stats["places"] * max_images)
+        print(
+            f"🏅 후보 순위: {self.stats['places']}개 장소, 후보 {self.stats['candidates']}장 "
+            f"(썸네일 {self.stats['thumbnail_bytes'] / 1024 / 1024:.1f}MB, 썸네일 실패 {self.stats['rejected']}장, "
+            f"원본 다운로드 생략 {skipped}장)"
+        )
@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🚦 SCENT DESTINATION 요청 속도 제어
+고정된 time.sleep 대신 호스트별 토큰 버킷으로 모든 워커/스레드의 요청 속도를 함께 제한하고,
+429/5xx/타임아웃이 나면 속도를 절반으로 줄였다가 성공이 이어지면 천천히 다시 올림 (AIMD)
+오류율이 급격히 오르면 회로 차단기가 열려서 크롤링 전체를 잠시 멈춤
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from urllib.parse import urlparse
+
+# 재시도할 HTTP 상태 코드 (요청 과다, 서버 오류)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# 최대 속도를 따로 주지 않으면 시작 속도의 이 배수까지 올림 (시작 속도에 묶이면 감속만 하게 됨)
+DEFAULT_CEILING = 4
+
+
+def host_of(url_or_host):
+    """URL이면 호스트만, 이미 호스트면 그대로"""
+    return urlparse(url_or_host).netloc or url_or_host
+
+
+def backoff_delay(attempt, base=1.0, cap=60.0):
+    """
+    지수 백오프 + full jitter 대기 시간
+
+    Args:
+        attempt (int): 0부터 시작하는 재시도 횟수
+        base (float): 첫 재시도의 최대 대기 시간 (초)
+        cap (float): 대기 시간 상한 (초)
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def retry_after_seconds(value):
+    """Retry-After 헤더 값(초)을 숫자로 변환 (HTTP 날짜 형식이거나 없으면 None)"""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    def __init__(self, rate, burst=1, max_rate=None, min_rate=None):
+        """
+        토큰 버킷 초기화
+
+        Args:
+            rate (float): 초당 허용 요청 수 (시작 속도)
+            burst (int): 한 번에 몰아서 보낼 수 있는 최대 요청 수
+            max_rate (float): 성공이 이어질 때 올라갈 수 있는 최대 속도 (기본: rate × DEFAULT_CEILING, rate보다 낮으면 rate)
+            min_rate (float): 실패가 이어져도 내려가지 않는 최소 속도 (기본: rate / 16)
+        """
+        self.rate = float(rate)
+        self.burst = max(1, burst)
+        self.max_rate = max(self.rate, float(max_rate or rate * DEFAULT_CEILING))
+        self.min_rate = float(min_rate or rate / 16)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """
+        토큰 하나를 얻을 때까지 대기
+
+        Returns:
+            float: 실제로 기다린 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self.blocked_until:
+                    delay = self.blocked_until - now
+                elif self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    def slow_down(self, pause=None):
+        """실패 시 속도를 절반으로 줄이고, pause초 동안은 토큰을 주지 않음 (Retry-After)"""
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.tokens = min(self.tokens, 0.0)
+            if pause:
+                self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+
+    def speed_up(self, step=None):
+        """성공 시 속도를 조금씩 올림 (최대 max_rate)"""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + (step or self.max_rate / 20))
+
+
+class RateLimiter:
+    def __init__(self, default_rate=10.0, burst=2, rates=None, max_rates=None, default_max_rate=None):
+        """
+        호스트별 토큰 버킷 모음 (스레드/워커 간 공유)
+
+        Args:
+            default_rate (float): 따로 지정하지 않은 호스트의 초당 요청 수
+            burst (int): 호스트별 최대 연속 요청 수
+            rates (dict): 호스트별 초당 요청 수 (예: {'www.google.com': 0.5})
+            max_rates (dict): 호스트별 최대 속도 (성공이 이어질 때 여기까지 올림)
+            default_max_rate (float): 따로 지정하지 않은 호스트의 최대 속도
+                                      (둘 다 없으면 시작 속도 × DEFAULT_CEILING)
+        """
+        self.default_rate = default_rate
+        self.burst = burst
+        self.rates = dict(rates or {})
+        self.max_rates = dict(max_rates or {})
+        self.default_max_rate = default_max_rate
+        self.buckets = {}
+        self.stats = {"waited": 0.0, "slowdowns": 0}
+        self._lock = threading.Lock()
+
+    def bucket(self, url_or_host):
+        host = host_of(url_or_host)
+        with self._lock:
+            if host not in self.buckets:
+                rate = self.rates.get(host, self.default_rate)
+                max_rate = self.max_rates.get(host, None if host in self.rates else self.default_max_rate)
+                self.buckets[host] = TokenBucket(rate, self.burst, max_rate)
+            return self.buckets[host]
+
+    def acquire(self, url_or_host):
+        """해당 호스트로 요청을 보내도 될 때까지 대기"""
+        waited = self.bucket(url_or_host).acquire()
+        if waited:
+            with self._lock:
+                self.stats["waited"] += waited
+        return waited
+
+    def failure(self, url_or_host, retry_after=None):
+        """429/5xx/타임아웃: 해당 호스트 속도를 절반으로"""
+        self.bucket(url_or_host).slow_down(retry_after)
+        with self._lock:
+            self.stats["slowdowns"] += 1
+
+    def success(self, url_or_host):
+        self.bucket(url_or_host).speed_up()
+
+    def print_summary(self):
+        if not self.buckets:
+            return
+        print(f"\n🚦 요청 속도 제어: 대기 {self.stats['waited']:.1f}s, 감속 {self.stats['slowdowns']}회")
+        for host, bucket in self.buckets.items():
+            print(f"   {host:<32} 현재 {bucket.rate:.2f}/s (최대 {bucket.max_rate:.2f}/s)")
+
+
+class CircuitBreaker:
+    def __init__(self, window=20, threshold=0.5, min_calls=8, cooldown=60.0, max_cooldown=600.0):
+        """
+        회로 차단기 초기화 (최근 결과의 오류율이 기준을 넘으면 모든 요청을 잠시 멈춤)
+
+        Args:
+            window (int): 오류율을 계산할 최근 결과 수
+            threshold (float): 회로를 열 오류율 (0~1)
+            min_calls (int): 오류율을 판단하기 위한 최소 결과 수
+            cooldown (float): 처음 회로가 열렸을 때 멈출 시간 (초)
+            max_cooldown (float): 연속으로 열릴 때 늘어나는 멈춤 시간 상한 (초)
+        """
+        self.window = window
+        self.threshold = threshold
+        self.min_calls = min_calls
+        self.base_cooldown = cooldown
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.results = deque(maxlen=window)
+        self.open_until = 0.0
+        self.trips = 0
+        self._lock = threading.Lock()
+
+    def record(self, ok):
+        """
+        요청 결과 기록 (재시도 대상 오류만 실패로 기록 - 404 등은 제외)
+
+        Returns:
+            bool: 이번 기록으로 회로가 열렸는지 여부
+        """
+        with self._lock:
+            self.results.append(bool(ok))
+            if ok:
+                # 멈춘 뒤 다시 성공하기 시작하면 멈춤 시간도 원래대로
+                if all(self.results):
+                    self.cooldown = self.base_cooldown
+                return False
+
+            failures = self.results.count(False)
+            if len(self.results) < self.min_calls or failures / len(self.results) < self.threshold:
+                return False
+            if time.monotonic() < self.open_until:
+                return False
+
+            self.open_until = time.monotonic() + self.cooldown
+            self.trips += 1
+            print(
+                f"\n🛑 오류율 {failures}/{len(self.results)} - 회로 차단기 작동, "
+                f"{self.cooldown:.0f}초 동안 크롤링 일시 정지"
+            )
+            self.cooldown = min(self.max_cooldown, self.cooldown * 2)
+            # 다시 열렸을 때 바로 재차단되지 않도록 결과를 비우고 새로 판단
+            self.results.clear()
+            return True
+
+    def wait(self):
+        """
+        회로가 열려 있으면 닫힐 때까지 대기
+
+        Returns:
+            float: 기다린 시간 (초)
+        """
+        with self._lock:
+            delay = self.open_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+            return delay
+        return 0.0
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📼 SCENT DESTINATION 크롤링 기록/재생
+기록 모드(--record)는 장소마다 페이지 스냅샷(HTML), 추출한 후보 목록, 이미지 응답(썸네일 포함)을
+내용 해시(SHA-256) 기준 zlib 압축 객체로 저장 (같은 내용은 한 번만 저장)
+재생 모드(--replay)는 브라우저와 네트워크 없이 같은 추출/순위/다운로드/후처리 코드로 기록을 다시 흘려보냄
+(파싱, 순위 매기기, 후처리 단계만 따로 몇 초 만에 프로파일링/최적화할 수 있음)
+
+보관 구조:
+    scripts/replay/index.json          장소별 기록과 URL별 응답 (내용은 해시로 참조)
+    scripts/replay/objects/ab/abcd...  zlib 압축된 내용 (파일 이름이 원본 SHA-256)
+"""
+
+import hashlib
+import json
+import os
+import threading
+import zlib
+from pathlib import Path
+
+from requests import Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from crawler_manifest import utc_now
+
+REPLAY_DIR = 'scripts/replay'
+ARCHIVE_VERSION = 1
+
+# 재생에 필요한 응답 헤더만 보관 (길이는 재생할 때 본문으로 다시 계산)
+KEPT_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+# 기록할 때 빼는 조건부 요청 헤더 (304가 오면 본문을 보관할 수 없음)
+CONDITIONAL_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+
+class ReplayArchive:
+    def __init__(self, root=REPLAY_DIR):
+        """
+        기록 보관소 로드
+
+        Args:
+            root (str): 보관 디렉토리 (index.json + objects/)
+        """
+        self.root = Path(root)
+        self.objects = self.root / 'objects'
+        self.index_path = self.root / 'index.json'
+        self.places = {}
+        self.responses = {}
+        self.stats = {"stored": 0, "reused": 0, "stored_bytes": 0, "hits": 0, "misses": 0}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+        if self.index_path.exists():
+            with open(self.index_path, encoding='utf-8') as f:
+                index = json.load(f)
+            self.places = index.get("places", {})
+            self.responses = index.get("responses", {})
+
+    def _object_path(self, sha256):
+        return self.objects / sha256[:2] / sha256
+
+    def put(self, data):
+        """
+        내용을 압축해서 저장 (이미 있는 내용이면 쓰지 않음)
+
+        Args:
+            data (bytes | str): 저장할 내용
+
+        Returns:
+            str: 내용의 SHA-256 (get()으로 다시 꺼낼 때 사용)
+        """
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        sha256 = hashlib.sha256(data).hexdigest()
+        path = self._object_path(sha256)
+        if path.exists():
+            with self._lock:
+                self.stats["reused"] += 1
+            return sha256
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zlib.compress(data, 6)
+        tmp_path = path.with_name(f".{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.stats["stored"] += 1
+            self.stats["stored_bytes"] += len(compressed)
+        return sha256
+
+    def get(self, sha256):
+        """해시로 내용 꺼내기 (없으면 None)"""
+        try:
+            with open(self._object_path(sha256), 'rb') as f:
+                return zlib.decompress(f.read())
+        except FileNotFoundError:
+            return None
+
+    def record_response(self, url, status, headers, body):
+        """HTTP 응답 하나 기록 (같은 URL은 마지막 응답으로 덮어씀)"""
+        entry = {
+            "status": status,
+            "headers": {name: headers[name] for name in KEPT_HEADERS if headers.get(name)},
+            "body": self.put(body),
+        }
+        with self._lock:
+            self.responses[url] = entry
+            self.dirty = True
+
+    def response(self, url):
+        """
+        기록된 응답 찾기
+
+        Returns:
+            tuple: (status, headers, body) - 기록이 없으면 None
+        """
+        entry = self.responses.get(url)
+        body = self.get(entry["body"]) if entry else None
+        with self._lock:
+            self.stats["hits" if body is not None else "misses"] += 1
+        if body is None:
+            return None
+        return entry["status"], entry["headers"], body
+
+    def record_place(self, key, name, region, opened, pages=None, extraction=None, candidates=()):
+        """
+        장소 하나의 브라우저 쪽 결과 기록
+
+        Args:
+            key (str): 장소 키 (english_name)
+            name (str): 장소명
+            region (str): 지역명
+            opened (bool): 장소 페이지가 열렸는지 여부
+            pages (dict): 단계 이름 -> 페이지 HTML ('list': 검색 결과 목록, 'place': 장소 패널)
+            extraction (dict): 페이지에서 추출한 원본 결과 (재생 때 같은 파싱 코드에 다시 넣음)
+            candidates (list): 최종 후보 사진 URL
+        """
+        entry = {
+            "name": name,
+            "region": region,
+            "opened": opened,
+            "pages": {kind: self.put(html) for kind, html in (pages or {}).items() if html},
+            "extraction": extraction,
+            "candidates": list(candidates),
+            "recorded_at": utc_now(),
+        }
+        with self._lock:
+            self.places[key] = entry
+            self.dirty = True
+
+    def place(self, key):
+        """기록된 장소 (없으면 None)"""
+        entry = self.places.get(key)
+        with self._lock:
+            self.stats["hits" if entry else "misses"] += 1
+        return entry
+
+    def page(self, key, kind='place'):
+        """기록된 페이지 HTML (파싱 단계를 따로 실험할 때 사용)"""
+        entry = self.places.get(key) or {}
+        sha256 = entry.get("pages", {}).get(kind)
+        data = self.get(sha256) if sha256 else None
+        return data.decode('utf-8') if data is not None else None
+
+    def save(self):
+        """색인을 원자적으로 저장 (내용 객체는 put() 시점에 이미 저장됨)"""
+        with self._lock:
+            if not self.dirty:
+                return
+            index = {"version": ARCHIVE_VERSION, "places": self.places, "responses": self.responses}
+            self.dirty = False
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def print_summary(self, mode):
+        if mode == 'record':
+            print(
+                f"📼 기록: 장소 {len(self.places)}개, 응답 {len(self.responses)}개 "
+                f"(새 객체 {self.stats['stored']}개 {self.stats['stored_bytes'] / 1024 / 1024:.1f}MB, "
+                f"같은 내용 재사용 {self.stats['reused']}개) -> {self.root}"
+            )
+        else:
+            print(f"📼 재생: 기록에서 찾음 {self.stats['hits']}회, 기록 없음 {self.stats['misses']}회 ({self.root})")
+
+
+class RecordingAdapter(HTTPAdapter):
+    """실제로 요청하면서 성공한 응답 본문을 보관소에 기록하는 requests 어댑터"""
+
+    def __init__(self, archive, **kwargs):
+        self.archive = archive
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        for name in CONDITIONAL_HEADERS:
+            request.headers.pop(name, None)
+        response = super().send(request, **kwargs)
+        if response.status_code == 200:
+            # 본문을 한 번 다 읽어둠 (호출한 쪽의 iter_content는 읽어둔 내용을 그대로 나눠서 받음)
+            self.archive.record_response(request.url, response.status_code, response.headers, response.content)
+        return response
+
+
+class ReplayAdapter(BaseAdapter):
+    """네트워크 대신 보관소의 응답을 돌려주는 requests 어댑터 (기록이 없으면 404)"""
+
+    def __init__(self, archive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, **kwargs):
+        recorded = self.archive.response(request.url)
+        response = Response()
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict()
+
+        if recorded is None:
+            response.status_code = 404
+            response.reason = 'Not Recorded'
+            response._content = b''
+        else:
+            status, headers, body = recorded
+            response.headers.update(headers)
+            etag = headers.get('ETag')
+            if etag and request.headers.get('If-None-Match') == etag:
+                response.status_code = 304
+                response._content = b''
+            else:
+                response.status_code = status
+                response._content = body
+                response.headers['Content-Length'] = str(len(body))
+        response._content_consumed = True
+        return response
+
+    def close(self):
+        pass
+
+
+def mount_archive(session, archive, mode, pool_size=10):
+    """
+    세션의 http/https 요청이 보관소를 거치도록 어댑터 교체
+
+    Args:
+        session (requests.Session): 다운로더 세션
+        archive (ReplayArchive): 기록 보관소
+        mode (str): 'record' (실제 요청 + 기록) 또는 'replay' (네트워크 없이 기록에서 응답)
+        pool_size (int): 기록 모드의 keep-alive 커넥션 수
+    """
+    if mode == 'record':
+        adapter = RecordingAdapter(archive, pool_connections=pool_size, pool_maxsize=pool_size)
+    else:
+        adapter = ReplayAdapter(archive)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
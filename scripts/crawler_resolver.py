@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+🧭 SCENT DESTINATION 장소 URL 해석기
+지도 홈 → 검색창 입력 → 결과 클릭 대신 검색 URL / 장소 URL로 바로 이동
+한 번 찾은 장소 URL은 로컬에 저장해서 다음 실행부터는 장소 페이지를 한 번에 염
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+from urllib.parse import quote, urlparse, urlunparse
+
+PLACE_CACHE_PATH = 'scripts/place_urls.json'
+MAPS_HOST = 'www.google.com'
+MAPS_URL = f'https://{MAPS_HOST}/maps/'
+
+
+def build_search_url(place_name, region="", maps_url=MAPS_URL):
+    """장소명과 지역으로 검색 결과(또는 단일 장소) 페이지 URL 생성 (maps_url로 벤치마크 서버 등을 가리킬 수 있음)"""
+    query = f"{place_name} {region}".strip()
+    return f"{maps_url.rstrip('/')}/search/{quote(query)}"
+
+
+def clean_place_url(url):
+    """장소 페이지 URL에서 세션성 쿼리(?entry=... 등)를 제거"""
+    parsed = urlparse(url)
+    if '/maps/place/' not in parsed.path:
+        return None
+    return urlunparse(parsed._replace(query='', fragment=''))
+
+
+class PlaceUrlCache:
+    def __init__(self, path=PLACE_CACHE_PATH):
+        """
+        장소 URL 캐시 로드
+
+        Args:
+            path (str): 캐시 파일(JSON) 경로 (english_name -> 장소 URL)
+        """
+        self.path = Path(path)
+        self.urls = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self.urls = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ 장소 URL 캐시를 읽을 수 없어 새로 시작: {e}")
+
+    def get(self, key):
+        return self.urls.get(key)
+
+    def set(self, key, url):
+        url = clean_place_url(url)
+        if not url:
+            return
+        with self._lock:
+            if self.urls.get(key) != url:
+                self.urls[key] = url
+                self.dirty = True
+
+    def forget(self, key):
+        """더 이상 열리지 않는 장소 URL 삭제"""
+        with self._lock:
+            if self.urls.pop(key, None) is not None:
+                self.dirty = True
+
+    def save(self):
+        """변경 사항이 있으면 원자적으로 저장"""
+        with self._lock:
+            if not self.dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.urls, f, ensure_ascii=False, indent=2, sort_keys=True)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
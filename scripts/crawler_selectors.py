@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+📊 SCENT DESTINATION 셀렉터 상태 저장소
+셀렉터별 적중/실패 횟수와 지연 시간을 실행 간에 저장하고,
+최근 성공률이 높은 셀렉터부터 시도하도록 순서를 정함 (죽은 셀렉터는 자동으로 뒤로 밀림)
+"""
+
+import json
+import os
+import threading
+from pathlib import Path
+
+SELECTOR_HEALTH_PATH = 'scripts/selector_health.json'
+
+# 최근 결과에 둘 가중치 (지수 이동 평균)
+RECENT_WEIGHT = 0.3
+# 연속으로 이만큼 실패하면 죽은 셀렉터로 보고 맨 뒤로 보냄
+DEAD_AFTER_MISSES = 5
+# 처음 보는 셀렉터의 성공률 (원래 순서를 유지하도록 중간값)
+UNKNOWN_RATE = 0.5
+
+
+class SelectorHealth:
+    def __init__(self, path=SELECTOR_HEALTH_PATH):
+        """
+        셀렉터 상태 저장소 로드
+
+        Args:
+            path (str): 상태 파일(JSON) 경로
+        """
+        self.path = Path(path)
+        self.groups = {}
+        self._lock = threading.Lock()
+
+        if self.path.exists():
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    self.groups = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️ 셀렉터 상태 파일을 읽을 수 없어 새로 시작: {e}")
+
+    def _stats(self, group, selector):
+        return self.groups.setdefault(group, {}).setdefault(selector, {
+            "hits": 0,
+            "misses": 0,
+            "consecutive_misses": 0,
+            "recent_rate": UNKNOWN_RATE,
+            "avg_ms": None,
+        })
+
+    def record(self, group, selector, hit, seconds=None):
+        """
+        셀렉터 한 번의 시도 결과 기록
+
+        Args:
+            group (str): 셀렉터 그룹 (search / result / image)
+            selector (str): CSS 셀렉터
+            hit (bool): 요소를 찾았는지 여부
+            seconds (float): 찾는 데 걸린 시간
+        """
+        with self._lock:
+            stats = self._stats(group, selector)
+            if hit:
+                stats["hits"] += 1
+                stats["consecutive_misses"] = 0
+            else:
+                stats["misses"] += 1
+                stats["consecutive_misses"] += 1
+            stats["recent_rate"] = (1 - RECENT_WEIGHT) * stats["recent_rate"] + RECENT_WEIGHT * (1.0 if hit else 0.0)
+
+            if hit and seconds is not None:
+                ms = seconds * 1000
+                stats["avg_ms"] = ms if stats["avg_ms"] is None else (1 - RECENT_WEIGHT) * stats["avg_ms"] + RECENT_WEIGHT * ms
+
+    def is_dead(self, group, selector):
+        """연속 실패가 기준 이상인 셀렉터인지 확인"""
+        stats = self.groups.get(group, {}).get(selector)
+        return stats is not None and stats["consecutive_misses"] >= DEAD_AFTER_MISSES
+
+    def rank(self, group, selectors):
+        """
+        최근 성공률이 높은 순으로 셀렉터 정렬 (같으면 빠른 셀렉터, 그다음 원래 순서)
+
+        Args:
+            group (str): 셀렉터 그룹
+            selectors (list): 원래 우선순위대로의 셀렉터 목록
+
+        Returns:
+            list: 시도할 순서대로 정렬된 셀렉터 목록
+        """
+        stats = self.groups.get(group, {})
+
+        def key(item):
+            index, selector = item
+            entry = stats.get(selector)
+            if entry is None:
+                return (False, -UNKNOWN_RATE, float('inf'), index)
+            avg_ms = entry["avg_ms"] if entry["avg_ms"] is not None else float('inf')
+            return (self.is_dead(group, selector), -entry["recent_rate"], avg_ms, index)
+
+        return [selector for _, selector in sorted(enumerate(selectors), key=key)]
+
+    def save(self):
+        """상태 파일을 원자적으로 저장"""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.groups, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+
+    def print_report(self):
+        """그룹별 셀렉터 상태 출력"""
+        for group, selectors in self.groups.items():
+            print(f"\n📊 셀렉터 상태 - {group}")
+            for selector in self.rank(group, list(selectors)):
+                entry = selectors[selector]
+                avg = f"{entry['avg_ms']:.0f}ms" if entry["avg_ms"] is not None else "-"
+                mark = "💀" if self.is_dead(group, selector) else "  "
+                print(
+                    f"   {mark} {selector:<35} 최근 성공률 {entry['recent_rate'] * 100:5.1f}% "
+                    f"(적중 {entry['hits']}, 실패 {entry['misses']}, 평균 {avg})"
+                )
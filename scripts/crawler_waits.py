@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+⏳ SCENT DESTINATION 크롤러 준비 상태 대기
+고정된 time.sleep 대신 페이지가 실제로 준비되는 순간을 감지하는 WebDriverWait 조건 모음
+"""
+
+import time
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+
+# 조건별 최대 대기 시간 (초) - 고정 대기가 아니라 상한선
+DEFAULT_CEILINGS = {
+    "search_panel": 10,
+    "search_results": 10,
+    "place_pane": 10,
+    "photos": 8,
+}
+
+PHOTO_SELECTOR = 'img[src*="googleusercontent.com"]'
+
+
+class search_panel_rendered:
+    """검색창이 렌더링되고 입력 가능한 상태인지 확인 (찾은 요소 반환)"""
+
+    def __init__(self, selectors=('input#searchboxinput',)):
+        self.selectors = selectors
+        self.matched_selector = None
+
+    def __call__(self, driver):
+        for selector in self.selectors:
+            for element in driver.find_elements(By.CSS_SELECTOR, selector):
+                try:
+                    if element.is_displayed() and element.is_enabled():
+                        self.matched_selector = selector
+                        return element
+                except StaleElementReferenceException:
+                    continue
+        return False
+
+
+class search_results_ready:
+    """
+    검색 후 결과 목록 또는 장소 패널이 뜰 때까지 대기
+
+    검색어가 하나의 장소로 바로 연결되면 결과 목록 없이 장소 패널이 열리므로 두 경우 모두 처리
+    반환값: "list" (결과 목록) 또는 "place" (장소 패널)
+    """
+
+    def __init__(self, result_selector='[data-result-index]'):
+        self.result_selector = result_selector
+
+    def __call__(self, driver):
+        if driver.find_elements(By.CSS_SELECTOR, self.result_selector):
+            return "list"
+        if place_pane_opened()(driver):
+            return "place"
+        return False
+
+
+class place_pane_opened:
+    """장소 상세 패널이 열렸는지 확인 (URL이 /maps/place/로 바뀌고 제목이 렌더링됨)"""
+
+    def __call__(self, driver):
+        if '/maps/place/' not in driver.current_url:
+            return False
+        titles = driver.find_elements(By.CSS_SELECTOR, 'div[role="main"] h1')
+        return titles[0] if titles else False
+
+
+class photos_decoded:
+    """
+    사진 img 요소가 존재하고 실제로 디코딩(naturalWidth > 0)될 때까지 대기
+    (decoded=False면 src만 있으면 됨 - 브라우저에서 사진 바이트를 차단한 경우)
+
+    min_count개가 디코딩되면 즉시 반환하고, 그보다 적더라도 개수가 settle초 동안
+    변하지 않으면 사진이 더 없는 것으로 보고 반환 (사진이 적은 장소에서 상한선까지 기다리지 않도록)
+    """
+
+    SCRIPT = """
+        const decoded = arguments[1];
+        return Array.from(document.querySelectorAll(arguments[0]))
+            .filter(img => !decoded || (img.complete && img.naturalWidth > 0));
+    """
+
+    def __init__(self, min_count=1, settle=0.5, selector=PHOTO_SELECTOR, decoded=True):
+        self.min_count = max(1, min_count)
+        self.settle = settle
+        self.selector = selector
+        self.decoded = decoded
+        self._last_count = None
+        self._stable_since = None
+
+    def __call__(self, driver):
+        images = driver.execute_script(self.SCRIPT, self.selector, self.decoded) or []
+        count = len(images)
+        if count >= self.min_count:
+            return images
+
+        now = time.monotonic()
+        if count != self._last_count:
+            self._last_count = count
+            self._stable_since = now
+            return False
+
+        if count > 0 and now - self._stable_since >= self.settle:
+            return images
+        return False
+
+
+class Readiness:
+    def __init__(self, driver, ceilings=None, poll_frequency=0.1, metrics=None):
+        """
+        준비 상태 대기 도우미 초기화
+
+        Args:
+            driver (WebDriver): Selenium 드라이버
+            ceilings (dict): 조건 이름별 최대 대기 시간 (DEFAULT_CEILINGS를 덮어씀)
+            poll_frequency (float): 조건 확인 주기 (초)
+            metrics (Metrics): 대기 시간을 함께 기록할 계측 저장소 (wait.<이름>)
+        """
+        self.driver = driver
+        self.ceilings = {**DEFAULT_CEILINGS, **(ceilings or {})}
+        self.poll_frequency = poll_frequency
+        self.metrics = metrics
+        self.timings = []
+
+    def wait_for(self, name, condition, ceiling=None):
+        """
+        조건이 만족될 때까지 대기하고 실제 걸린 시간을 기록
+
+        Args:
+            name (str): 조건 이름 (ceilings 키)
+            condition (callable): WebDriverWait 조건
+            ceiling (float): 이번 호출에만 적용할 최대 대기 시간
+
+        Returns:
+            조건이 반환한 값
+
+        Raises:
+            TimeoutException: 상한선 안에 조건이 만족되지 않은 경우
+        """
+        timeout = ceiling if ceiling is not None else self.ceilings.get(name, 10)
+        started = time.monotonic()
+        try:
+            value = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency).until(condition)
+            self.record(name, time.monotonic() - started, True)
+            return value
+        except TimeoutException:
+            self.record(name, time.monotonic() - started, False)
+            raise
+
+    def record(self, name, seconds, ok=True):
+        """대기 조건 밖에서 잰 구간 시간도 같은 리포트에 기록"""
+        self.timings.append({"name": name, "seconds": seconds, "ok": ok})
+        if self.metrics is not None:
+            self.metrics.observe(f"wait.{name}", seconds, ok=ok)
+
+    def last_place_report(self, since=0):
+        """since 인덱스 이후 기록된 대기 시간을 한 줄로 요약"""
+        parts = [
+            f"{t['name']} {t['seconds']:.2f}s" + ("" if t["ok"] else " ⌛")
+            for t in self.timings[since:]
+        ]
+        return ", ".join(parts)
+
+
+def summarize_timings(timings):
+    """
+    대기 기록들을 조건별로 집계
+
+    Returns:
+        dict: 조건 이름 -> {count, timeouts, total, max}
+    """
+    summary = {}
+    for t in timings:
+        entry = summary.setdefault(t["name"], {"count": 0, "timeouts": 0, "total": 0.0, "max": 0.0})
+        entry["count"] += 1
+        entry["total"] += t["seconds"]
+        entry["max"] = max(entry["max"], t["seconds"])
+        if not t["ok"]:
+            entry["timeouts"] += 1
+    return summary
+
+
+def print_wait_report(timings):
+    """조건별 실제 대기 시간 리포트 출력"""
+    summary = summarize_timings(timings)
+    if not summary:
+        return
+
+    print("\n⏳ 준비 상태 대기 시간 리포트")
+    for name, entry in summary.items():
+        average = entry["total"] / entry["count"]
+        print(
+            f"   {name:<15} 평균 {average:.2f}s / 최대 {entry['max']:.2f}s "
+            f"({entry['count']}회, 타임아웃 {entry['timeouts']}회)"
+        )
+
+
+def parse_ceilings(values):
+    """
+    'name=seconds' 형식의 명령행 값들을 ceilings dict로 변환
+
+    Raises:
+        ValueError: 형식이 잘못되었거나 알 수 없는 조건 이름인 경우
+    """
+    ceilings = {}
+    for value in values or []:
+        name, sep, seconds = value.partition('=')
+        if not sep or name not in DEFAULT_CEILINGS:
+            raise ValueError(f"잘못된 대기 상한선: {value} (사용 가능: {', '.join(DEFAULT_CEILINGS)})")
+        ceilings[name] = float(seconds)
+    return ceilings
@@ -3,31 +3,62 @@
 """
 🔧 SCENT DESTINATION Google Maps 이미지 크롤러 (디버깅 버전)
 더 안정적인 셀렉터와 긴 대기시간으로 DOM 구조 확인
+--batch로 실행하면 입력 대기 없이 headless 세션 여러 개로 많은 장소를 동시에 진단하고 리포트 하나로 모음
+(기록/재생(--record/--replay)은 메인 크롤러 전용 - 배치 진단은 항상 실제 페이지에서 셀렉터와 대기 시간을 잼)
 """
 
-import os
 import sys
 import time
-import json
-import requests
+import argparse
 from pathlib import Path
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+
+from crawler_extract import extract_page
+from crawler_network import normalize_photo_url
+from crawler_selectors import SelectorHealth
+from crawler_pool import CrawlerPool
+from crawler_dataset import SPACES_DATA_PATH, load_spaces_json
+from crawler_diagnostics import DiagnosticReport, DIAGNOSTICS_DIR, artifact_stem
+from crawler_waits import (
+    Readiness, search_panel_rendered, search_results_ready, photos_decoded, print_wait_report
+)
+
+# 테스트할 장소들 (배치 진단에서 spaces_data.json이 없을 때도 사용)
+TEST_PLACES = [
+    {"name": "연남서식", "region": "서울"},
+    {"name": "불국사", "region": "경주"},
+    {"name": "몽상드애월", "region": "제주"}
+]
 
 class GoogleMapsImageCrawlerDebug:
-    def __init__(self, headless=False):
-        """디버깅용 크롤러 초기화 (headless=False로 브라우저 보이게)"""
+    def __init__(self, headless=False, interactive=True, selector_health=None):
+        """
+        디버깅용 크롤러 초기화 (headless=False로 브라우저 보이게)
+        
+        Args:
+            headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+            interactive (bool): 단계마다 Enter 입력을 기다릴지 여부 (배치 진단은 False)
+            selector_health (SelectorHealth): 여러 세션이 공유할 셀렉터 상태 저장소 (없으면 새로 로드)
+        """
         self.download_dir = Path('public/images/places')
         self.download_dir.mkdir(parents=True, exist_ok=True)
+        self.interactive = interactive
         
         self.driver = self._setup_driver(headless)
         self.wait = WebDriverWait(self.driver, 20)  # 대기시간 20초로 증가
+        # 디버깅용이라 상한선은 넉넉하게, 준비되면 바로 진행
+        self.readiness = Readiness(self.driver, {"search_panel": 20, "search_results": 20, "photos": 10})
+        # 지난 실행들에서 잘 맞았던 셀렉터부터 시도
+        self.selector_health = selector_health or SelectorHealth()
+        # 현재 장소에서 시도한 셀렉터별 적중 여부 (배치 진단 리포트용)
+        self.place_selectors = {}
+        self.last_search_state = None
         
         print(f"🚀 Google Maps 디버깅 크롤러 초기화 완료!")
         print(f"📁 저장 디렉토리: {self.download_dir.absolute()}")
@@ -61,13 +92,12 @@ class GoogleMapsImageCrawlerDebug:
             # 구글 지도 접속
             print("🌐 구글 지도 접속 중...")
             self.driver.get('https://www.google.com/maps/')
-            time.sleep(5)  # 페이지 로딩 대기 시간 증가
             
             # 검색어 조합
             search_query = f"{place_name} {region}".strip()
             print(f"🔍 검색 중: {search_query}")
             
-            # 검색창 찾기 (여러 가지 셀렉터 시도)
+            # 검색창 찾기 (여러 가지 셀렉터를 한 번의 대기 안에서 동시에 확인)
             search_selectors = [
                 'input#searchboxinput',
                 'input[aria-label*="검색"]',
@@ -76,29 +106,38 @@ class GoogleMapsImageCrawlerDebug:
                 '#searchboxinput'
             ]
             
-            search_box = None
-            for selector in search_selectors:
-                try:
-                    search_box = self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    print(f"✅ 검색창 발견: {selector}")
-                    break
-                except TimeoutException:
-                    print(f"❌ 검색창 못찾음: {selector}")
-                    continue
-            
-            if not search_box:
+            ranked_selectors = self.selector_health.rank("search", search_selectors)
+            panel = search_panel_rendered(ranked_selectors)
+            try:
+                search_box = self.readiness.wait_for("search_panel", panel)
+                print(f"✅ 검색창 발견: {panel.matched_selector}")
+            except TimeoutException:
                 print("❌ 검색창을 찾을 수 없습니다")
+                self._record_selectors("search", {selector: False for selector in ranked_selectors})
                 return False
             
+            # 매칭된 셀렉터보다 앞 순위였던 셀렉터들은 실패로 기록
+            matched_index = ranked_selectors.index(panel.matched_selector)
+            self._record_selectors(
+                "search",
+                {selector: i == matched_index for i, selector in enumerate(ranked_selectors[:matched_index + 1])},
+                self.readiness.timings[-1]["seconds"]
+            )
+            
             # 검색어 입력
             search_box.clear()
             search_box.send_keys(search_query)
             search_box.send_keys(Keys.RETURN)
             
             print("⏳ 검색 결과 로딩 대기 중...")
-            time.sleep(8)  # 검색 결과 로딩 대기 시간 증가
+            self.last_search_state = None
+            try:
+                state = self.readiness.wait_for("search_results", search_results_ready())
+                self.last_search_state = state
+                print(f"✅ 검색 결과 준비됨: {'결과 목록' if state == 'list' else '장소 패널'}")
+            except TimeoutException:
+                # 결과 셀렉터가 바뀌었을 수 있으므로 find_first_result()에서 계속 확인
+                print("⚠️ 알려진 검색 결과 요소가 나타나지 않음, 계속 진행")
             
             return True
             
@@ -107,7 +146,7 @@ class GoogleMapsImageCrawlerDebug:
             return False
     
     def find_first_result(self):
-        """첫 번째 검색 결과 찾기 (여러 셀렉터 시도)"""
+        """첫 번째 검색 결과 찾기 (모든 후보 셀렉터를 한 번의 스크립트로 확인)"""
         print("🎯 첫 번째 검색 결과 찾는 중...")
         
         # 가능한 첫 번째 결과 셀렉터들
@@ -123,43 +162,54 @@ class GoogleMapsImageCrawlerDebug:
             '[jsaction*="mouseout"]'
         ]
         
-        for i, selector in enumerate(result_selectors):
+        ranked_selectors = self.selector_health.rank("result", result_selectors)
+        started = time.monotonic()
+        page = extract_page(self.driver, result_selectors=ranked_selectors)
+        self._record_selectors(
+            "result",
+            {result["selector"]: result["count"] > 0 for result in page["results"]},
+            time.monotonic() - started
+        )
+        
+        for i, result in enumerate(page["results"]):
+            selector = result["selector"]
+            if result["error"]:
+                print(f"❌ 셀렉터 {selector} 실패: {result['error']}")
+                continue
+            if not result["count"]:
+                print(f"🔍 ({i+1}) 없음: {selector}")
+                continue
+            
+            print(f"✅ 발견! 총 {result['count']}개 요소 - {selector}")
+            
+            # 요소 정보 출력 (스크립트가 함께 가져온 값이라 추가 왕복 없음)
+            print(f"   📍 요소 텍스트: {(result['text'] or '')[:100]}...")
+            print(f"   📍 요소 클래스: {result['className']}")
+            
+            # 클릭 시도
+            first_element = result["element"]
             try:
-                print(f"🔍 시도 중 ({i+1}): {selector}")
-                elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                if elements:
-                    print(f"✅ 발견! 총 {len(elements)}개 요소 - {selector}")
-                    first_element = elements[0]
-                    
-                    # 요소 정보 출력
-                    print(f"   📍 요소 텍스트: {first_element.text[:100]}...")
-                    print(f"   📍 요소 클래스: {first_element.get_attribute('class')}")
-                    
-                    # 클릭 시도
-                    try:
-                        self.driver.execute_script("arguments[0].scrollIntoView();", first_element)
-                        time.sleep(2)
-                        first_element.click()
-                        print(f"✅ 첫 번째 결과 클릭 성공!")
-                        return True
-                    except Exception as click_error:
-                        print(f"❌ 클릭 실패: {click_error}")
-                        continue
-                        
-            except Exception as e:
-                print(f"❌ 셀렉터 {selector} 실패: {e}")
+                self.driver.execute_script("arguments[0].scrollIntoView();", first_element)
+                WebDriverWait(self.driver, 2).until(EC.element_to_be_clickable(first_element))
+                first_element.click()
+                print(f"✅ 첫 번째 결과 클릭 성공!")
+                return True
+            except Exception as click_error:
+                print(f"❌ 클릭 실패: {click_error}")
                 continue
         
         print("❌ 첫 번째 검색 결과를 찾을 수 없음")
         return False
     
     def find_images(self):
-        """이미지 찾기 (여러 방법 시도)"""
+        """이미지 찾기 (모든 후보 셀렉터를 한 번의 스크립트로 확인)"""
         print("📸 이미지 찾는 중...")
         
-        # 이미지가 로딩될 때까지 대기
-        time.sleep(5)
+        # 이미지가 실제로 디코딩될 때까지 대기 (없으면 다른 셀렉터들로 계속 시도)
+        try:
+            self.readiness.wait_for("photos", photos_decoded(min_count=3))
+        except TimeoutException:
+            print("⚠️ googleusercontent 이미지가 디코딩되지 않음, 다른 셀렉터 시도")
         
         # 가능한 이미지 셀렉터들
         image_selectors = [
@@ -173,48 +223,65 @@ class GoogleMapsImageCrawlerDebug:
             'img[jsname]'
         ]
         
-        all_images = []
+        # 셀렉터당 최대 3개, src 기준 중복 제거는 브라우저 안에서 처리
+        ranked_selectors = self.selector_health.rank("image", image_selectors)
+        started = time.monotonic()
+        page = extract_page(self.driver, image_selectors=ranked_selectors, max_per_selector=3)
+        self._record_selectors(
+            "image",
+            {selector: count > 0 for selector, count in page["image_counts"].items()},
+            time.monotonic() - started
+        )
         
-        for selector in image_selectors:
-            try:
-                images = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                if images:
-                    print(f"✅ {len(images)}개 이미지 발견 - {selector}")
-                    for img in images[:3]:  # 최대 3개만
-                        src = img.get_attribute('src')
-                        if src and 'data:image' not in src:  # base64 이미지 제외
-                            all_images.append(src)
-                            print(f"   📸 이미지 URL: {src[:80]}...")
-                            
-            except Exception as e:
-                print(f"❌ 이미지 셀렉터 {selector} 실패: {e}")
-                continue
+        for selector, count in page["image_counts"].items():
+            if count < 0:
+                print(f"❌ 이미지 셀렉터 {selector} 실패")
+            elif count:
+                print(f"✅ {count}개 이미지 발견 - {selector}")
+        
+        for image in page["images"]:
+            print(f"   📸 이미지 URL ({image['width']}x{image['height']}): {image['src'][:80]}...")
         
-        # 중복 제거
-        unique_images = list(set(all_images))
+        # 같은 사진의 다른 크기/토큰 URL은 하나로 합침
+        unique_images = []
+        for image in page["images"]:
+            img_url = normalize_photo_url(image["src"])
+            if img_url not in unique_images:
+                unique_images.append(img_url)
         print(f"✅ 총 {len(unique_images)}개 고유 이미지 발견")
         
         return unique_images[:3]  # 최대 3개 반환
     
+    def _record_selectors(self, group, outcomes, seconds=None):
+        """셀렉터별 적중 여부를 상태 저장소에 기록"""
+        for selector, hit in outcomes.items():
+            self.selector_health.record(group, selector, hit, seconds if hit else None)
+        self.place_selectors.setdefault(group, {}).update(outcomes)
+    
+    def _pause(self, message):
+        """대화형 모드에서만 Enter 입력 대기"""
+        if self.interactive:
+            print(message)
+            input()
+    
     def debug_single_place(self, place_name, region=""):
         """단일 장소 디버깅"""
         print(f"\n🎯 '{place_name}' 디버깅 시작...")
+        timing_start = len(self.readiness.timings)
         
         # 1단계: 검색
         if not self.search_place(place_name, region):
             print("❌ 검색 실패")
             return False
         
-        print("⏸️  검색 완료! 결과를 확인하세요. 계속하려면 Enter를 누르세요...")
-        input()  # 사용자 입력 대기
+        self._pause("⏸️  검색 완료! 결과를 확인하세요. 계속하려면 Enter를 누르세요...")
         
         # 2단계: 첫 번째 결과 클릭
         if not self.find_first_result():
             print("❌ 첫 번째 결과 클릭 실패")
             return False
         
-        print("⏸️  첫 번째 결과 클릭 완료! 장소 페이지를 확인하세요. 계속하려면 Enter를 누르세요...")
-        input()  # 사용자 입력 대기
+        self._pause("⏸️  첫 번째 결과 클릭 완료! 장소 페이지를 확인하세요. 계속하려면 Enter를 누르세요...")
         
         # 3단계: 이미지 찾기
         images = self.find_images()
@@ -226,12 +293,89 @@ class GoogleMapsImageCrawlerDebug:
         for i, img_url in enumerate(images):
             print(f"   {i+1}. {img_url}")
         
+        print(f"⏳ 대기: {self.readiness.last_place_report(timing_start)}")
         return True
     
+    def diagnose_place(self, place_name, region="", artifacts_dir=DIAGNOSTICS_DIR):
+        """
+        입력 대기 없이 장소 하나를 진단 (배치 진단 워커에서 호출)
+        
+        Args:
+            place_name (str): 장소명
+            region (str): 지역명
+            artifacts_dir (str): 실패 시 DOM 스냅샷(HTML)과 스크린샷(PNG)을 저장할 디렉토리
+        
+        Returns:
+            dict: {name, region, ok, failed_step, steps, waits, selectors, images, artifacts}
+        """
+        timing_start = len(self.readiness.timings)
+        self.place_selectors = {}
+        diagnosis = {
+            "name": place_name,
+            "region": region,
+            "ok": False,
+            "failed_step": None,
+            "steps": [],
+            "images": 0,
+            "artifacts": [],
+        }
+        
+        def step(name, action):
+            started = time.monotonic()
+            try:
+                value = action()
+            except Exception as e:
+                print(f"❌ {name} 단계 오류: {e}")
+                value = None
+            diagnosis["steps"].append({"name": name, "ok": bool(value), "seconds": time.monotonic() - started})
+            if not value:
+                diagnosis["failed_step"] = name
+                diagnosis["artifacts"] = self._capture_failure(artifact_stem(place_name, region), name, artifacts_dir)
+            return value
+        
+        images = None
+        if step("search", lambda: self.search_place(place_name, region)):
+            # 검색어가 장소 페이지로 바로 연결되면 결과 클릭 단계는 없음
+            if self.last_search_state == "place" or step("first_result", self.find_first_result):
+                images = step("images", self.find_images)
+        
+        diagnosis["ok"] = bool(images)
+        diagnosis["images"] = len(images or [])
+        diagnosis["waits"] = self.readiness.timings[timing_start:]
+        diagnosis["selectors"] = self.place_selectors
+        return diagnosis
+    
+    def _capture_failure(self, stem, step_name, artifacts_dir):
+        """실패한 단계의 DOM 스냅샷과 스크린샷 저장"""
+        directory = Path(artifacts_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        artifacts = []
+        try:
+            html_path = directory / f"{stem}-{step_name}.html"
+            html_path.write_text(self.driver.page_source, encoding='utf-8')
+            artifacts.append(str(html_path))
+            png_path = directory / f"{stem}-{step_name}.png"
+            if self.driver.save_screenshot(str(png_path)):
+                artifacts.append(str(png_path))
+        except Exception as e:
+            print(f"⚠️ 실패 산출물 저장 실패: {e}")
+        return artifacts
+    
+    def is_alive(self):
+        """드라이버 세션이 살아있는지 확인 (크래시 감지용)"""
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+    
     def close(self):
         """드라이버 종료"""
-        print("⏸️  브라우저를 닫으려면 Enter를 누르세요...")
-        input()
+        if self.interactive:
+            print_wait_report(self.readiness.timings)
+            self.selector_health.print_report()
+            self.selector_health.save()
+        self._pause("⏸️  브라우저를 닫으려면 Enter를 누르세요...")
         if self.driver:
             self.driver.quit()
             print("🔚 크롤러 종료")
@@ -243,14 +387,7 @@ def debug_specific_place():
     crawler = GoogleMapsImageCrawlerDebug(headless=False)
     
     try:
-        # 테스트할 장소들
-        test_places = [
-            {"name": "연남서식", "region": "서울"},
-            {"name": "불국사", "region": "경주"},
-            {"name": "몽상드애월", "region": "제주"}
-        ]
-        
-        for place in test_places:
+        for place in TEST_PLACES:
             success = crawler.debug_single_place(place["name"], place["region"])
             print(f"{'✅ 성공' if success else '❌ 실패'}: {place['name']}")
             
@@ -267,5 +404,93 @@ def debug_specific_place():
     finally:
         crawler.close()
 
+def run_batch_diagnostics(places, workers=4, headless=True, output_dir=DIAGNOSTICS_DIR):
+    """
+    입력 대기 없이 여러 장소를 동시에 진단하고 리포트 하나로 모음
+    
+    Args:
+        places (list): 진단할 장소들 ({name, region})
+        workers (int): 동시에 띄울 Chrome 세션 수
+        headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+        output_dir (str): 리포트와 실패 산출물을 저장할 디렉토리
+    
+    Returns:
+        DiagnosticReport: 진단 결과
+    """
+    print(f"🩺 배치 진단 시작: {len(places)}개 장소, 워커 {workers}개")
+    
+    # 모든 세션이 셀렉터 상태를 공유해서 실행 끝에 한 번만 저장
+    selector_health = SelectorHealth()
+    report = DiagnosticReport(output_dir)
+    pool = CrawlerPool(
+        factory=lambda: GoogleMapsImageCrawlerDebug(
+            headless=headless, interactive=False, selector_health=selector_health
+        ),
+        size=workers,
+        is_healthy=lambda crawler: crawler.is_alive()
+    )
+    
+    def on_result(result):
+        place = result["job"]
+        if result["error"] is not None:
+            # 세션이 반복적으로 죽은 경우 (단계 오류는 diagnose_place 안에서 기록됨)
+            diagnosis = {
+                "name": place["name"], "region": place.get("region", ""), "ok": False,
+                "failed_step": f"session: {result['error']}", "steps": [], "images": 0, "artifacts": [],
+            }
+        else:
+            diagnosis = result["value"]
+        report.add(diagnosis)
+        print(f"[{len(report.places)}/{len(places)}] {'✅' if diagnosis['ok'] else '❌'} {place['name']} (워커 {result['worker']})")
+    
+    try:
+        if pool.start() == 0:
+            print("❌ 사용할 수 있는 크롤러 세션이 없습니다")
+            return report
+        pool.run(
+            places,
+            lambda crawler, place: crawler.diagnose_place(place["name"], place.get("region", ""), output_dir),
+            on_result=on_result
+        )
+    except KeyboardInterrupt:
+        print("\n⚠️ 사용자에 의해 중단됨")
+    finally:
+        pool.close()
+        selector_health.save()
+        report.print_report()
+        print(f"\n📝 진단 리포트: {report.save()}")
+    return report
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="SCENT DESTINATION Google Maps 크롤러 디버깅")
+    parser.add_argument(
+        '--batch', action='store_true',
+        help="입력 대기 없이 headless 세션 여러 개로 장소들을 동시에 진단하고 리포트 생성"
+    )
+    parser.add_argument('--workers', type=int, default=4, help="배치 진단에서 동시에 띄울 Chrome 세션 수 (기본: 4)")
+    parser.add_argument('--limit', type=int, help="배치 진단할 최대 장소 수")
+    parser.add_argument('--region', action='append', help="이 지역의 장소만 진단 (여러 번 지정 가능)")
+    parser.add_argument('--show-browser', action='store_true', help="배치 진단에서도 브라우저 창 표시")
+    parser.add_argument(
+        '--output', default=DIAGNOSTICS_DIR,
+        help=f"진단 리포트와 실패 시 DOM/스크린샷을 저장할 디렉토리 (기본: {DIAGNOSTICS_DIR})"
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers는 1 이상이어야 합니다")
+    return args
+
 if __name__ == "__main__":
-    debug_specific_place() 
\ No newline at end of file
+    args = parse_args()
+    if not args.batch:
+        debug_specific_place()
+        sys.exit(0)
+    
+    # spaces_data.json이 있으면 전체 카탈로그, 없으면 테스트 장소들
+    places = load_spaces_json() if Path(SPACES_DATA_PATH).exists() else TEST_PLACES
+    if args.region:
+        places = [place for place in places if place.get("region") in args.region]
+    if args.limit:
+        places = places[:args.limit]
+    run_batch_diagnostics(places, args.workers, headless=not args.show_browser, output_dir=args.output)
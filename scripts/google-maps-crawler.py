@@ -9,8 +9,8 @@ import os
 import sys
 import time
 import json
-import requests
-import pandas as pd
+import shutil
+import argparse
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -21,22 +21,116 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
+
+from crawler_pool import CrawlerPool
+from crawler_waits import (
+    Readiness, search_panel_rendered, search_results_ready, place_pane_opened, photos_decoded,
+    print_wait_report, parse_ceilings, summarize_timings
+)
+from crawler_downloads import ImageDownloader, ChecksumStore
+from crawler_manifest import (
+    CrawlManifest, select_pending, verify_manifest, STATUS_COMPLETE, STATUS_PARTIAL, STATUS_FAILED
+)
+from crawler_network import (
+    NetworkPhotoCollector, network_photos_collected, enable_performance_log, normalize_photo_url,
+    apply_lean_options, apply_lean_blocking
+)
+from crawler_extract import extract_page
+from crawler_resolver import PlaceUrlCache, build_search_url, MAPS_HOST, MAPS_URL
+from crawler_ratelimit import RateLimiter, CircuitBreaker, backoff_delay, host_of, DEFAULT_CEILING
+from crawler_metrics import Metrics, TRACE_PATH, REPORT_PATH, load_report
+from crawler_queue import LeaseQueue, open_work_queue, print_queue_status, DEFAULT_LEASE_TIMEOUT
+from crawler_profile import ProfilePool, PROFILE_DIR, is_warm
+from crawler_catalog import update_catalog, CATALOG_PATH
+from crawler_replay import ReplayArchive, mount_archive, REPLAY_DIR
+from crawler_memory import RecyclePolicy, DEFAULT_RECYCLE_AFTER, DEFAULT_MAX_BROWSER_MB
+from crawler_postprocess import ImagePostProcessor, DEFAULT_WIDTHS, DEFAULT_FORMATS
+from crawler_dataset import (
+    SPACES_DATA_PATH, SNAPSHOT_PATH, load_spaces_json, load_snapshot, save_snapshot, diff_spaces,
+    space_key, snapshot_entry
+)
 
 class GoogleMapsImageCrawler:
-    def __init__(self, headless=True, download_dir='public/images/places'):
+    def __init__(self, headless=True, download_dir='public/images/places', wait_ceilings=None,
+                 downloader=None, background_downloads=False, manifest=None, extraction='dom',
+                 lean=False, skip_images=False, measure_network=False, navigation='direct', place_cache=None,
+                 postprocessor=None, spare_images=0, ranker=None, candidates=12, metrics=None, maps_url=MAPS_URL,
+                 leases=None, profiles=None, recorder=None):
         """
         구글 지도 이미지 크롤러 초기화
         
         Args:
             headless (bool): 브라우저를 숨김 모드로 실행할지 여부
             download_dir (str): 이미지 저장 디렉토리
+            wait_ceilings (dict): 준비 상태 조건별 최대 대기 시간 (초)
+            downloader (ImageDownloader): 공유 다운로더 (없으면 크롤러 전용으로 생성)
+            background_downloads (bool): 다운로드 완료를 기다리지 않고 다음 장소로 넘어갈지 여부
+            manifest (CrawlManifest): 장소별 진행 상태를 기록할 manifest (없으면 기록 안 함)
+            extraction (str): 사진 URL 수집 방식 ('dom': img 요소 탐색, 'network': CDP 네트워크 이벤트)
+            lean (bool): 지도 타일/폰트/미디어/트래킹 요청을 차단하는 lean 브라우저 프로필 사용
+            skip_images (bool): lean 프로필에서 사진 바이트도 차단 (URL만 수집, 파일은 download_image()가 받음)
+            measure_network (bool): 장소별 전송 바이트 측정을 위해 performance 로그를 켤지 여부
+            navigation (str): 장소 이동 방식 ('direct': 검색/장소 URL로 바로 이동, 'home': 지도 홈에서 검색창 입력)
+            place_cache (PlaceUrlCache): 장소 URL 캐시 (direct 방식에서 사용)
+            postprocessor (ImagePostProcessor): 다운로드된 이미지를 리사이즈/인코딩할 후처리 풀
+            spare_images (int): 중복/실패한 이미지를 대신할 예비 후보 URL 수
+            ranker (CandidateRanker): 썸네일 품질 점수로 후보를 정렬할 순위 매기기 (없으면 수집 순서)
+            candidates (int): ranker 사용 시 장소당 수집할 후보 사진 수
+            metrics (Metrics): 단계별 시간/카운터를 기록할 계측 저장소 (없으면 크롤러 전용으로 생성)
+            maps_url (str): 지도 기본 URL (오프라인 벤치마크에서는 로컬 대역 서버 주소)
+            leases (LeaseQueue): 분산 작업 큐 임대 (장소 기록이 끝나면 결과를 보고)
+            profiles (ProfilePool): 디스크에 남겨둔 브라우저 프로필 (없으면 매번 빈 프로필로 시작)
+            recorder (ReplayArchive): 장소별 페이지 스냅샷과 후보 목록을 기록할 보관소 (재생 모드용)
         """
         self.download_dir = Path(download_dir)
         self.download_dir.mkdir(parents=True, exist_ok=True)
         
-        self.driver = self._setup_driver(headless)
+        self.owns_downloader = downloader is None
+        self.downloader = downloader or ImageDownloader()
+        self.background_downloads = background_downloads
+        self.manifest = manifest
+        self.extraction = extraction
+        self.lean = lean
+        self.skip_images = lean and skip_images
+        self.measure_network = measure_network or extraction == 'network'
+        self.navigation = navigation
+        self.place_cache = place_cache
+        self.postprocessor = postprocessor
+        self.spare_images = max(0, spare_images)
+        self.ranker = ranker
+        self.candidates = candidates
+        self._navigation_started = None
+        self.current_place_key = None
+        self.timeout_streak = 0
+        self.metrics = metrics or Metrics()
+        self.maps_url = maps_url
+        self.leases = leases
+        self.profiles = profiles
+        self.profile_dir = profiles.acquire() if profiles else None
+        self.profile_warm = self.profile_dir is not None and is_warm(self.profile_dir)
+        self.created = time.monotonic()
+        self._first_place = True
+        self.recorder = recorder
+        self.last_extraction = None
+        # 이 세션이 처리한 장소 수 (드라이버 재시작 기준)
+        self.places_done = 0
+        
+        try:
+            with self.metrics.timer("setup_driver", warm=self.profile_warm):
+                self.driver = self._setup_driver(headless)
+        except BaseException:
+            # 드라이버를 못 띄우면 (_setup_driver의 sys.exit 포함) 빌린 프로필과 전용 다운로더를 돌려놓고 다시 던짐
+            if self.owns_downloader:
+                self.downloader.close()
+            if self.profiles and self.profile_dir:
+                self.profiles.release(self.profile_dir)
+                self.profile_dir = None
+            raise
         self.wait = WebDriverWait(self.driver, 10)
+        self.readiness = Readiness(self.driver, wait_ceilings, metrics=self.metrics)
+        self.last_search_state = None
+        self.network_photos = NetworkPhotoCollector(self.driver) if self.measure_network else None
         
         print(f"🚀 Google Maps 이미지 크롤러 초기화 완료!")
         print(f"📁 저장 디렉토리: {self.download_dir.absolute()}")
@@ -56,12 +150,24 @@ class GoogleMapsImageCrawler:
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
+        # 이전 실행의 캐시/쿠키가 남은 프로필로 시작 (동의 페이지, 지도 JS 번들, 폰트를 다시 받지 않음)
+        if self.profile_dir:
+            options.add_argument(f'--user-data-dir={self.profile_dir.absolute()}')
+        
         # User-Agent 설정
         options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
         
+        # 네트워크 수집 방식과 전송량 측정은 CDP Network 이벤트가 담기는 performance 로그가 필요
+        if self.measure_network:
+            enable_performance_log(options)
+        if self.lean:
+            apply_lean_options(options)
+        
         try:
             driver = webdriver.Chrome(options=options)
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            if self.lean:
+                apply_lean_blocking(driver, self.skip_images)
             return driver
         except Exception as e:
             print(f"❌ Chrome 드라이버 설정 실패: {e}")
@@ -81,25 +187,22 @@ class GoogleMapsImageCrawler:
         Returns:
             bool: 검색 성공 여부
         """
+        # 검색어 조합
+        search_query = f"{place_name} {region}".strip()
+        
         try:
             # 구글 지도 접속
-            self.driver.get('https://www.google.com/maps/')
-            time.sleep(2)
-            
-            # 검색어 조합
-            search_query = f"{place_name} {region}".strip()
+            self.driver.get(self.maps_url)
             print(f"🔍 검색 중: {search_query}")
             
-            # 검색창 찾기 및 입력
-            search_box = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'input#searchboxinput'))
-            )
+            # 검색창이 입력 가능한 상태가 될 때까지 대기
+            search_box = self.readiness.wait_for("search_panel", search_panel_rendered())
             search_box.clear()
             search_box.send_keys(search_query)
             search_box.send_keys(Keys.RETURN)
             
-            # 검색 결과 로딩 대기
-            time.sleep(3)
+            # 검색 결과 목록 또는 장소 패널이 뜰 때까지 대기
+            self.last_search_state = self.readiness.wait_for("search_results", search_results_ready())
             
             return True
             
@@ -110,6 +213,72 @@ class GoogleMapsImageCrawler:
             print(f"❌ '{search_query}' 검색 중 오류: {e}")
             return False
     
+    def open_place(self, place_name, region="", cache_key=None):
+        """
+        장소 페이지 열기 (navigation 방식에 따라 캐시된 장소 URL → 검색 URL → 지도 홈 검색 순)
+        
+        Args:
+            place_name (str): 장소명
+            region (str): 지역명
+            cache_key (str): 장소 URL 캐시 키 (english_name)
+        
+        Returns:
+            bool: 장소 패널 또는 검색 결과까지 열렸는지 여부
+        """
+        self.current_place_key = cache_key
+        
+        if self.navigation == 'home':
+            self._navigation_started = ("home", time.monotonic())
+            started = time.monotonic()
+            found = self.search_place(place_name, region)
+            self.metrics.observe("search_place", time.monotonic() - started, ok=found, place=place_name)
+            return found
+        
+        # 캐시된 장소 URL이 있으면 장소 페이지를 한 번에 열기
+        cached_url = self.place_cache.get(cache_key) if self.place_cache and cache_key else None
+        if cached_url:
+            self._navigation_started = ("cached", time.monotonic())
+            try:
+                self.driver.get(cached_url)
+                self.readiness.wait_for("place_pane", place_pane_opened())
+                self.last_search_state = "place"
+                print(f"🧭 캐시된 장소 URL로 이동: {place_name}")
+                return True
+            except TimeoutException:
+                print(f"⚠️ 캐시된 장소 URL이 열리지 않아 검색으로 전환: {place_name}")
+                self.place_cache.forget(cache_key)
+        
+        # 검색 URL로 바로 이동 (결과가 하나면 장소 페이지로 바로 연결됨)
+        self._navigation_started = ("search_url", time.monotonic())
+        search_url = build_search_url(place_name, region, self.maps_url)
+        print(f"🔍 검색 URL로 이동: {place_name} {region}".rstrip())
+        try:
+            self.driver.get(search_url)
+            self.last_search_state = self.readiness.wait_for("search_results", search_results_ready())
+            return True
+        except TimeoutException:
+            print(f"❌ '{place_name}' 검색 실패: 타임아웃")
+            return False
+        except Exception as e:
+            print(f"❌ '{place_name}' 검색 중 오류: {e}")
+            return False
+    
+    def _on_place_ready(self):
+        """장소 패널이 열린 시점: 이동 시간을 기록하고 장소 URL을 캐시에 저장"""
+        if self._navigation_started:
+            mode, started = self._navigation_started
+            self.readiness.record(f"to_place[{mode}]", time.monotonic() - started)
+            self._navigation_started = None
+        
+        # 드라이버 시작부터 첫 장소가 열리기까지 (cold/warm 프로필 비교용)
+        if self._first_place:
+            self._first_place = False
+            self.metrics.observe("first_place", time.monotonic() - self.created, warm=self.profile_warm)
+        
+        if self.place_cache is not None and self.current_place_key:
+            self.place_cache.set(self.current_place_key, self.driver.current_url)
+        self.current_place_key = None
+    
     def get_place_images(self, max_images=3):
         """
         검색된 장소의 이미지 URL들 수집
@@ -120,41 +289,36 @@ class GoogleMapsImageCrawler:
         Returns:
             list: 이미지 URL 리스트
         """
-        image_urls = []
-        
         try:
-            # 첫 번째 검색 결과 클릭
-            first_result = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-result-index="1"]'))
-            )
-            first_result.click()
-            time.sleep(3)
+            # 검색어가 장소로 바로 연결된 경우가 아니면 첫 번째 검색 결과 클릭
+            if self.last_search_state != "place":
+                # 결과 목록의 썸네일 응답은 버리고 장소 패널부터 수집
+                if self.network_photos:
+                    self.network_photos.reset()
+                first_result = self.wait.until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, '[data-result-index="1"]'))
+                )
+                first_result.click()
+            
+            # 장소 패널이 열릴 때까지 대기 (캐시된 URL로 연 경우에는 이미 열려 있음)
+            self.readiness.wait_for("place_pane", place_pane_opened())
+            self._on_place_ready()
             
             # 이미지 섹션으로 이동
             try:
                 # 사진 탭 찾기
                 photos_button = self.driver.find_element(By.XPATH, '//button[contains(@data-tab-index, "1")]')
                 photos_button.click()
-                time.sleep(2)
             except NoSuchElementException:
                 print("📷 사진 탭을 찾을 수 없음, 기본 이미지 수집 시도")
             
-            # 이미지 요소들 찾기
-            image_elements = self.driver.find_elements(By.CSS_SELECTOR, 'img[src*="googleusercontent.com"]')
+            if self.extraction == 'network':
+                image_urls = self._collect_network_photo_urls(max_images)
+            else:
+                image_urls = self._collect_dom_photo_urls(max_images)
             
-            for i, img_element in enumerate(image_elements[:max_images]):
-                try:
-                    img_url = img_element.get_attribute('src')
-                    if img_url and 'googleusercontent.com' in img_url:
-                        # 고해상도 이미지 URL로 변환
-                        if '=w' in img_url:
-                            img_url = img_url.split('=w')[0] + '=w1200-h800'
-                        image_urls.append(img_url)
-                        print(f"  📸 이미지 {i+1} URL 수집: {img_url[:80]}...")
-                        
-                except Exception as e:
-                    print(f"  ⚠️ 이미지 {i+1} URL 추출 실패: {e}")
-                    continue
+            for i, img_url in enumerate(image_urls):
+                print(f"  📸 이미지 {i+1} URL 수집: {img_url[:80]}...")
             
             print(f"✅ 총 {len(image_urls)}개 이미지 URL 수집")
             return image_urls
@@ -166,6 +330,31 @@ class GoogleMapsImageCrawler:
             print(f"❌ 이미지 수집 중 오류: {e}")
             return []
     
+    def _collect_dom_photo_urls(self, max_images):
+        """img 요소의 src에서 사진 URL 수집 (src 추출은 한 번의 스크립트로 처리)"""
+        # 사진이 실제로 디코딩될 때까지 대기 (사진이 적으면 개수가 안정되는 시점에 반환)
+        try:
+            self.readiness.wait_for(
+                "photos", photos_decoded(min_count=max_images, decoded=not self.skip_images)
+            )
+        except TimeoutException:
+            pass
+        
+        page = extract_page(self.driver, image_selectors=['img[src*="googleusercontent.com"]'])
+        self.last_extraction = {"images": page["images"], "image_counts": page["image_counts"]}
+        return photo_urls_from_page(page, max_images)
+    
+    def _collect_network_photo_urls(self, max_images):
+        """CDP Network.responseReceived 이벤트에서 사진 URL 수집 (max_images개가 모이면 즉시 반환)"""
+        try:
+            image_urls = self.readiness.wait_for(
+                "photos", network_photos_collected(self.network_photos, max_images)
+            )
+        except TimeoutException:
+            image_urls = self.network_photos.urls[:max_images]
+        self.last_extraction = {"network_urls": list(self.network_photos.urls)}
+        return image_urls
+    
     def download_image(self, img_url, file_path):
         """
         이미지 다운로드
@@ -177,23 +366,8 @@ class GoogleMapsImageCrawler:
         Returns:
             bool: 다운로드 성공 여부
         """
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            response = requests.get(img_url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-            
-            print(f"  💾 저장 완료: {file_path.name}")
-            return True
-            
-        except Exception as e:
-            print(f"  ❌ 다운로드 실패: {e}")
-            return False
+        # 공유 세션(keep-alive)과 호스트별 동시성 제한은 다운로더가 담당
+        return self.downloader.fetch(img_url, file_path)
     
     def crawl_place_images(self, place_name, region="", english_name="", max_images=3):
         """
@@ -206,45 +380,223 @@ class GoogleMapsImageCrawler:
             max_images (int): 수집할 이미지 수
             
         Returns:
-            int: 성공적으로 다운로드된 이미지 수
+            int: 성공적으로 다운로드된 이미지 수 (background_downloads=True면 예약된 이미지 수)
         """
         print(f"\n🎯 '{place_name}' 이미지 수집 시작...")
+        timing_start = len(self.readiness.timings)
+        self.places_done += 1
+        
+        # 이전 장소에서 쌓인 네트워크 이벤트 비우기
+        if self.network_photos:
+            self.network_photos.reset()
         
-        # 검색 실행
-        if not self.search_place(place_name, region):
+        # 장소 페이지 열기
+        started = time.monotonic()
+        opened = self.open_place(place_name, region, cache_key=english_name)
+        self.metrics.observe("open_place", time.monotonic() - started, ok=opened, place=place_name)
+        if not opened:
+            self._record_snapshot(english_name, place_name, region, False)
+            self._record_place(english_name, place_name, region, [], [])
             return 0
+        list_page = self.driver.page_source if self.recorder and self.last_search_state == "list" else None
         
-        # 이미지 URL 수집
-        image_urls = self.get_place_images(max_images)
+        # 이미지 URL 수집 (순위를 매길 후보, 중복으로 거부될 때 대신 받을 예비 후보까지)
+        pool_size = max_images + self.spare_images
+        if self.ranker:
+            pool_size = max(pool_size, self.candidates)
+        started = time.monotonic()
+        image_urls = self.get_place_images(pool_size)
+        self.metrics.observe(
+            "get_place_images", time.monotonic() - started, ok=bool(image_urls),
+            place=place_name, urls=len(image_urls)
+        )
+        print(f"  ⏳ 대기: {self.readiness.last_place_report(timing_start)}")
+        self._record_snapshot(english_name, place_name, region, True, image_urls, list_page)
         if not image_urls:
             print(f"❌ '{place_name}' 이미지를 찾을 수 없음")
+            self._record_place(english_name, place_name, region, [], [])
             return 0
         
-        # 이미지 다운로드
-        success_count = 0
-        for i, img_url in enumerate(image_urls):
-            file_name = f"{english_name}-{i+1}.jpg"
-            file_path = self.download_dir / file_name
-            
-            if self.download_image(img_url, file_path):
-                success_count += 1
-            
-            # 과도한 요청 방지
-            time.sleep(1)
+        # 다시 받는 장소는 덮어쓸 이전 파일과 비교해서 거부하지 않도록 인덱스에서 먼저 제거
+        if self.downloader.dedup is not None:
+            self.downloader.dedup.forget_owner(english_name)
+        
+        def on_downloaded(_, results):
+            self._record_place(english_name, place_name, region, image_urls, results)
+            # CPU 작업(디코딩/리사이즈/인코딩)은 프로세스 풀로 넘김
+            if self.postprocessor:
+                for result in results:
+                    if result:
+                        self.postprocessor.submit(self.download_dir / result["file"])
+        
+        def schedule(ordered_urls):
+            # 이미지 다운로드 예약 (완료 메시지는 다운로더가 출력)
+            downloads = [
+                (img_url, self.download_dir / f"{english_name}-{i+1}.jpg")
+                for i, img_url in enumerate(ordered_urls[:max_images])
+            ]
+            return self.downloader.submit_place(
+                place_name, downloads, on_complete=on_downloaded,
+                spare_urls=ordered_urls[max_images:max_images + self.spare_images]
+            )
         
-        print(f"✨ '{place_name}' 완료: {success_count}/{len(image_urls)} 이미지 저장")
-        return success_count
+        if self.ranker:
+            # 썸네일로 순위를 매긴 뒤 상위 N장만 원본 크기로 다운로드 (둘 다 백그라운드)
+            scheduled = self.ranker.submit(place_name, image_urls, schedule)
+            if self.background_downloads:
+                queued = min(max_images, len(image_urls))
+                print(f"📥 '{place_name}' 후보 {len(image_urls)}장 중 상위 {queued}장 백그라운드 다운로드 예약")
+                return queued
+            futures = scheduled.result()
+        else:
+            futures = schedule(image_urls)
+        
+        if self.background_downloads:
+            # 브라우저는 바로 다음 장소로 이동
+            print(f"📥 '{place_name}' 이미지 {len(futures)}개 백그라운드 다운로드 예약")
+            return len(futures)
+        
+        return sum(1 for future in futures if future.result())
+    
+    def _record_snapshot(self, english_name, place_name, region, opened, image_urls=(), list_page=None):
+        """기록 모드: 장소 페이지 HTML, 추출 원본, 후보 목록을 보관소에 저장"""
+        if self.recorder is None:
+            return
+        
+        pages = {"list": list_page}
+        if opened:
+            try:
+                pages["place"] = self.driver.page_source
+            except WebDriverException:
+                pass
+        self.recorder.record_place(
+            english_name, place_name, region, opened,
+            pages=pages, extraction=self.last_extraction if opened else None, candidates=image_urls
+        )
+        self.last_extraction = None
+    
+    def _record_place(self, english_name, place_name, region, image_urls, results):
+        """장소 하나의 크롤링 결과를 manifest와 작업 큐에 기록 (다운로드가 모두 끝난 뒤 호출)"""
+        if self.manifest is None and self.leases is None:
+            return
+        
+        saved = [r for r in results if r]
+        if results and len(saved) == len(results):
+            status = STATUS_COMPLETE
+        elif saved:
+            status = STATUS_PARTIAL
+        else:
+            status = STATUS_FAILED
+        
+        if self.manifest is not None:
+            self.manifest.record(
+                english_name,
+                status,
+                name=place_name,
+                region=region,
+                urls=image_urls,
+                files=saved
+            )
+        if self.leases is not None:
+            self.leases.finish(english_name, status, {"files": saved})
+    
+    def is_alive(self):
+        """드라이버 세션이 살아있는지 확인 (크래시 감지용)"""
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException:
+            return False
     
     def close(self):
         """드라이버 종료"""
+        if self.owns_downloader:
+            self.downloader.close()
         if self.driver:
             self.driver.quit()
             print("🔚 크롤러 종료")
+        if self.profiles and self.profile_dir:
+            self.profiles.release(self.profile_dir)
+            self.profile_dir = None
+
+class ReplayCrawler(GoogleMapsImageCrawler):
+    """
+    기록 보관소의 장소 기록을 브라우저 없이 되돌려주는 크롤러 (--replay)
+    후보 목록은 기록해 둔 추출 원본을 실제 크롤링과 같은 파싱 코드(photo_urls_from_page)에 다시 넣어서 만들고,
+    이후 순위 매기기 / 다운로드 / 후처리는 그대로 실행 (이미지 응답은 다운로더 세션의 ReplayAdapter가 돌려줌)
+    """
+    
+    def __init__(self, archive, **kwargs):
+        """
+        Args:
+            archive (ReplayArchive): 기록 보관소
+            **kwargs: GoogleMapsImageCrawler 인자 (브라우저 관련 인자는 무시)
+        """
+        self.archive = archive
+        self.entry = None
+        super().__init__(**kwargs)
+        self.network_photos = None
+    
+    def _setup_driver(self, headless=True):
+        return None
+    
+    def open_place(self, place_name, region="", cache_key=None):
+        self.entry = self.archive.place(cache_key)
+        if self.entry is None:
+            print(f"📼 기록 없음: {place_name}")
+            return False
+        self.last_search_state = "place"
+        return self.entry["opened"]
+    
+    def get_place_images(self, max_images=3):
+        extraction = self.entry.get("extraction") or {}
+        if "network_urls" in extraction:
+            image_urls = extraction["network_urls"][:max_images]
+        elif "images" in extraction:
+            image_urls = photo_urls_from_page(extraction, max_images)
+        else:
+            image_urls = self.entry["candidates"][:max_images]
+        print(f"✅ 총 {len(image_urls)}개 이미지 URL 재생")
+        return image_urls
+    
+    def is_alive(self):
+        return True
+
+def photo_urls_from_page(page, max_images):
+    """
+    extract_page() 결과에서 사진 URL 정리 (실제 크롤링과 재생 모드가 같은 코드 사용)
+    
+    Args:
+        page (dict): extract_page() 결과 (images: [{src, ...}])
+        max_images (int): 최대 URL 수
+    
+    Returns:
+        list: 고해상도로 정규화한 사진 URL (같은 사진의 다른 크기 변형은 하나로 합침)
+    """
+    image_urls = []
+    for image in page["images"]:
+        img_url = normalize_photo_url(image["src"])
+        if img_url not in image_urls:
+            image_urls.append(img_url)
+        if len(image_urls) >= max_images:
+            break
+    return image_urls
 
-def load_spaces_data():
+def load_spaces_data(path=SPACES_DATA_PATH):
     """
     공간 데이터 로드
+    
+    extract-spaces-data.mjs가 만든 spaces_data.json이 있으면 그 데이터를 사용하고,
+    없으면 아래 기본 목록을 사용
+    
+    Args:
+        path (str): spaces_data.json 경로
     """
+    if Path(path).exists():
+        spaces_data = load_spaces_json(path)
+        print(f"✅ {len(spaces_data)}개 공간 데이터 로드 완료 ({path})")
+        return spaces_data
+    
     # 실제 프로젝트 데이터 + 이미지 가이드의 모든 공간들
     spaces_data = [
         # 서울 지역
@@ -346,42 +698,429 @@ def load_spaces_data():
     print(f"✅ {len(spaces_data)}개 공간 데이터 로드 완료")
     return spaces_data
 
-def run_automated_crawling():
-    """전체 자동화 크롤링 실행"""
+def compare_browser_profiles(sample_size=5, headless=True, skip_images=False, max_images=3):
+    """
+    기본 프로필과 lean 프로필의 장소별 전송량 / 준비 시간 비교 (이미지 파일은 저장하지 않음)
+    
+    Args:
+        sample_size (int): 비교에 사용할 공간 수 (데이터 앞에서부터)
+        headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+        skip_images (bool): lean 프로필에서 사진 바이트도 차단할지 여부
+        max_images (int): 장소당 수집할 사진 URL 수
+    
+    Returns:
+        dict: 프로필 이름 -> 장소별 측정 결과 리스트
+    """
+    sample = load_spaces_data()[:sample_size]
+    profiles = {"full": {"lean": False}, "lean": {"lean": True, "skip_images": skip_images}}
+    measurements = {}
+    
+    for profile_name, profile_options in profiles.items():
+        print(f"\n🧪 '{profile_name}' 프로필 측정 중...")
+        crawler = GoogleMapsImageCrawler(headless=headless, measure_network=True, **profile_options)
+        rows = []
+        try:
+            for space in sample:
+                crawler.network_photos.reset()
+                started = time.monotonic()
+                found = crawler.search_place(space["name"], space["region"])
+                urls = crawler.get_place_images(max_images) if found else []
+                ready_seconds = time.monotonic() - started
+                crawler.network_photos.poll()
+                rows.append({
+                    "name": space["name"],
+                    "bytes": crawler.network_photos.bytes_received,
+                    "seconds": ready_seconds,
+                    "photos": len(urls),
+                })
+        finally:
+            crawler.close()
+        measurements[profile_name] = rows
+    
+    print(f"\n📊 프로필 비교 (장소별 전송량 / 준비 시간)")
+    print(f"   {'장소':<16} {'full':>20} {'lean':>20}")
+    for full_row, lean_row in zip(measurements["full"], measurements["lean"]):
+        print(
+            f"   {full_row['name']:<16} "
+            f"{full_row['bytes'] / 1024:>9.0f}KB {full_row['seconds']:>6.2f}s "
+            f"{lean_row['bytes'] / 1024:>9.0f}KB {lean_row['seconds']:>6.2f}s"
+        )
+    
+    for metric, unit in (("bytes", "KB"), ("seconds", "s")):
+        full_avg = sum(r[metric] for r in measurements["full"]) / max(1, len(measurements["full"]))
+        lean_avg = sum(r[metric] for r in measurements["lean"]) / max(1, len(measurements["lean"]))
+        scale = 1024 if unit == "KB" else 1
+        saved = (1 - lean_avg / full_avg) * 100 if full_avg else 0
+        print(f"   평균 {metric:<8} full {full_avg / scale:.2f}{unit} → lean {lean_avg / scale:.2f}{unit} ({saved:.0f}% 절감)")
+    
+    return measurements
+
+def compare_startup(rounds=3, headless=True, profile_dir=PROFILE_DIR, max_images=3):
+    """
+    빈 프로필(cold)과 디스크에 남겨둔 프로필(warm)의 드라이버 시작 시간과 첫 장소까지 걸린 시간 비교
+    
+    Args:
+        rounds (int): 방식마다 반복할 횟수 (회마다 다른 장소 사용)
+        headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+        profile_dir (str): warm 프로필 디렉토리 (비어 있으면 한 번 실행해서 데운 뒤 측정)
+        max_images (int): 첫 장소에서 수집할 사진 URL 수
+    
+    Returns:
+        dict: 방식 -> [{startup, first_place}] 리스트
+    """
+    import tempfile
+    
+    sample = load_spaces_data()
+    measurements = {"cold": [], "warm": []}
+    warm_profiles = ProfilePool(profile_dir, 1)
+    warm_profiles.prepare()
+    
+    def measure(profiles, space):
+        started = time.monotonic()
+        crawler = GoogleMapsImageCrawler(headless=headless, profiles=profiles)
+        try:
+            ready = time.monotonic()
+            if crawler.open_place(space["name"], space["region"]):
+                crawler.get_place_images(max_images)
+            return {"startup": ready - started, "first_place": time.monotonic() - started}
+        finally:
+            crawler.close()
+    
+    if not is_warm(warm_profiles.slot_path(1)):
+        print("\n🔥 warm 프로필이 비어 있어 한 번 실행해서 데우는 중...")
+        measure(warm_profiles, sample[-1])
+    
+    for round_index in range(rounds):
+        space = sample[round_index % len(sample)]
+        cold_root = tempfile.mkdtemp(prefix='scent-cold-profile-')
+        try:
+            measurements["cold"].append(measure(ProfilePool(cold_root, 1), space))
+        finally:
+            shutil.rmtree(cold_root, ignore_errors=True)
+        measurements["warm"].append(measure(warm_profiles, space))
+    
+    print(f"\n📊 cold / warm 시작 비교 ({rounds}회 평균)")
+    print(f"   {'':<6} {'드라이버 시작':>12} {'첫 장소까지':>12}")
+    averages = {}
+    for mode, rows in measurements.items():
+        averages[mode] = {
+            key: sum(row[key] for row in rows) / max(1, len(rows)) for key in ("startup", "first_place")
+        }
+        print(f"   {mode:<6} {averages[mode]['startup']:>11.2f}s {averages[mode]['first_place']:>11.2f}s")
+    
+    saved = averages["cold"]["first_place"] - averages["warm"]["first_place"]
+    print(f"   💡 warm 프로필: 첫 장소까지 {saved:.2f}s 절감 (워커마다, 세션을 띄울 때마다)")
+    return measurements
+
+def print_navigation_savings(wait_log):
+    """장소 이동 방식별 평균 시간과 지도 홈 검색 대비 절감량 출력"""
+    summary = summarize_timings(t for t in wait_log if t["name"].startswith("to_place["))
+    if not summary:
+        return
+    
+    averages = {name[len("to_place["):-1]: entry["total"] / entry["count"] for name, entry in summary.items()}
+    print(f"\n🧭 장소 페이지까지 걸린 시간")
+    for mode, average in averages.items():
+        print(f"   {mode:<11} 평균 {average:.2f}s ({summary[f'to_place[{mode}]']['count']}회)")
+    
+    # 같은 실행 안에서 비교 대상이 함께 측정된 경우에만 절감량 계산
+    baseline_mode = "home" if "home" in averages else "search_url"
+    baseline = averages.get(baseline_mode)
+    if baseline:
+        for mode in ("search_url", "cached"):
+            if mode in averages and mode != baseline_mode:
+                print(f"   💡 {mode}: 장소당 {baseline - averages[mode]:.2f}s 절감 ({baseline_mode} 대비)")
+
+# 타임아웃이 나면 지도 쪽이 느려졌다는 신호로 보는 대기 조건 (사진이 없는 장소의 photos 타임아웃은 제외)
+NAVIGATION_WAITS = ("search_panel", "search_results", "place_pane")
+
+def crawl_space(crawler, space, max_images=3, wait_log=None, limiter=None, breaker=None):
+    """
+    워커 한 개가 공간 하나를 처리 (CrawlerPool 핸들러)
+    
+    Args:
+        crawler (GoogleMapsImageCrawler): 워커가 가진 크롤러 세션
+        space (dict): 공간 데이터
+        max_images (int): 수집할 이미지 수
+        wait_log (list): 준비 상태 대기 기록을 모을 공유 리스트
+        limiter (RateLimiter): 모든 워커가 공유하는 지도 요청 속도 제한
+        breaker (CircuitBreaker): 오류율이 높아지면 크롤링 전체를 멈추는 회로 차단기
+        
+    Returns:
+        int: 다운로드 예약된 이미지 수
+    """
+    # 고정 딜레이 대신 공유 토큰 버킷이 허락할 때 다음 장소로 이동
+    maps_host = host_of(crawler.maps_url)
+    if breaker is not None:
+        breaker.wait()
+    if limiter is not None:
+        waited = limiter.acquire(maps_host)
+        crawler.metrics.observe("rate_limit_wait", waited)
+    
+    started = time.monotonic()
+    timing_start = len(crawler.readiness.timings)
+    queued_count = crawler.crawl_place_images(
+        place_name=space["name"],
+        region=space["region"],
+        english_name=space["english_name"],
+        max_images=max_images
+    )
+    crawler.metrics.observe("place", time.monotonic() - started, ok=queued_count > 0, place=space["name"])
+    timings = crawler.readiness.timings[timing_start:]
+    if wait_log is not None:
+        wait_log.extend(timings)
+    
+    # 이동 대기가 타임아웃되면 지도 요청 속도를 줄이고 이 워커는 지수 백오프 (연속될수록 길게)
+    timed_out = any(not t["ok"] for t in timings if t["name"] in NAVIGATION_WAITS)
+    if breaker is not None:
+        breaker.record(not timed_out)
+    if timed_out:
+        if limiter is not None:
+            limiter.failure(maps_host)
+        delay = backoff_delay(crawler.timeout_streak, base=2.0)
+        crawler.timeout_streak += 1
+        print(f"  🐢 지도 응답 지연 - {delay:.1f}s 쉬고 계속 (연속 {crawler.timeout_streak}회)")
+        time.sleep(delay)
+    else:
+        crawler.timeout_streak = 0
+        if limiter is not None:
+            limiter.success(maps_host)
+    return queued_count
+
+def run_automated_crawling(workers=1, headless=False, max_images=3, wait_ceilings=None,
+                           download_workers=8, per_host=4, manifest_path='scripts/crawl_manifest.jsonl',
+                           resume=False, refresh_names=(), refresh_regions=(), incremental=False,
+                           snapshot_path=SNAPSHOT_PATH, extraction='dom', lean=False, skip_images=False,
+                           navigation='direct', postprocess=False, widths=DEFAULT_WIDTHS,
+                           formats=DEFAULT_FORMATS, dedup=False, dedup_threshold=None, spare_images=3,
+                           rank=False, candidates=12, rate=0.5, max_rate=None, image_rate=8.0, max_image_rate=None,
+                           trace_path=TRACE_PATH, report_path=REPORT_PATH, prometheus_path=None,
+                           queue_url=None, lease_timeout=DEFAULT_LEASE_TIMEOUT, profile_dir=None,
+                           catalog_path=CATALOG_PATH, placeholders=True, record_dir=None, replay_dir=None,
+                           recycle_after=DEFAULT_RECYCLE_AFTER, max_browser_mb=DEFAULT_MAX_BROWSER_MB):
+    """
+    전체 자동화 크롤링 실행
+    
+    Args:
+        workers (int): 동시에 띄울 Chrome 세션 수
+        headless (bool): 브라우저를 숨김 모드로 실행할지 여부
+        max_images (int): 공간당 수집할 이미지 수
+        wait_ceilings (dict): 준비 상태 조건별 최대 대기 시간 (초)
+        download_workers (int): 백그라운드 다운로드 스레드 수
+        per_host (int): 이미지 호스트 하나에 동시에 보낼 최대 요청 수
+        manifest_path (str): 장소별 진행 기록(JSONL) 경로
+        resume (bool): 이전 실행에서 완료된 장소는 건너뛸지 여부
+        refresh_names (iterable): 완료 여부와 상관없이 다시 받을 장소 (name 또는 english_name)
+        refresh_regions (iterable): 완료 여부와 상관없이 다시 받을 지역
+        incremental (bool): 마지막 크롤링 스냅샷과 비교해서 추가/이름 변경/지역 변경된 공간만 크롤링
+        snapshot_path (str): 마지막 크롤링 스냅샷 경로
+        extraction (str): 사진 URL 수집 방식 ('dom' 또는 'network')
+        lean (bool): 불필요한 요청을 차단하는 lean 브라우저 프로필 사용
+        skip_images (bool): lean 프로필에서 사진 바이트도 브라우저에서 받지 않음
+        navigation (str): 장소 이동 방식 ('direct' 또는 'home')
+        postprocess (bool): 다운로드된 이미지를 반응형 너비 / WebP / AVIF로 후처리할지 여부
+        widths (tuple): 후처리로 만들 너비들
+        formats (tuple): 후처리로 만들 포맷들
+        dedup (bool): 이미 저장된 사진과 거의 같은 이미지를 거부하고 예비 후보를 대신 받을지 여부
+        dedup_threshold (int): 같은 사진으로 볼 최대 해밍 거리 (64비트 dHash 기준)
+        spare_images (int): dedup 사용 시 장소당 더 수집할 예비 후보 URL 수
+        rank (bool): 후보를 넉넉히 모아 썸네일 품질 점수로 상위 max_images장만 다운로드할지 여부
+        candidates (int): rank 사용 시 장소당 수집할 후보 사진 수
+        rate (float): 모든 워커를 합친 지도 장소 이동 속도 (초당)
+        max_rate (float): 오류 없이 진행될 때 rate에서 올라갈 수 있는 최대 속도 (기본: rate × DEFAULT_CEILING)
+        image_rate (float): 이미지 호스트별 초당 요청 수
+        max_image_rate (float): 이미지 호스트별 최대 속도 (기본: image_rate × DEFAULT_CEILING)
+        trace_path (str): 단계별 이벤트를 기록할 JSON-lines 트레이스 경로 (None이면 기록 안 함)
+        report_path (str): 실행 요약 리포트(JSON) 경로 - 다음 실행에서 회귀 비교에 사용
+        prometheus_path (str): Prometheus 텍스트 형식으로도 저장할 경로 (선택)
+        queue_url (str): 분산 작업 큐 (주면 공간 데이터 대신 큐에서 장소를 임대해서 처리하는 워커로 동작)
+        lease_timeout (float): 작업 큐 임대 만료 시간 (초)
+        profile_dir (str): 워커별 브라우저 프로필을 남겨둘 디렉토리 (없으면 매번 빈 프로필로 시작)
+        catalog_path (str): 사이트가 import할 장소별 이미지 카탈로그(JSON) 경로
+                            (None이면 만들지 않음, 재생이 아닌 실행이 정상적으로 끝나고 받은 이미지가 있을 때만 갱신)
+        placeholders (bool): 카탈로그에 이미지별 BlurHash / 인라인 썸네일 / 대표 색상을 넣을지 여부
+        record_dir (str): 장소별 페이지 스냅샷 / 후보 목록 / 이미지 응답을 기록할 보관소 디렉토리
+        replay_dir (str): 브라우저와 네트워크 없이 재생할 보관소 디렉토리 (속도 제한 없이 최대 속도로 실행)
+        recycle_after (int): 세션 하나가 이만큼 장소를 처리하면 드라이버를 새로 띄움 (0이면 제한 없음)
+        max_browser_mb (float): 브라우저 프로세스 트리 RSS가 이 값을 넘으면 드라이버를 새로 띄움 (0이면 확인 안 함)
+    """
     print("🚀 SCENT DESTINATION 이미지 자동 크롤링 시작!")
     
-    # 공간 데이터 로드
-    spaces_data = load_spaces_data()
-    total_spaces = len(spaces_data)
+    # 공간 데이터 로드 (작업 큐 워커는 코디네이터가 넣어둔 장소를 임대해서 처리)
+    leases = None
+    if queue_url:
+        leases = LeaseQueue(open_work_queue(queue_url), lease_timeout=lease_timeout)
+        print_queue_status(leases.work_queue)
+    spaces_data = [] if leases else load_spaces_data()
+    all_spaces = list(spaces_data)
+    snapshot = load_snapshot(snapshot_path)
+    removed_keys = []
+    
+    if incremental and not leases:
+        changes = diff_spaces(spaces_data, snapshot)
+        changed_keys = {space_key(s) for kind in ("added", "renamed", "moved") for s in changes[kind]}
+        print(
+            f"🔎 변경 감지: 추가 {len(changes['added'])}개, 이름 변경 {len(changes['renamed'])}개, "
+            f"지역 변경 {len(changes['moved'])}개, 삭제 {len(changes['removed'])}개"
+        )
+        removed_keys = [key for key, s in snapshot.items() if s in changes["removed"]]
+        forced = set(refresh_names or ()) | set(refresh_regions or ())
+        spaces_data = [
+            s for s in spaces_data
+            if space_key(s) in changed_keys
+            or forced & {s["name"], s["english_name"], s["region"]}
+        ]
+    
+    # 진행 기록을 보고 이번에 크롤링할 공간만 선택
+    manifest = CrawlManifest(manifest_path)
+    # --incremental 목록은 변경된 공간과 refresh 대상을 이미 합쳐둔 상태라 refresh 대상만 남기지 않음
+    spaces_data, skipped = select_pending(
+        spaces_data, manifest, resume, refresh_names, refresh_regions,
+        refresh_only=not (incremental and not leases),
+    )
+    if skipped:
+        print(f"⏭️ 이미 완료되었거나 대상이 아닌 {skipped}개 공간 건너뜀")
+    total_spaces = leases.work_queue.outstanding() if leases else len(spaces_data)
+    
+    print(f"📊 총 {total_spaces}개 공간 × {max_images}장 = {total_spaces * max_images}장 수집 예정")
+    print(f"🧵 워커 수: {workers}\n")
     
-    print(f"📊 총 {total_spaces}개 공간 × 3장 = {total_spaces * 3}장 수집 예정\n")
+    # 한 번 찾은 장소 URL은 다음 실행에서 바로 열 수 있도록 저장
+    place_cache = PlaceUrlCache()
     
-    # 크롤러 초기화
-    crawler = GoogleMapsImageCrawler(headless=False)  # 처음에는 headless=False로 확인용
+    # 다운로드가 끝난 이미지를 모든 코어로 후처리
+    postprocessor = ImagePostProcessor(widths=widths, formats=formats) if postprocess else None
+    
+    # 저장된 모든 이미지의 유사 해시 인덱스 (새로 생기거나 바뀐 파일만 해시)
+    hash_index = None
+    if dedup:
+        from crawler_dedup import PerceptualIndex
+        hash_index = PerceptualIndex(threshold=dedup_threshold)
+        hashed = hash_index.sync_directory('public/images/places')
+        print(f"🔁 유사 이미지 인덱스: {len(hash_index)}장 (새로 해시 {hashed}장)")
+    
+    # 지도와 이미지 호스트의 요청 속도를 모든 워커/다운로드 스레드가 함께 제한
+    limiter = RateLimiter(
+        default_rate=image_rate,
+        rates={MAPS_HOST: rate},
+        max_rates={MAPS_HOST: max_rate} if max_rate else None,
+        default_max_rate=max_image_rate
+    )
+    breaker = CircuitBreaker()
+    
+    # 단계별 타이머/카운터 (모든 워커와 다운로드 스레드가 공유)
+    previous_report = load_report(report_path)
+    metrics = Metrics(trace_path)
+    
+    # 파일별 SHA-256 기록 (다시 받은 이미지가 같으면 기존 파일을 그대로 둠)
+    checksums = ChecksumStore()
+    
+    # 기록/재생 보관소 (재생은 지도/이미지 호스트에 요청하지 않으므로 속도 제한과 회로 차단기 없이 실행)
+    archive_mode = 'replay' if replay_dir else 'record' if record_dir else None
+    archive = ReplayArchive(replay_dir or record_dir) if archive_mode else None
+    if archive_mode == 'replay':
+        limiter, breaker = None, None
+        print(f"📼 재생 모드: 기록된 장소 {len(archive.places)}개, 응답 {len(archive.responses)}개 ({replay_dir})")
+    
+    # 모든 워커가 공유하는 백그라운드 다운로더 (브라우저는 다운로드를 기다리지 않음)
+    downloader = ImageDownloader(
+        max_workers=download_workers, per_host=per_host, dedup=hash_index, checksums=checksums,
+        limiter=limiter, breaker=breaker, metrics=metrics
+    )
+    if archive:
+        mount_archive(downloader.session, archive, archive_mode, download_workers)
+    
+    # 후보 썸네일의 품질 점수로 원본을 받을 사진 선택
+    ranker = None
+    if rank:
+        from crawler_ranking import CandidateRanker
+        ranker = CandidateRanker(downloader, max_workers=workers)
+    
+    # 워커별 브라우저 프로필 (이전 실행의 캐시를 그대로 쓰고, 새 워커는 warm 프로필을 복사)
+    profiles = None
+    if profile_dir and archive_mode != 'replay':
+        profiles = ProfilePool(profile_dir, workers)
+        profiles.prepare()
+    
+    # 크롤러 세션 풀 초기화 (처음에는 headless=False로 확인용)
+    crawler_options = dict(
+        headless=headless,
+        wait_ceilings=wait_ceilings,
+        extraction=extraction,
+        lean=lean,
+        skip_images=skip_images,
+        navigation=navigation,
+        place_cache=place_cache,
+        postprocessor=postprocessor,
+        spare_images=spare_images if dedup else 0,
+        metrics=metrics,
+        ranker=ranker,
+        candidates=candidates,
+        downloader=downloader,
+        background_downloads=True,
+        manifest=manifest,
+        leases=leases,
+        profiles=profiles
+    )
+    if archive_mode == 'replay':
+        factory = lambda: ReplayCrawler(archive, **crawler_options)
+    else:
+        factory = lambda: GoogleMapsImageCrawler(recorder=archive, **crawler_options)
+    
+    # 오래 도는 세션은 장소 사이에서 드라이버를 새로 띄워 메모리 증가를 끊음
+    recycle_policy = RecyclePolicy(recycle_after, max_browser_mb, metrics=metrics)
+    pool = CrawlerPool(
+        factory=factory,
+        size=workers,
+        is_healthy=lambda crawler: crawler.is_alive(),
+        should_recycle=recycle_policy.check
+    )
+    
+    stats = {"queued": 0, "attempted": 0, "done": 0, "failed": []}
+    wait_log = []
+    started_at = time.monotonic()
+    # 목록을 끝까지 처리하고 정상적으로 끝났는지 (중단/오류로 끝난 실행은 카탈로그를 갱신하지 않음)
+    completed = False
+    
+    def on_result(result):
+        space = result["job"]
+        if leases:
+            # 스냅샷 갱신 대상은 이 워커가 임대해서 처리한 장소
+            spaces_data.append(space)
+        stats["done"] += 1
+        metrics.count("places_done")
+        stats["attempted"] += max_images
+        
+        if result["error"] is not None:
+            print(f"❌ [워커 {result['worker']}] '{space['name']}' 실패: {result['error']}")
+            stats["failed"].append(space["name"])
+            metrics.count("places_failed")
+            if leases:
+                leases.fail(space["english_name"], result["error"])
+        else:
+            stats["queued"] += result["value"] or 0
+        
+        print(f"[{stats['done']}/{total_spaces}] '{space['name']}' 처리 완료 (워커 {result['worker']})")
+        
+        # 10개마다 진행 상황 출력
+        if stats["done"] % 10 == 0:
+            print(f"\n📈 중간 결과: {downloader.stats['ok']}/{stats['attempted']} 이미지 저장, {stats['queued']}개 예약 ({stats['done']}/{total_spaces} 공간 완료)")
     
     try:
-        total_success = 0
-        total_attempted = 0
+        if pool.start() == 0:
+            print("❌ 사용할 수 있는 크롤러 세션이 없습니다")
+            return
         
-        for i, space in enumerate(spaces_data, 1):
-            print(f"\n[{i}/{total_spaces}] 진행 중...")
-            
-            success_count = crawler.crawl_place_images(
-                place_name=space["name"],
-                region=space["region"],
-                english_name=space["english_name"],
-                max_images=3
-            )
-            
-            total_success += success_count
-            total_attempted += 3
-            
-            # 과도한 요청 방지를 위한 딜레이
-            time.sleep(2)
-            
-            # 10개마다 진행 상황 출력
-            if i % 10 == 0:
-                print(f"\n📈 중간 결과: {total_success}/{total_attempted} 이미지 수집 ({i}/{total_spaces} 공간 완료)")
+        _, leftover = pool.run(
+            spaces_data,
+            lambda crawler, space: crawl_space(crawler, space, max_images, wait_log, limiter, breaker),
+            on_result=on_result,
+            job_queue=leases
+        )
+        
+        if leftover:
+            print(f"\n⚠️ 처리되지 못한 공간 {len(leftover)}개: {', '.join(s['name'] for s in leftover)}")
+        completed = True
     
     except KeyboardInterrupt:
         print("\n⚠️ 사용자에 의해 중단됨")
@@ -390,21 +1129,285 @@ def run_automated_crawling():
         print(f"\n💥 예상치 못한 오류: {e}")
     
     finally:
-        crawler.close()
+        pool.close()
+        if ranker:
+            ranker.close()
+        downloader.close()
+        if leases:
+            # 다운로드까지 끝나서 결과를 보고하지 못한 임대만 반납
+            leases.close()
+        checksums.save()
+        place_cache.save()
+        if hash_index:
+            hash_index.save('public/images/places')
+        if postprocessor:
+            postprocessor.close()
+        if archive:
+            archive.save()
+        
+        # 사이트가 HEAD 요청 대신 정적으로 찾아볼 이미지 카탈로그 (후처리 변형까지 끝난 뒤)
+        # 중단되었거나, 재생 모드이거나, 이미지를 하나도 받지 못한 실행은 커밋된 카탈로그를 건드리지 않음
+        if catalog_path:
+            if completed and archive_mode != 'replay' and downloader.stats["ok"]:
+                update_catalog('public/images/places', all_spaces or spaces_data, checksums, catalog_path, placeholders)
+            else:
+                print("🗃️ 이미지 카탈로그는 갱신하지 않음 (필요하면 --catalog-only로 다시 만들 수 있습니다)")
+        
+        # 이번에 모든 이미지를 받은 공간만 스냅샷에 반영 (실패한 공간은 다음 증분 실행에서 다시 시도)
+        crawled = [s for s in spaces_data if manifest.is_complete(s["english_name"])]
+        if crawled or removed_keys:
+            for space in crawled:
+                snapshot[space_key(space)] = snapshot_entry(space)
+            for key in removed_keys:
+                snapshot.pop(key, None)
+            save_snapshot(snapshot, snapshot_path)
+            print(f"🗂️ 스냅샷 갱신: {len(crawled)}개 공간 ({snapshot_path})")
         
         # 최종 결과 출력
+        total_success = downloader.stats["ok"]
+        total_attempted = stats["attempted"]
+        elapsed = time.monotonic() - started_at
         success_rate = (total_success / total_attempted * 100) if total_attempted > 0 else 0
         print(f"\n🎉 크롤링 완료!")
         print(f"📈 최종 성공률: {total_success}/{total_attempted} ({success_rate:.1f}%)")
-        print(f"📁 저장 위치: {crawler.download_dir.absolute()}")
+        print(f"⏱️ 소요 시간: {elapsed:.1f}초 (워커 {workers}개, 세션 교체 {pool.replaced}회, 재시작 {pool.recycled}회)")
+        print(f"📥 다운로드: 성공 {downloader.stats['ok']}개 (변경 없음 {downloader.stats['unchanged']}개, 304 {downloader.stats['not_modified']}개), 실패 {downloader.stats['failed']}개, {downloader.stats['bytes'] / 1024 / 1024:.1f}MB")
+        if leases:
+            leases.print_summary()
+            print_queue_status(leases.work_queue)
+        trips = breaker.trips if breaker else 0
+        if downloader.stats["retries"] or trips:
+            print(f"🔄 재시도 {downloader.stats['retries']}회, 회로 차단 {trips}회")
+        if limiter is not None:
+            limiter.print_summary()
+        if archive:
+            archive.print_summary(archive_mode)
+        recycle_policy.print_summary()
+        if ranker:
+            ranker.print_summary(max_images)
+        if hash_index:
+            hash_index.print_summary()
+        if stats["failed"]:
+            print(f"❌ 실패한 공간: {', '.join(stats['failed'])}")
+        print_wait_report(wait_log)
+        metrics.print_summary(previous_report)
+        metrics.save_report(report_path)
+        if prometheus_path:
+            metrics.write_prometheus(prometheus_path)
+        metrics.close()
+        print(f"📝 계측 리포트: {report_path}" + (f", 트레이스: {trace_path}" if trace_path else ""))
+        print_navigation_savings(wait_log)
+        print(f"📁 저장 위치: {Path('public/images/places').absolute()}")
         print(f"\n💡 다음 단계:")
         print(f"1. 수집된 이미지들을 확인하세요")
         print(f"2. 품질이 낮은 이미지들을 수동으로 교체하세요")
         print(f"3. npm run dev로 개발서버를 시작해서 결과를 확인하세요")
 
+def enqueue_spaces(queue_url, manifest_path='scripts/crawl_manifest.jsonl', resume=False,
+                   refresh_names=(), refresh_regions=(), requeue_failed=False):
+    """
+    코디네이터: 크롤링할 공간을 분산 작업 큐에 넣음 (워커는 여러 머신에서 --queue로 실행)
+    
+    Args:
+        queue_url (str): 작업 큐 (경로 또는 sqlite:///경로)
+        manifest_path (str): 완료 여부를 판단할 진행 기록 경로 (resume 사용 시)
+        resume (bool): 진행 기록에서 완료된 장소는 넣지 않음
+        refresh_names (iterable): 이미 큐에서 끝났더라도 다시 대기 상태로 돌릴 장소
+        refresh_regions (iterable): 이미 큐에서 끝났더라도 다시 대기 상태로 돌릴 지역
+        requeue_failed (bool): 시도 횟수를 다 써서 실패한 장소도 다시 대기 상태로
+    """
+    work_queue = open_work_queue(queue_url)
+    try:
+        manifest = CrawlManifest(manifest_path)
+        spaces_data, skipped = select_pending(load_spaces_data(), manifest, resume, refresh_names, refresh_regions)
+        forced = set(refresh_names or ()) | set(refresh_regions or ())
+        refreshed = [s for s in spaces_data if forced & {s["name"], s["english_name"], s["region"]}]
+        
+        added = work_queue.enqueue(spaces_data)
+        reset = work_queue.enqueue(refreshed, reset=True) if refreshed else 0
+        requeued = work_queue.requeue() if requeue_failed else 0
+        print(
+            f"📮 작업 큐에 {added}개 장소 추가 (이미 있음 {len(spaces_data) - added}개, 다시 대기 {reset + requeued}개, "
+            f"완료되어 제외 {skipped}개)"
+        )
+        print_queue_status(work_queue)
+    finally:
+        work_queue.close()
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="SCENT DESTINATION Google Maps 이미지 크롤러")
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help=f"동시에 띄울 Chrome 세션 수 (기본: 1, 권장 최대: CPU 코어 수 {os.cpu_count()})"
+    )
+    parser.add_argument('--headless', action='store_true', help="브라우저 창 없이 실행")
+    parser.add_argument('--max-images', type=int, default=3, help="공간당 수집할 이미지 수 (기본: 3)")
+    parser.add_argument('--trace', default=TRACE_PATH, help=f"단계별 이벤트 JSON-lines 트레이스 경로 (기본: {TRACE_PATH})")
+    parser.add_argument('--no-trace', action='store_true', help="트레이스 파일을 쓰지 않음 (요약 리포트만)")
+    parser.add_argument('--report', default=REPORT_PATH, help=f"실행 요약 리포트(JSON) 경로 (기본: {REPORT_PATH})")
+    parser.add_argument('--prometheus', metavar='PATH', help="Prometheus 텍스트 형식 메트릭 파일 경로 (textfile collector용)")
+    parser.add_argument(
+        '--rate', type=float, default=0.5,
+        help="모든 워커를 합친 지도 장소 이동 속도, 초당 (기본: 0.5 - 고정 2초 딜레이 대체)"
+    )
+    parser.add_argument(
+        '--max-rate', type=float,
+        help=f"오류 없이 진행될 때 올라갈 수 있는 최대 지도 이동 속도 (기본: --rate의 {DEFAULT_CEILING}배, --rate 이상)"
+    )
+    parser.add_argument('--image-rate', type=float, default=8.0, help="이미지 호스트별 초당 요청 수 (기본: 8)")
+    parser.add_argument(
+        '--max-image-rate', type=float,
+        help=f"오류 없이 진행될 때 올라갈 수 있는 이미지 호스트별 최대 속도 (기본: --image-rate의 {DEFAULT_CEILING}배)"
+    )
+    parser.add_argument('--download-workers', type=int, default=8, help="백그라운드 다운로드 스레드 수 (기본: 8)")
+    parser.add_argument('--per-host', type=int, default=4, help="이미지 호스트당 동시 요청 수 (기본: 4)")
+    parser.add_argument('--manifest', default='scripts/crawl_manifest.jsonl', help="장소별 진행 기록 파일 경로")
+    parser.add_argument('--resume', action='store_true', help="진행 기록에서 완료된 장소는 건너뛰고 이어서 실행")
+    parser.add_argument(
+        '--verify', action='store_true',
+        help="크롤링 없이 로컬 이미지를 진행 기록(크기/SHA-256)과 대조만 함 (문제 있는 장소는 partial로 기록)"
+    )
+    parser.add_argument(
+        '--refresh', action='append', default=[], metavar='PLACE',
+        help="완료 여부와 상관없이 다시 받을 장소 (장소명 또는 영문 파일명, 여러 번 지정 가능)"
+    )
+    parser.add_argument(
+        '--refresh-region', action='append', default=[], metavar='REGION',
+        help="완료 여부와 상관없이 다시 받을 지역 (예: --refresh-region 제주)"
+    )
+    parser.add_argument(
+        '--queue', metavar='URL',
+        help="분산 작업 큐 (경로 또는 sqlite:///경로) - 주면 공간 데이터 대신 큐에서 장소를 임대해서 처리하는 워커로 실행"
+    )
+    parser.add_argument('--enqueue', action='store_true', help="크롤링 없이 공간들을 --queue에 넣기만 함 (코디네이터)")
+    parser.add_argument('--queue-status', action='store_true', help="크롤링 없이 --queue의 대기/임대/완료/실패 현황만 출력")
+    parser.add_argument('--requeue-failed', action='store_true', help="--enqueue 시 실패로 끝난 장소도 다시 대기 상태로")
+    parser.add_argument(
+        '--lease-timeout', type=float, default=DEFAULT_LEASE_TIMEOUT,
+        help=f"작업 큐 임대 만료 시간 (초, 기본: {DEFAULT_LEASE_TIMEOUT:.0f}) - 하트비트가 끊긴 워커의 장소는 이후 다른 워커가 가져감"
+    )
+    parser.add_argument(
+        '--extraction', choices=['dom', 'network'], default='dom',
+        help="사진 URL 수집 방식: dom (img 요소 탐색) / network (CDP 네트워크 응답 수집)"
+    )
+    parser.add_argument(
+        '--navigation', choices=['direct', 'home'], default='direct',
+        help="장소 이동 방식: direct (캐시된 장소 URL / 검색 URL로 바로 이동) / home (지도 홈에서 검색창 입력)"
+    )
+    parser.add_argument('--postprocess', action='store_true', help="다운로드된 이미지를 반응형 너비별 WebP/AVIF로 후처리")
+    parser.add_argument(
+        '--postprocess-only', action='store_true',
+        help="크롤링 없이 저장 디렉토리의 기존 이미지만 후처리"
+    )
+    parser.add_argument(
+        '--catalog', default=CATALOG_PATH,
+        help=f"사이트용 장소별 이미지 카탈로그(JSON) 경로 (기본: {CATALOG_PATH})"
+    )
+    parser.add_argument('--no-catalog', action='store_true', help="실행 후 이미지 카탈로그를 갱신하지 않음")
+    parser.add_argument(
+        '--no-placeholders', action='store_true',
+        help="카탈로그에 BlurHash / 인라인 썸네일 / 대표 색상 플레이스홀더를 계산해서 넣지 않음"
+    )
+    parser.add_argument(
+        '--catalog-only', action='store_true',
+        help="크롤링 없이 저장 디렉토리의 이미지로 카탈로그만 다시 만듦"
+    )
+    parser.add_argument(
+        '--widths', default=','.join(map(str, DEFAULT_WIDTHS)),
+        help=f"후처리 너비들 (기본: {','.join(map(str, DEFAULT_WIDTHS))})"
+    )
+    parser.add_argument(
+        '--formats', default=','.join(DEFAULT_FORMATS),
+        help=f"후처리 포맷들: jpg, webp, avif (기본: {','.join(DEFAULT_FORMATS)})"
+    )
+    parser.add_argument(
+        '--rank', action='store_true',
+        help="후보 사진을 넉넉히 모아 썸네일 품질 점수(해상도/선명도/노출/비율)로 상위 N장만 원본 다운로드"
+    )
+    parser.add_argument('--candidates', type=int, default=12, help="--rank 사용 시 장소당 수집할 후보 수 (기본: 12)")
+    parser.add_argument(
+        '--dedup', action='store_true',
+        help="이미 저장된 사진과 거의 같은 이미지(다른 크기/토큰, 체인점 공유 사진)는 거부하고 다음 후보를 받음"
+    )
+    parser.add_argument('--dedup-threshold', type=int, help="같은 사진으로 볼 최대 해밍 거리 (64비트 기준, 기본: 10)")
+    parser.add_argument('--spare-images', type=int, default=3, help="--dedup 사용 시 장소당 더 수집할 예비 후보 수 (기본: 3)")
+    parser.add_argument('--lean', action='store_true', help="지도 타일/폰트/미디어/트래킹 요청을 차단하는 lean 브라우저 프로필 사용")
+    parser.add_argument('--skip-images', action='store_true', help="lean 프로필에서 사진 바이트도 브라우저에서 받지 않음 (URL만 수집)")
+    parser.add_argument(
+        '--profile-dir', nargs='?', const=PROFILE_DIR, metavar='DIR',
+        help=f"브라우저 프로필을 디스크에 남겨서 다음 실행에서 캐시/쿠키를 재사용 (워커마다 복사본, 기본 위치: {PROFILE_DIR})"
+    )
+    parser.add_argument(
+        '--recycle-after', type=int, default=DEFAULT_RECYCLE_AFTER, metavar='N',
+        help=f"세션 하나가 장소 N개를 처리하면 드라이버를 새로 띄움 (기본: {DEFAULT_RECYCLE_AFTER}, 0이면 제한 없음)"
+    )
+    parser.add_argument(
+        '--max-browser-mb', type=float, default=DEFAULT_MAX_BROWSER_MB, metavar='MB',
+        help=f"브라우저 프로세스 트리 RSS가 넘으면 장소 사이에서 드라이버를 새로 띄움 (기본: {DEFAULT_MAX_BROWSER_MB}, 0이면 확인 안 함, psutil 필요)"
+    )
+    parser.add_argument(
+        '--record', nargs='?', const=REPLAY_DIR, metavar='DIR',
+        help=f"장소별 페이지 스냅샷 / 후보 목록 / 이미지 응답을 압축 보관소에 기록 (기본 위치: {REPLAY_DIR})"
+    )
+    parser.add_argument(
+        '--replay', nargs='?', const=REPLAY_DIR, metavar='DIR',
+        help="--record로 만든 보관소를 브라우저와 네트워크 없이 재생 (추출/순위/다운로드/후처리 단계만 최대 속도로 실행)"
+    )
+    parser.add_argument(
+        '--compare-startup', type=int, metavar='N',
+        help="크롤링 대신 빈 프로필(cold)과 --profile-dir 프로필(warm)의 시작 시간과 첫 장소까지 걸린 시간을 N회 비교"
+    )
+    parser.add_argument(
+        '--compare-profiles', type=int, metavar='N',
+        help="크롤링 대신 공간 N개로 기본/lean 프로필의 전송량과 준비 시간을 비교"
+    )
+    parser.add_argument(
+        '--incremental', action='store_true',
+        help="spaces_data.json을 마지막 크롤링 스냅샷과 비교해서 추가/이름 변경/지역 변경된 공간만 크롤링"
+    )
+    parser.add_argument(
+        '--wait-ceiling', action='append', metavar='NAME=SECONDS',
+        help="준비 상태 조건별 최대 대기 시간 (예: --wait-ceiling photos=5, 여러 번 지정 가능)"
+    )
+    args = parser.parse_args()
+    
+    try:
+        args.wait_ceilings = parse_ceilings(args.wait_ceiling)
+        args.widths = tuple(int(w) for w in args.widths.split(',') if w)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    args.formats = tuple(f.strip().lower() for f in args.formats.split(',') if f.strip())
+    unknown_formats = set(args.formats) - {'jpg', 'webp', 'avif'}
+    if unknown_formats:
+        parser.error(f"지원하지 않는 포맷: {', '.join(sorted(unknown_formats))}")
+    
+    if args.workers < 1:
+        parser.error("--workers는 1 이상이어야 합니다")
+    if args.rate <= 0 or args.image_rate <= 0:
+        parser.error("--rate와 --image-rate는 0보다 커야 합니다")
+    if args.max_rate is not None and args.max_rate < args.rate:
+        parser.error("--max-rate는 --rate 이상이어야 합니다")
+    if args.max_image_rate is not None and args.max_image_rate < args.image_rate:
+        parser.error("--max-image-rate는 --image-rate 이상이어야 합니다")
+    if (args.enqueue or args.queue_status) and not args.queue:
+        parser.error("--enqueue와 --queue-status는 --queue와 함께 사용해야 합니다")
+    if args.lease_timeout <= 0:
+        parser.error("--lease-timeout은 0보다 커야 합니다")
+    if args.recycle_after < 0 or args.max_browser_mb < 0:
+        parser.error("--recycle-after와 --max-browser-mb는 0 이상이어야 합니다")
+    if args.record and args.replay:
+        parser.error("--record와 --replay는 함께 사용할 수 없습니다")
+    if args.replay and not Path(args.replay, 'index.json').exists():
+        parser.error(f"재생할 기록이 없습니다: {args.replay} (먼저 --record로 실행)")
+    if args.workers > (os.cpu_count() or 1):
+        print(f"⚠️ 워커 수({args.workers})가 CPU 코어 수({os.cpu_count()})보다 많아 속도 향상이 제한될 수 있습니다")
+    return args
+
 if __name__ == "__main__":
     # 필요한 패키지 확인
-    required_packages = ['selenium', 'requests', 'pandas']
+    required_packages = ['selenium', 'requests']
     missing_packages = []
     
     for package in required_packages:
@@ -421,4 +1424,103 @@ if __name__ == "__main__":
         sys.exit(1)
     
     # 크롤링 실행
-    run_automated_crawling() 
\ No newline at end of file
+    args = parse_args()
+    if args.verify:
+        report = verify_manifest(CrawlManifest(args.manifest))
+        sys.exit(1 if report["broken"] else 0)
+    
+    if args.queue_status:
+        work_queue = open_work_queue(args.queue)
+        print_queue_status(work_queue)
+        work_queue.close()
+        sys.exit(0)
+    
+    if args.enqueue:
+        enqueue_spaces(
+            args.queue,
+            manifest_path=args.manifest,
+            resume=args.resume,
+            refresh_names=args.refresh,
+            refresh_regions=args.refresh_region,
+            requeue_failed=args.requeue_failed
+        )
+        sys.exit(0)
+    
+    if args.postprocess_only:
+        postprocessor = ImagePostProcessor(widths=args.widths, formats=args.formats)
+        count = postprocessor.submit_directory('public/images/places')
+        print(f"🖼️ 이미지 {count}장 후처리 시작...")
+        postprocessor.close()
+        if not args.no_catalog:
+            update_catalog(
+                'public/images/places', load_spaces_data(), ChecksumStore(), args.catalog,
+                not args.no_placeholders
+            )
+        sys.exit(0)
+    
+    if args.catalog_only:
+        update_catalog(
+            'public/images/places', load_spaces_data(), ChecksumStore(), args.catalog,
+            not args.no_placeholders
+        )
+        sys.exit(0)
+    
+    if args.compare_startup:
+        compare_startup(
+            rounds=args.compare_startup,
+            headless=args.headless,
+            profile_dir=args.profile_dir or PROFILE_DIR,
+            max_images=args.max_images
+        )
+        sys.exit(0)
+    
+    if args.compare_profiles:
+        compare_browser_profiles(
+            sample_size=args.compare_profiles,
+            headless=args.headless,
+            skip_images=args.skip_images,
+            max_images=args.max_images
+        )
+        sys.exit(0)
+    
+    run_automated_crawling(
+        workers=args.workers,
+        headless=args.headless,
+        max_images=args.max_images,
+        wait_ceilings=args.wait_ceilings,
+        download_workers=args.download_workers,
+        per_host=args.per_host,
+        manifest_path=args.manifest,
+        resume=args.resume,
+        refresh_names=args.refresh,
+        refresh_regions=args.refresh_region,
+        incremental=args.incremental,
+        extraction=args.extraction,
+        lean=args.lean,
+        skip_images=args.skip_images,
+        navigation=args.navigation,
+        postprocess=args.postprocess,
+        widths=args.widths,
+        formats=args.formats,
+        dedup=args.dedup,
+        dedup_threshold=args.dedup_threshold,
+        spare_images=args.spare_images,
+        rank=args.rank,
+        candidates=args.candidates,
+        rate=args.rate,
+        max_rate=args.max_rate,
+        image_rate=args.image_rate,
+        max_image_rate=args.max_image_rate,
+        trace_path=None if args.no_trace else args.trace,
+        report_path=args.report,
+        prometheus_path=args.prometheus,
+        queue_url=args.queue,
+        lease_timeout=args.lease_timeout,
+        profile_dir=args.profile_dir,
+        catalog_path=None if args.no_catalog else args.catalog,
+        placeholders=not args.no_placeholders,
+        record_dir=args.record,
+        replay_dir=args.replay,
+        recycle_after=args.recycle_after,
+        max_browser_mb=args.max_browser_mb
+    ) 
\ No newline at end of file
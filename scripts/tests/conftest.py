@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""
+크롤러 모듈 테스트 공통 설정
+scripts/의 crawler_*.py 모듈은 스크립트 디렉토리 기준으로 서로 import하므로 경로에 추가
+실행: python -m pytest -q scripts/tests
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+@pytest.fixture(scope='session')
+def crawler_module():
+    """하이픈이 들어간 google-maps-crawler.py 모듈"""
+    from crawler_benchmark import load_crawler_module
+
+    return load_crawler_module()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 벤치마크 스모크 테스트 (브라우저 없이)
+대역 서버를 띄우고 장소 페이지의 사진 URL을 ImageDownloader로 받아서 저장/검증/304 경로까지 확인
+"""
+
+import json
+import re
+
+import pytest
+import requests
+
+from crawler_benchmark import PHOTO_PREFIX, FixtureServer, parse_photo_size
+from crawler_dedup import PerceptualIndex
+from crawler_downloads import ChecksumStore, ImageDownloader, sniff_image_type
+
+
+@pytest.fixture(scope='module')
+def server():
+    with FixtureServer(latency=0, image_latency=0, jitter=0, render_delay=0, photos=3) as server:
+        yield server
+
+
+def place_photo_urls(server, query):
+    """장소 페이지에 심어진 사진 경로를 절대 URL로"""
+    response = requests.get(f"{server.maps_url}place/{query}", timeout=10)
+    response.raise_for_status()
+    photos = json.loads(re.search(r'const photos = (\[.*?\]);', response.text).group(1))
+    return [f"http://127.0.0.1:{server.port}{path}" for path in photos]
+
+
+def test_parse_photo_size_reads_suffix():
+    assert parse_photo_size('w1920-h1080-k-no') == (1920, 1080)
+    assert parse_photo_size('w800') == (800, 600)
+    assert parse_photo_size('k-no') == (408, 306)
+    assert parse_photo_size('w9999-h10') == (2048, 10)
+
+
+def test_downloader_saves_fixture_photos_then_revalidates(server, tmp_path):
+    urls = place_photo_urls(server, "오센칠 서울")
+    assert len(urls) == 3
+    assert all(PHOTO_PREFIX in url for url in urls)
+
+    checksums = ChecksumStore(tmp_path / "checksums.json")
+    dedup = PerceptualIndex(tmp_path / "hashes.npz")
+    downloads = [(url, tmp_path / f"osechill-{i + 1}.jpg") for i, url in enumerate(urls)]
+
+    downloader = ImageDownloader(max_workers=3, checksums=checksums, dedup=dedup)
+    try:
+        futures = downloader.submit_place("오센칠", downloads)
+        results = [future.result() for future in futures]
+        assert [r["file"] for r in results] == ["osechill-1.jpg", "osechill-2.jpg", "osechill-3.jpg"]
+        for _, path in downloads:
+            assert sniff_image_type(path.read_bytes()[:12]) == 'jpeg'
+        assert downloader.stats["ok"] == 3
+
+        # 같은 URL을 다시 받으면 ETag로 304 → 기존 파일 유지
+        dedup.forget_owner("osechill")
+        for url, path in downloads:
+            assert downloader.fetch(url, path)["unchanged"]
+        assert downloader.stats["not_modified"] == 3
+    finally:
+        downloader.close()
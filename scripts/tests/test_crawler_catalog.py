@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+"""사이트용 이미지 카탈로그: 장소별 정리와 바뀐 내용이 있을 때만 저장"""
+
+from PIL import Image
+
+from crawler_catalog import build_catalog, load_catalog, save_catalog, update_catalog
+
+
+def save_image(path, size=(40, 30)):
+    Image.new('RGB', size, (120, 80, 40)).save(path)
+
+
+def test_build_catalog_groups_images_by_place(tmp_path):
+    save_image(tmp_path / "osechill-2.jpg")
+    save_image(tmp_path / "osechill-1.jpg", size=(64, 48))
+    (tmp_path / "osechill-1-320w.webp").write_bytes(b"variant")
+    save_image(tmp_path / "cover.jpg")
+
+    catalog = build_catalog(tmp_path, spaces=[{"id": 7, "english_name": "osechill"}], placeholders=False)
+    assert set(catalog) == {"version", "base_path", "places", "ids"}
+    images = catalog["places"]["osechill"]["images"]
+    assert [image["file"] for image in images] == ["osechill-1.jpg", "osechill-2.jpg"]
+    assert (images[0]["width"], images[0]["height"]) == (64, 48)
+    assert images[0]["formats"] == {"webp": [320]}
+    assert catalog["ids"] == {"7": "osechill"}
+
+
+def test_unchanged_catalog_is_not_rewritten(tmp_path):
+    save_image(tmp_path / "osechill-1.jpg")
+    path = tmp_path / "placeImages.json"
+
+    update_catalog(tmp_path, path=path, placeholders=False)
+    first = path.read_bytes()
+    previous = load_catalog(path)
+    assert not save_catalog(build_catalog(tmp_path, placeholders=False), path, previous)
+    assert path.read_bytes() == first
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""크롤링 대상 데이터셋: 스트리밍 로드와 스냅샷 비교"""
+
+import json
+
+from crawler_dataset import diff_spaces, iter_json_array, load_spaces_json, snapshot_entry, space_key
+
+
+def make_space(id, name, english_name, region):
+    return {"id": id, "name": name, "english_name": english_name, "region": region}
+
+
+def test_iter_json_array_handles_chunk_boundaries(tmp_path):
+    items = [{"name": f"공간 {i}", "tags": ["a", "b"] * i} for i in range(20)]
+    path = tmp_path / "spaces.json"
+    path.write_text(json.dumps(items, ensure_ascii=False, indent=2), encoding='utf-8')
+
+    assert list(iter_json_array(path, chunk_size=7)) == items
+
+
+def test_load_spaces_json_keeps_crawler_fields(tmp_path):
+    path = tmp_path / "spaces.json"
+    path.write_text(json.dumps([
+        {"id": "1", "name": "오센칠", "english_name": "osechill", "description": "긴 설명"},
+    ]), encoding='utf-8')
+
+    assert load_spaces_json(path) == [
+        {"id": "1", "name": "오센칠", "region": "", "english_name": "osechill", "category": None},
+    ]
+
+
+def test_diff_spaces_classifies_changes():
+    previous = [
+        make_space("1", "그대로", "same", "서울"),
+        make_space("2", "옛 이름", "old", "서울"),
+        make_space("3", "이사", "moving", "서울"),
+        make_space("4", "폐점", "closed", "서울"),
+    ]
+    snapshot = {space_key(s): snapshot_entry(s) for s in previous}
+    current = [
+        make_space("1", "그대로", "same", "서울"),
+        make_space("2", "새 이름", "new", "서울"),
+        make_space("3", "이사", "moving", "부산"),
+        make_space("5", "신규", "fresh", "제주"),
+    ]
+
+    changes = diff_spaces(current, snapshot)
+    assert [s["id"] for s in changes["added"]] == ["5"]
+    assert [s["id"] for s in changes["renamed"]] == ["2"]
+    assert [s["id"] for s in changes["moved"]] == ["3"]
+    assert changes["removed"] == [snapshot_entry(previous[3])]
+
+
+def test_space_key_falls_back_to_english_name():
+    assert space_key({"id": None, "english_name": "osechill"}) == "osechill"
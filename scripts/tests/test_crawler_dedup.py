@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""유사 이미지 중복 제거: 해밍 거리 기준과 claim/release"""
+
+import numpy as np
+import pytest
+from PIL import Image
+
+import crawler_dedup
+from crawler_dedup import PerceptualIndex, hamming_distances, owner_of
+
+
+def save_gradient(path, flip=False, size=(120, 90)):
+    """가로 그라데이션 이미지 (flip이면 방향을 뒤집어서 해시 비트가 모두 달라짐)"""
+    row = np.linspace(0, 255, size[0])
+    if flip:
+        row = row[::-1]
+    pixels = np.tile(row, (size[1], 1)).astype(np.uint8)
+    Image.fromarray(pixels).convert('RGB').save(path, quality=90)
+    return path
+
+
+def make_index(tmp_path, values, threshold=crawler_dedup.DEFAULT_THRESHOLD):
+    index = PerceptualIndex(tmp_path / "hashes.npz", threshold=threshold)
+    for i, value in enumerate(values):
+        index._add(f"place-{i + 1}.jpg", value)
+    return index
+
+
+@pytest.mark.parametrize("builtin", [True, False])
+def test_hamming_distances_counts_differing_bits(monkeypatch, builtin):
+    if not builtin:
+        # numpy 2.0 미만 경로 (bitwise_count 없음)
+        monkeypatch.delattr(np, 'bitwise_count', raising=False)
+    hashes = np.array([0, 0b1011, 2 ** 64 - 1], dtype=np.uint64)
+    assert hamming_distances(hashes, 0).tolist() == [0, 3, 64]
+
+
+def test_find_similar_respects_threshold(tmp_path):
+    index = make_index(tmp_path, [0], threshold=3)
+    assert index.find_similar(0b111) == ("place-1.jpg", 3)
+    assert index.find_similar(0b1111) is None
+
+
+def test_claim_rejects_near_duplicate_and_release_frees_slot(tmp_path):
+    index = PerceptualIndex(tmp_path / "hashes.npz")
+    original = save_gradient(tmp_path / "a.jpg")
+    resized = save_gradient(tmp_path / "b.jpg", size=(300, 225))
+    different = save_gradient(tmp_path / "c.jpg", flip=True)
+
+    assert index.claim(original, "osechill-1.jpg") is None
+    assert index.claim(resized, "other-1.jpg") == ("osechill-1.jpg", 0)
+    assert index.claim(different, "osechill-2.jpg") is None
+    assert index.stats == {"checked": 3, "duplicates": 1}
+
+    # 저장에 실패한 파일은 빠지고 같은 사진을 다시 받을 수 있음
+    index.release("osechill-1.jpg")
+    assert index.files == ["osechill-2.jpg"]
+    assert index.claim(resized, "other-1.jpg") is None
+
+
+def test_save_and_reload_keeps_hashes(tmp_path):
+    index = make_index(tmp_path, [1, 2 ** 63 + 5])
+    index.save()
+
+    reloaded = PerceptualIndex(tmp_path / "hashes.npz")
+    assert reloaded.files == ["place-1.jpg", "place-2.jpg"]
+    assert reloaded.hashes.tolist() == [1, 2 ** 63 + 5]
+
+
+def test_forget_owner_drops_previous_files(tmp_path):
+    index = make_index(tmp_path, [1, 2])
+    index._add("other-1.jpg", 3)
+    index.forget_owner("place")
+    assert index.files == ["other-1.jpg"]
+    assert owner_of("my-place-12.jpg") == "my-place"
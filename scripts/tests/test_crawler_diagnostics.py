@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""배치 진단 리포트: 단계/셀렉터 집계, 느린 단계와 깨지는 단계 순서, 저장된 JSON"""
+
+import json
+
+import pytest
+
+from crawler_diagnostics import REPORT_NAME, DiagnosticReport, artifact_stem
+
+
+def step(name, seconds, ok=True):
+    return {"name": name, "ok": ok, "seconds": seconds}
+
+
+def place(name, steps, waits=(), selectors=None, failed_step=None, artifacts=()):
+    return {
+        "name": name,
+        "region": "서울",
+        "ok": failed_step is None,
+        "failed_step": failed_step,
+        "steps": list(steps),
+        "waits": list(waits),
+        "selectors": selectors or {},
+        "artifacts": list(artifacts),
+    }
+
+
+PLACES = [
+    place("A", [step("search", 0.1), step("open_panel", 2.0), step("photos", 0.5)],
+          waits=[step("panel", 1.0)],
+          selectors={"photos": {"button.a": True, "div.b": False}}),
+    place("B", [step("search", 0.2), step("open_panel", 3.0), step("photos", 0.4, ok=False)],
+          waits=[step("panel", 1.5, ok=False)],
+          selectors={"photos": {"button.a": False, "div.b": False}},
+          failed_step="photos", artifacts=["B-서울.html"]),
+    place("C", [step("search", 0.1), step("open_panel", 9.0, ok=False)],
+          waits=[step("panel", 8.0, ok=False)],
+          selectors={"panel": {"h1": False}},
+          failed_step="open_panel"),
+    place("D", [step("search", 0.3), step("open_panel", 1.0), step("photos", 0.6)],
+          waits=[step("panel", 0.5)],
+          selectors={"photos": {"button.a": True}, "panel": {"h1": True}}),
+]
+
+
+@pytest.fixture
+def report(tmp_path):
+    report = DiagnosticReport(tmp_path / "diagnostics")
+    for diagnosis in PLACES:
+        report.add(diagnosis)
+    return report
+
+
+def test_step_stats_merge_waits_and_percentiles(report):
+    stats = report.step_stats()
+
+    assert set(stats) == {"search", "open_panel", "photos", "wait.panel"}
+    assert stats["photos"]["runs"] == 3
+    assert stats["photos"]["failures"] == 1
+    assert stats["wait.panel"]["failure_rate"] == 0.5
+    assert stats["open_panel"]["p50"] == pytest.approx(2.5)
+    assert stats["open_panel"]["p95"] == pytest.approx(8.1)
+    assert stats["open_panel"]["max"] == 9.0
+
+
+def test_slowest_orders_by_p95(report):
+    stats = report.step_stats()
+
+    assert report.slowest(stats) == ["open_panel", "wait.panel", "photos", "search"]
+    assert report.slowest(stats, limit=2) == ["open_panel", "wait.panel"]
+
+
+def test_most_fragile_orders_by_failure_rate_and_skips_clean_steps(report):
+    stats = report.step_stats()
+
+    assert report.most_fragile(stats) == ["wait.panel", "photos", "open_panel"]
+
+
+def test_most_fragile_breaks_ties_by_failure_count():
+    report = DiagnosticReport()
+    for i in range(4):
+        # once: 1/2 실패, twice: 2/4 실패 - 실패율이 같으면 실패 횟수가 많은 쪽이 먼저
+        steps = [step("once", 0.1, ok=i == 0)] if i < 2 else []
+        steps.append(step("twice", 0.1, ok=i % 2 == 0))
+        report.add(place(f"P{i}", steps))
+
+    assert report.most_fragile(report.step_stats()) == ["twice", "once"]
+
+
+def test_selector_stats_hit_rates(report):
+    selectors = report.selector_stats()
+
+    assert selectors["photos"]["button.a"] == {"hits": 2, "misses": 1, "hit_rate": pytest.approx(2 / 3)}
+    assert selectors["photos"]["div.b"]["hit_rate"] == 0
+    assert selectors["panel"]["h1"]["hit_rate"] == 0.5
+
+
+def test_save_writes_report_atomically(report, tmp_path):
+    path = report.save()
+
+    assert path == tmp_path / "diagnostics" / REPORT_NAME
+    assert [p.name for p in path.parent.iterdir()] == [REPORT_NAME]
+
+    saved = json.loads(path.read_text(encoding='utf-8'))
+    assert [p["name"] for p in saved["places"]] == ["A", "B", "C", "D"]
+    assert saved["slowest"] == ["open_panel", "wait.panel", "photos", "search"]
+    assert saved["most_fragile"] == ["wait.panel", "photos", "open_panel"]
+    assert saved["steps"]["photos"]["failures"] == 1
+    assert saved["selectors"]["photos"]["div.b"]["misses"] == 2
+    assert saved["places"][1]["artifacts"] == ["B-서울.html"]
+    assert saved["generated_at"]
+
+
+def test_print_report_lists_dead_selectors_and_failures(report, capsys):
+    report.print_report()
+    out = capsys.readouterr().out
+
+    assert "2/4개 장소 성공" in out
+    assert "photos 셀렉터 중 한 번도 맞지 않음: div.b" in out
+    assert "B (서울): photos -> B-서울.html" in out
+
+
+@pytest.mark.parametrize("name, region, expected", [
+    ("카페 어니언", "서울 성수", "카페-어니언-서울-성수"),
+    ("Le Labo / 한남", "", "Le-Labo-한남"),
+    ("???", "", "place"),
+])
+def test_artifact_stem(name, region, expected):
+    assert artifact_stem(name, region) == expected
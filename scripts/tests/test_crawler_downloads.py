@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 다운로더 검증: 잘리거나 이미지가 아닌 응답은 최종 파일로 남지 않아야 함
+네트워크 대신 세션에 붙인 대역 어댑터가 응답을 돌려줌
+"""
+
+import io
+
+import pytest
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.exceptions import ProtocolError
+
+from crawler_downloads import ChecksumStore, ImageDownloader
+
+URL = "https://lh3.googleusercontent.com/p/AF1Qip=w1200"
+JPEG = b'\xff\xd8\xff\xe0' + b'\x00' * 4096
+
+
+class DroppingBody(io.BytesIO):
+    """앞부분만 보내고 연결이 끊기는 응답 본문"""
+
+    def __init__(self, data, drop_after):
+        super().__init__(data)
+        self.drop_after = drop_after
+
+    def read(self, size=-1):
+        if self.tell() >= self.drop_after:
+            raise ProtocolError("Connection broken: IncompleteRead")
+        return super().read(min(size, self.drop_after - self.tell()) if size and size > 0 else self.drop_after)
+
+
+class StubAdapter(BaseAdapter):
+    """요청마다 정해둔 응답을 돌려주는 requests 어댑터"""
+
+    def __init__(self, body=JPEG, status=200, headers=None, drop_after=None, content_length=True):
+        super().__init__()
+        self.body = body
+        self.status = status
+        self.headers = {"Content-Type": "image/jpeg", **(headers or {})}
+        self.drop_after = drop_after
+        self.content_length = content_length
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        response = Response()
+        response.url = request.url
+        response.request = request
+        response.status_code = self.status
+        response.headers = CaseInsensitiveDict(self.headers)
+        if self.content_length:
+            response.headers.setdefault("Content-Length", str(len(self.body)))
+        if self.drop_after is None:
+            response.raw = io.BytesIO(self.body)
+        else:
+            response.raw = DroppingBody(self.body, self.drop_after)
+        return response
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def downloader():
+    downloader = ImageDownloader(max_workers=1, retries=0)
+    yield downloader
+    downloader.close()
+
+
+def fetch_with(downloader, adapter, path, **options):
+    downloader.session.mount('https://', adapter)
+    for name, value in options.items():
+        setattr(downloader, name, value)
+    return downloader.fetch(URL, path)
+
+
+def leftovers(directory):
+    return sorted(p.name for p in directory.iterdir())
+
+
+def test_valid_image_is_saved_without_temp_file(downloader, tmp_path):
+    result = fetch_with(downloader, StubAdapter(), tmp_path / "osechill-1.jpg")
+    assert result["bytes"] == len(JPEG)
+    assert (tmp_path / "osechill-1.jpg").read_bytes() == JPEG
+    assert leftovers(tmp_path) == ["osechill-1.jpg"]
+
+
+@pytest.mark.parametrize("adapter, options", [
+    # 오류 페이지를 200으로 돌려주는 경우
+    (StubAdapter(b"<html>error</html>", headers={"Content-Type": "text/html"}), {}),
+    # Content-Type은 이미지인데 내용은 HTML
+    (StubAdapter(b"<!doctype html><html></html>"), {}),
+    # Content-Length만 보고 바로 중단
+    (StubAdapter(), {"max_bytes": 1024}),
+    # 길이를 알려주지 않는 응답은 받는 도중에 중단
+    (StubAdapter(content_length=False), {"max_bytes": 1024}),
+    # 본문 중간에 연결이 끊김
+    (StubAdapter(drop_after=1000), {}),
+    # 연결은 정상 종료됐지만 Content-Length보다 짧음
+    (StubAdapter(JPEG[:1000], headers={"Content-Length": str(len(JPEG))}), {}),
+], ids=["html-content-type", "magic-bytes", "content-length-too-big", "stream-too-big", "dropped", "truncated"])
+def test_rejected_response_leaves_no_file(downloader, tmp_path, adapter, options):
+    assert fetch_with(downloader, adapter, tmp_path / "osechill-1.jpg", **options) is None
+    assert leftovers(tmp_path) == []
+    assert downloader.stats["failed"] == 1
+
+
+def test_rejected_response_keeps_previous_file(downloader, tmp_path):
+    path = tmp_path / "osechill-1.jpg"
+    path.write_bytes(JPEG)
+    assert fetch_with(downloader, StubAdapter(drop_after=1000), path) is None
+    assert path.read_bytes() == JPEG
+    assert leftovers(tmp_path) == ["osechill-1.jpg"]
+
+
+def test_unchanged_content_does_not_replace_file(downloader, tmp_path):
+    path = tmp_path / "osechill-1.jpg"
+    checksums = ChecksumStore(tmp_path / "checksums.json")
+    fetch_with(downloader, StubAdapter(), path, checksums=checksums)
+    mtime = path.stat().st_mtime_ns
+
+    result = downloader.fetch(URL, path)
+    assert result["unchanged"]
+    assert downloader.stats["unchanged"] == 1
+    assert path.stat().st_mtime_ns == mtime
+    assert leftovers(tmp_path) == ["osechill-1.jpg"]
+
+
+def test_not_modified_reuses_recorded_checksum(downloader, tmp_path):
+    path = tmp_path / "osechill-1.jpg"
+    checksums = ChecksumStore(tmp_path / "checksums.json")
+    fetch_with(downloader, StubAdapter(headers={"ETag": '"v1"'}), path, checksums=checksums)
+    sha256 = checksums.get(path.name)["sha256"]
+
+    adapter = StubAdapter(b"", status=304)
+    result = fetch_with(downloader, adapter, path)
+    assert adapter.requests[0].headers["If-None-Match"] == '"v1"'
+    assert result == {"file": path.name, "url": URL, "sha256": sha256, "bytes": len(JPEG), "unchanged": True}
+    assert downloader.stats["not_modified"] == 1
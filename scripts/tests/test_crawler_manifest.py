@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+"""진행 기록(manifest): 이어서 실행할 장소 선택, 기록 파일 정리, 로컬 검증"""
+
+import hashlib
+import json
+
+from crawler_manifest import STATUS_COMPLETE, STATUS_PARTIAL, CrawlManifest, select_pending, verify_manifest
+
+
+def make_space(name, region="서울"):
+    return {"name": name, "english_name": name.lower(), "region": region}
+
+
+def keys(spaces):
+    return [space["english_name"] for space in spaces]
+
+
+def test_record_survives_reload_and_truncated_line(tmp_path):
+    path = tmp_path / "manifest.jsonl"
+    manifest = CrawlManifest(path)
+    manifest.record("a", STATUS_COMPLETE, urls=["u1"])
+    manifest.record("b", STATUS_PARTIAL)
+    # 중단 시점에 잘린 마지막 줄
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"key": "c", "sta')
+
+    reloaded = CrawlManifest(path)
+    assert reloaded.is_complete("a")
+    assert not reloaded.is_complete("b")
+    assert reloaded.get("c") is None
+
+    # 잘린 줄 뒤에 붙는 새 기록은 줄바꿈 후 별도 줄로 남아야 함
+    reloaded.record("d", STATUS_COMPLETE)
+    assert CrawlManifest(path).is_complete("d")
+
+
+def test_load_compacts_superseded_lines(tmp_path):
+    path = tmp_path / "manifest.jsonl"
+    manifest = CrawlManifest(path)
+    for i in range(150):
+        manifest.record("a", STATUS_PARTIAL, attempt=i)
+    manifest.record("a", STATUS_COMPLETE, attempt=150)
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 151
+
+    reloaded = CrawlManifest(path)
+    lines = path.read_text(encoding='utf-8').splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["attempt"] == 150
+    assert reloaded.is_complete("a")
+
+
+def test_select_pending_without_resume_takes_everything(tmp_path):
+    manifest = CrawlManifest(tmp_path / "manifest.jsonl")
+    manifest.record("a", STATUS_COMPLETE)
+    spaces = [make_space("A"), make_space("B")]
+
+    pending, skipped = select_pending(spaces, manifest)
+    assert keys(pending) == ["a", "b"]
+    assert skipped == 0
+
+
+def test_select_pending_resume_skips_only_complete(tmp_path):
+    manifest = CrawlManifest(tmp_path / "manifest.jsonl")
+    manifest.record("a", STATUS_COMPLETE)
+    manifest.record("b", STATUS_PARTIAL)
+    spaces = [make_space("A"), make_space("B"), make_space("C")]
+
+    pending, skipped = select_pending(spaces, manifest, resume=True)
+    assert keys(pending) == ["b", "c"]
+    assert skipped == 1
+
+
+def test_select_pending_refresh_forces_complete_places(tmp_path):
+    manifest = CrawlManifest(tmp_path / "manifest.jsonl")
+    for key in ("a", "b", "c"):
+        manifest.record(key, STATUS_COMPLETE)
+    spaces = [make_space("A"), make_space("B"), make_space("C", region="부산")]
+
+    pending, _ = select_pending(spaces, manifest, resume=True, refresh_names=["A"], refresh_regions=["부산"])
+    assert keys(pending) == ["a", "c"]
+
+    # resume 없이 refresh만 지정하면 지정한 장소만
+    pending, skipped = select_pending(spaces, manifest, refresh_names=["b"])
+    assert keys(pending) == ["b"]
+    assert skipped == 2
+
+
+def test_select_pending_adds_refresh_to_incremental_list(tmp_path):
+    manifest = CrawlManifest(tmp_path / "manifest.jsonl")
+    manifest.record("b", STATUS_COMPLETE)
+    # --incremental이 이미 골라둔 목록 (새로 추가된 a + --refresh로 지정한 b)
+    spaces = [make_space("A"), make_space("B")]
+
+    pending, skipped = select_pending(spaces, manifest, refresh_names=["B"], refresh_only=False)
+    assert keys(pending) == ["a", "b"]
+    assert skipped == 0
+
+
+def test_verify_manifest_marks_broken_places_partial(tmp_path):
+    png = b'\x89PNG\r\n\x1a\n' + b'\x00' * 64
+    (tmp_path / "good.png").write_bytes(png)
+    (tmp_path / "bad.png").write_bytes(png[:-1] + b'\x01')
+    (tmp_path / "text.png").write_bytes(b'not an image')
+    expected = {"bytes": len(png), "sha256": hashlib.sha256(png).hexdigest()}
+
+    manifest = CrawlManifest(tmp_path / "manifest.jsonl")
+    manifest.record("ok", STATUS_COMPLETE, files=[dict(expected, file="good.png")])
+    manifest.record("broken", STATUS_COMPLETE, files=[
+        dict(expected, file="bad.png"),
+        {"file": "text.png"},
+        dict(expected, file="missing.png"),
+    ])
+
+    result = verify_manifest(manifest, download_dir=tmp_path)
+    assert result["checked"] == 4
+    assert dict(result["broken"]["broken"]) == {
+        "bad.png": "SHA-256 불일치",
+        "text.png": "이미지 형식이 아님",
+        "missing.png": "파일 없음",
+    }
+    assert "ok" not in result["broken"]
+
+    reloaded = CrawlManifest(tmp_path / "manifest.jsonl")
+    assert reloaded.is_complete("ok")
+    assert reloaded.get("broken")["status"] == STATUS_PARTIAL
+    assert len(reloaded.get("broken")["verify_errors"]) == 3
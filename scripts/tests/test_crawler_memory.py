@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""드라이버 재시작 기준: 장소 수 / 메모리 상한에서 재시작, psutil이 없으면 메모리 기준은 조용히 꺼짐"""
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+import crawler_memory
+from crawler_memory import RecyclePolicy, browser_rss
+from crawler_metrics import Metrics
+
+MB = 1024 * 1024
+
+
+def session(places_done=0, pid=None):
+    """places_done과 driver(service.process.pid)를 가진 크롤러 세션 흉내"""
+    return SimpleNamespace(places_done=places_done, driver=SimpleNamespace(service=SimpleNamespace(process=SimpleNamespace(pid=pid))))
+
+
+@pytest.fixture
+def rss(monkeypatch):
+    """browser_rss가 돌려줄 값을 테스트에서 바꿀 수 있게 함"""
+    measured = {"value": 0, "calls": 0}
+
+    def fake_browser_rss(driver):
+        measured["calls"] += 1
+        return measured["value"]
+
+    monkeypatch.setattr(crawler_memory, 'browser_rss', fake_browser_rss)
+    return measured
+
+
+def test_recycles_after_max_places(rss):
+    metrics = Metrics()
+    policy = RecyclePolicy(max_places=3, max_rss_mb=None, metrics=metrics)
+
+    assert policy.check(session(places_done=2)) is None
+    assert policy.check(session(places_done=3)) == "장소 3개 처리"
+    assert policy.recycled == {"places": 1, "memory": 0}
+    assert metrics.counters["driver_recycled"] == 1
+    assert rss["calls"] == 0
+
+
+def test_recycles_at_memory_ceiling(rss):
+    policy = RecyclePolicy(max_places=100, max_rss_mb=512)
+
+    rss["value"] = 511 * MB
+    assert policy.check(session(places_done=1)) is None
+    rss["value"] = 512 * MB
+    assert policy.check(session(places_done=2)) == "브라우저 메모리 512MB"
+    rss["value"] = 300 * MB
+    assert policy.check(session(places_done=3)) is None
+
+    assert policy.recycled == {"places": 0, "memory": 1}
+    assert policy.peak_rss == 512 * MB
+
+
+def test_place_limit_wins_without_measuring(rss):
+    rss["value"] = 4096 * MB
+    policy = RecyclePolicy(max_places=5, max_rss_mb=512)
+
+    assert policy.check(session(places_done=5)) == "장소 5개 처리"
+    assert policy.recycled == {"places": 1, "memory": 0}
+    assert rss["calls"] == 0
+
+
+def test_unmeasurable_browser_never_recycles_on_memory(rss):
+    rss["value"] = None
+    policy = RecyclePolicy(max_places=None, max_rss_mb=1)
+
+    assert policy.check(session(places_done=1000)) is None
+    assert policy.peak_rss == 0
+
+
+def test_without_psutil_memory_limit_is_disabled(monkeypatch, capsys):
+    monkeypatch.setitem(sys.modules, 'psutil', None)
+
+    policy = RecyclePolicy(max_places=10, max_rss_mb=1)
+    assert policy.max_rss is None
+    assert "psutil" in capsys.readouterr().out
+
+    assert policy.check(session(places_done=9, pid=os.getpid())) is None
+    assert policy.check(session(places_done=10, pid=os.getpid())) == "장소 10개 처리"
+    assert browser_rss(session(pid=os.getpid()).driver) is None
+
+
+def test_browser_rss_sums_process_tree():
+    pytest.importorskip('psutil')
+
+    assert browser_rss(session(pid=os.getpid()).driver) > 0
+    assert browser_rss(SimpleNamespace()) is None
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""크롤러 계측: 분위수, 타이머, 트레이스와 리포트 내보내기"""
+
+import json
+
+import pytest
+
+from crawler_metrics import Metrics, load_report, percentile
+
+
+def test_percentile_interpolates_linearly():
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentile(values, 0.5) == 3.0
+    assert percentile(values, 0.95) == pytest.approx(4.8)
+    assert percentile([7.0], 0.99) == 7.0
+    assert percentile([], 0.5) == 0.0
+
+
+def test_summary_aggregates_samples_and_failures():
+    metrics = Metrics()
+    for seconds in (0.1, 0.2, 0.3, 0.4):
+        metrics.observe("download", seconds)
+    metrics.observe("download", 1.0, ok=False)
+    metrics.count("bytes", 100)
+    metrics.count("bytes", 50)
+
+    summary = metrics.summary()
+    assert summary["counters"] == {"bytes": 150}
+    assert summary["timings"]["download"] == {
+        "count": 5, "failures": 1, "total": 2.0, "p50": 0.3, "p95": 0.88, "p99": 0.976, "max": 1.0,
+    }
+
+
+def test_timer_records_failure_and_reraises():
+    metrics = Metrics()
+    with metrics.timer("ok_step"):
+        pass
+    with pytest.raises(KeyError):
+        with metrics.timer("broken_step"):
+            raise KeyError("x")
+
+    timings = metrics.summary()["timings"]
+    assert timings["ok_step"]["failures"] == 0
+    assert timings["broken_step"]["failures"] == 1
+
+
+def test_trace_report_and_prometheus_files(tmp_path):
+    metrics = Metrics(trace_path=tmp_path / "trace.jsonl")
+    metrics.observe("wait.photos", 0.5, place="오센칠")
+    metrics.count("driver_recycled", reason="memory")
+    metrics.close()
+
+    events = [json.loads(line) for line in (tmp_path / "trace.jsonl").read_text(encoding='utf-8').splitlines()]
+    assert [e["event"] for e in events] == ["wait.photos", "driver_recycled"]
+    assert events[0]["place"] == "오센칠"
+
+    metrics.save_report(tmp_path / "report.json")
+    assert load_report(tmp_path / "report.json")["timings"]["wait.photos"]["count"] == 1
+    assert load_report(tmp_path / "missing.json") is None
+
+    metrics.write_prometheus(tmp_path / "crawler.prom")
+    text = (tmp_path / "crawler.prom").read_text(encoding='utf-8')
+    assert 'scent_crawler_stage_seconds{stage="wait.photos",quantile="0.95"} 0.5' in text
+    assert "scent_crawler_driver_recycled_total 1" in text
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""장소 이동: 장소 패널이 열리면 장소 URL을 캐시에 저장"""
+
+from selenium.common.exceptions import NoSuchElementException
+
+from crawler_resolver import PlaceUrlCache
+
+PLACE_URL = "https://www.google.com/maps/place/Osechill/@37.5,127.0,17z/data=!3m1?entry=ttu"
+
+
+class FakeDriver:
+    """검색 URL이 장소 페이지로 바로 연결되는 드라이버"""
+
+    def __init__(self):
+        self.current_url = None
+
+    def get(self, url):
+        self.current_url = PLACE_URL
+
+    def find_element(self, *args):
+        raise NoSuchElementException("사진 탭 없음")
+
+    def quit(self):
+        pass
+
+
+class FakeReadiness:
+    def wait_for(self, name, condition):
+        return "place"
+
+    def record(self, name, seconds):
+        pass
+
+
+def make_crawler(crawler_module, tmp_path, place_cache):
+    class Crawler(crawler_module.GoogleMapsImageCrawler):
+        def _setup_driver(self, headless=True):
+            return FakeDriver()
+
+        def _collect_dom_photo_urls(self, max_images):
+            return []
+
+    crawler = Crawler(download_dir=tmp_path / "images", place_cache=place_cache)
+    crawler.readiness = FakeReadiness()
+    return crawler
+
+
+def test_opening_place_writes_url_cache(crawler_module, tmp_path):
+    place_cache = PlaceUrlCache(tmp_path / "place_urls.json")
+    crawler = make_crawler(crawler_module, tmp_path, place_cache)
+
+    assert crawler.open_place("오센칠", "서울", cache_key="osechill")
+    crawler.get_place_images()
+    crawler.close()
+
+    assert place_cache.get("osechill") == "https://www.google.com/maps/place/Osechill/@37.5,127.0,17z/data=!3m1"
+    assert crawler.current_place_key is None
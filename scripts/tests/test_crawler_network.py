@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+"""네트워크 사진 수집: URL 판별/정규화, performance 로그에서 중복 없이 수집, max_images에서 중단"""
+
+import json
+
+import pytest
+
+import crawler_network
+from crawler_network import NetworkPhotoCollector, is_place_photo_url, network_photos_collected, normalize_photo_url
+
+PHOTO = 'https://lh3.googleusercontent.com/p/AF1QipA'
+
+
+class FakeDriver:
+    """get_log('performance') 호출마다 준비된 로그 묶음을 하나씩 돌려주는 드라이버"""
+
+    def __init__(self, *batches):
+        self.batches = list(batches)
+
+    def get_log(self, kind):
+        assert kind == 'performance'
+        return self.batches.pop(0) if self.batches else []
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+
+def entry(method, **params):
+    """Chrome performance 로그 한 줄과 같은 형태"""
+    return {'message': json.dumps({'message': {'method': method, 'params': params}})}
+
+
+def response(url, mime='image/jpeg'):
+    return entry('Network.responseReceived', response={'url': url, 'mimeType': mime})
+
+
+def request(url, kind='Image'):
+    return entry('Network.requestWillBeSent', request={'url': url}, type=kind)
+
+
+@pytest.mark.parametrize("url, expected", [
+    (PHOTO + '=w408-h306-k-no', True),
+    ('https://lh5.googleusercontent.com/gps-cs-s/AB12=s1600', True),
+    ('https://lh3.googleusercontent.com/a/ACg8ocK=s40-c', False),       # 프로필 사진
+    ('https://lh3.googleusercontent.com/a-/ALV-Uj=s32', False),         # 프로필 사진 (구형)
+    ('https://maps.gstatic.com/mapfiles/place_api/icons/v1/png_71/generic.png', False),  # 정적 아이콘
+    ('https://www.google.com/maps/vt/pb=!1m5', False),                  # 지도 타일
+])
+def test_is_place_photo_url(url, expected):
+    assert is_place_photo_url(url) is expected
+
+
+@pytest.mark.parametrize("url, size, expected", [
+    (PHOTO + '=w408-h306-k-no', 'w1200-h800', PHOTO + '=w1200-h800'),
+    (PHOTO + '=s1600', 'w1200-h800', PHOTO + '=w1200-h800'),
+    (PHOTO, 'w1200-h800', PHOTO + '=w1200-h800'),
+    (PHOTO + '=w80-h80-k-no?authuser=0', 's800', PHOTO + '=s800'),
+])
+def test_normalize_photo_url(url, size, expected):
+    assert normalize_photo_url(url, size) == expected
+
+
+def test_poll_collects_unique_place_photos_and_counts_bytes():
+    driver = FakeDriver([
+        response(PHOTO + '=w408-h306-k-no'),
+        request(PHOTO + '=w80-h80-k-no'),                       # 같은 사진의 다른 크기
+        response('https://lh3.googleusercontent.com/a/ACg8=s40-c'),   # 프로필 사진
+        response(PHOTO + 'B=s1600', mime='text/html'),          # 이미지 응답이 아님
+        request(PHOTO + 'C=s1600', kind='XHR'),                 # 이미지 요청이 아님
+        entry('Network.loadingFinished', encodedDataLength=1500),
+        entry('Network.dataReceived', dataLength=99),
+        {'message': '{"message": '},                            # 잘린 로그
+        {},
+    ], [
+        request(PHOTO + 'D=w203-h152-k-no'),                    # 차단된 요청도 URL은 수집
+        entry('Network.loadingFinished', encodedDataLength=500),
+    ])
+    collector = NetworkPhotoCollector(driver)
+
+    assert collector.poll() == [PHOTO + '=w1200-h800']
+    assert collector.bytes_received == 1500
+    assert collector.poll() == [PHOTO + '=w1200-h800', PHOTO + 'D=w1200-h800']
+    assert collector.bytes_received == 2000
+
+
+def test_reset_discards_previous_place():
+    driver = FakeDriver([response(PHOTO + '=s100')], [response(PHOTO + 'B=s100')])
+    collector = NetworkPhotoCollector(driver, size='s800')
+    collector.urls = ['stale']
+    collector.bytes_received = 10
+
+    collector.reset()   # 첫 묶음(이전 장소 로그)은 버려짐
+    assert collector.poll() == [PHOTO + 'B=s800']
+    assert collector.bytes_received == 0
+
+
+def test_condition_stops_at_max_images():
+    driver = FakeDriver([response(f'{PHOTO}{i}=s100') for i in range(5)])
+    condition = network_photos_collected(NetworkPhotoCollector(driver), max_images=3)
+
+    assert condition(driver) == [f'{PHOTO}{i}=w1200-h800' for i in range(3)]
+
+
+def test_condition_returns_fewer_once_count_settles(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(crawler_network, 'time', clock)
+    driver = FakeDriver([], [], [response(PHOTO + '=s100')])
+    condition = network_photos_collected(NetworkPhotoCollector(driver), max_images=3, settle=0.8)
+
+    assert condition(driver) is False          # 아직 아무것도 없음
+    clock.now = 5.0
+    assert condition(driver) is False          # 0개로 오래 머물러도 반환하지 않음
+    assert condition(driver) is False          # 1개로 늘어남 → 다시 대기 시작
+    clock.now = 5.5
+    assert condition(driver) is False
+    clock.now = 6.0
+    assert condition(driver) == [PHOTO + '=w1200-h800']
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+이미지 플레이스홀더: BlurHash 참조값 비교, 대표 색상, 묶음 계산
+참조 인코더는 woltapp/blurhash의 TypeScript 구현을 픽셀 단위 반복문 그대로 옮긴 것
+"""
+
+import math
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from crawler_placeholders import (
+    BASE83, blurhash_factors, compute_placeholders, dominant_colors, encode_base83, encode_blurhash
+)
+
+# blurhash-python(woltapp 알고리즘)으로 만든 값 - 32x32, 왼쪽 빨강/오른쪽 파랑, 가운데 줄에 고정 시드 잡음
+REFERENCE_HASH = "L;HT07{Hs8OuoMn$jsbHWBW=a}jZ"
+
+
+def reference_pixels():
+    pixels = np.zeros((32, 32, 3), dtype=np.uint8)
+    pixels[:, :16] = [200, 30, 40]
+    pixels[:, 16:] = [20, 120, 220]
+    rng = np.random.default_rng(0)
+    pixels[10:20] += rng.integers(0, 30, (10, 32, 3)).astype(np.uint8)
+    return pixels
+
+
+def scalar_blurhash(pixels, components_x=4, components_y=3):
+    """참조 구현을 그대로 옮긴 느린 인코더 (벡터화한 구현과 비교용)"""
+    height, width, _ = pixels.shape
+
+    def to_linear(value):
+        v = value / 255
+        return v / 12.92 if v <= 0.04045 else ((v + 0.055) / 1.055) ** 2.4
+
+    def to_srgb(value):
+        v = max(0.0, min(1.0, value))
+        if v <= 0.0031308:
+            return math.trunc(v * 12.92 * 255 + 0.5)
+        return math.trunc((1.055 * v ** (1 / 2.4) - 0.055) * 255 + 0.5)
+
+    def encode83(value, length):
+        return ''.join(BASE83[(value // 83 ** (length - i)) % 83] for i in range(1, length + 1))
+
+    factors = []
+    for j in range(components_y):
+        for i in range(components_x):
+            normalisation = 1 if i == 0 and j == 0 else 2
+            r = g = b = 0.0
+            for y in range(height):
+                for x in range(width):
+                    basis = math.cos(math.pi * i * x / width) * math.cos(math.pi * j * y / height)
+                    pr, pg, pb = (int(c) for c in pixels[y, x])
+                    r += basis * to_linear(pr)
+                    g += basis * to_linear(pg)
+                    b += basis * to_linear(pb)
+            scale = normalisation / (width * height)
+            factors.append((r * scale, g * scale, b * scale))
+
+    dc, ac = factors[0], factors[1:]
+    result = encode83((components_x - 1) + (components_y - 1) * 9, 1)
+    actual = max(abs(v) for factor in ac for v in factor)
+    quantised_max = math.floor(max(0, min(82, math.floor(actual * 166 - 0.5))))
+    maximum = (quantised_max + 1) / 166
+    result += encode83(quantised_max, 1)
+    result += encode83((to_srgb(dc[0]) << 16) + (to_srgb(dc[1]) << 8) + to_srgb(dc[2]), 4)
+
+    def quantise(value):
+        signed = math.copysign(abs(value / maximum) ** 0.5, value)
+        return math.floor(max(0, min(18, math.floor(signed * 9 + 9.5))))
+
+    for r, g, b in ac:
+        result += encode83(quantise(r) * 19 * 19 + quantise(g) * 19 + quantise(b), 2)
+    return result
+
+
+def gradient_pixels(seed):
+    rng = np.random.default_rng(seed)
+    grid = rng.integers(0, 256, (4, 4, 3), dtype=np.uint8)
+    return np.asarray(Image.fromarray(grid, 'RGB').resize((32, 32), Image.BILINEAR))
+
+
+def test_encode_base83_matches_alphabet():
+    assert encode_base83(0, 1) == "0"
+    assert encode_base83(82, 1) == "~"
+    assert encode_base83(83 * 83 - 1, 2) == "~~"
+    assert encode_base83(3429, 2) == "fQ"
+
+
+def test_blurhash_matches_reference_string():
+    factors = blurhash_factors(reference_pixels()[None])
+    assert encode_blurhash(factors[0]) == REFERENCE_HASH
+
+
+def test_batched_blurhash_matches_scalar_reference():
+    images = [reference_pixels()] + [gradient_pixels(seed) for seed in range(3)]
+    hashes = [encode_blurhash(factors) for factors in blurhash_factors(np.stack(images))]
+    assert hashes == [scalar_blurhash(pixels) for pixels in images]
+    assert all(len(h) == 28 for h in hashes)
+
+
+def test_solid_image_keeps_color_in_dc_component():
+    pixels = np.full((1, 32, 32, 3), [10, 20, 30], dtype=np.uint8)
+    blurhash = encode_blurhash(blurhash_factors(pixels)[0])
+    # 크기 플래그 L(4x3), 최대 AC 0, DC(4자리)는 원래 색 그대로
+    assert blurhash[:6] == "L0" + encode_base83((10 << 16) + (20 << 8) + 30, 4)
+
+
+def test_dominant_colors_picks_largest_bin():
+    pixels = np.zeros((1, 10, 10, 3), dtype=np.uint8)
+    pixels[0, :7] = [250, 10, 10]
+    pixels[0, 7:] = [10, 10, 250]
+    assert dominant_colors(pixels) == ["#fa0a0a"]
+
+
+@pytest.mark.parametrize("batch_size", [16, 1])
+def test_compute_placeholders_skips_unreadable_files(tmp_path, batch_size):
+    good = tmp_path / "a.jpg"
+    Image.fromarray(reference_pixels()).save(good)
+    broken = tmp_path / "b.jpg"
+    broken.write_bytes(b"not an image")
+
+    # batch_size=1이면 묶음이 둘이라 프로세스 풀 경로를 탐
+    result = compute_placeholders([good, broken], max_workers=2, batch_size=batch_size)
+    assert list(result) == [str(good)]
+    placeholder = result[str(good)]
+    assert len(placeholder["blurhash"]) == 28
+    assert placeholder["color"].startswith("#") and len(placeholder["color"]) == 7
+    assert placeholder["lqip"].startswith("data:image/webp;base64,")
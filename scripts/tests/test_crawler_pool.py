@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""CrawlerPool: 작업 분배, 죽은 세션 교체와 재시도"""
+
+import itertools
+import threading
+
+from crawler_pool import CrawlerPool
+
+
+class FakeSession:
+    ids = itertools.count(1)
+
+    def __init__(self):
+        self.id = next(self.ids)
+        self.alive = True
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+def test_run_processes_every_job_once():
+    pool = CrawlerPool(FakeSession, size=3)
+    results, leftover = pool.run(range(20), lambda session, job: job * 2)
+    pool.close()
+
+    assert sorted(r["value"] for r in results) == [job * 2 for job in range(20)]
+    assert all(r["error"] is None for r in results)
+    assert leftover == []
+
+
+def test_dead_session_is_replaced_and_job_retried():
+    crashed = threading.Event()
+
+    def handler(session, job):
+        if job == 3 and not crashed.is_set():
+            crashed.set()
+            session.alive = False
+            raise RuntimeError("chrome crashed")
+        return job
+
+    pool = CrawlerPool(FakeSession, size=2, is_healthy=lambda session: session.alive)
+    results, _ = pool.run(range(6), handler)
+    pool.close()
+
+    by_job = {r["job"]: r for r in results}
+    assert sorted(by_job) == list(range(6))
+    assert by_job[3]["error"] is None
+    assert by_job[3]["attempts"] == 2
+    assert pool.replaced == 1
+
+
+def test_start_counts_sessions_that_failed_to_start():
+    attempts = itertools.count()
+
+    def factory():
+        if next(attempts) == 0:
+            raise SystemExit(1)
+        return FakeSession()
+
+    pool = CrawlerPool(factory, size=2)
+    assert pool.start() == 1
+    pool.close()
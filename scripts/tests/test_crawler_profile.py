@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""브라우저 프로필 풀: 워커별 프로필 빌리기/반납과 warm 프로필 복사"""
+
+import pytest
+
+from crawler_profile import ProfilePool, is_warm
+
+
+def test_acquire_uses_lowest_free_slot_and_release_returns_it(tmp_path):
+    pool = ProfilePool(tmp_path, size=2)
+    first, second = pool.acquire(), pool.acquire()
+    assert (first.name, second.name) == ("worker-1", "worker-2")
+
+    pool.release(first)
+    assert pool.acquire() == first
+    assert pool.in_use == {1, 2}
+
+
+def test_prepare_copies_warm_profile_to_new_slots(tmp_path):
+    seed = tmp_path / "worker-1"
+    seed.mkdir()
+    (seed / "Cookies").write_text("x")
+    (seed / "SingletonLock").write_text("lock")
+
+    assert ProfilePool(tmp_path, size=3).prepare() == 2
+    assert is_warm(tmp_path / "worker-3")
+    assert not (tmp_path / "worker-3" / "SingletonLock").exists()
+
+
+def test_failed_driver_setup_releases_profile(crawler_module, tmp_path):
+    class BrokenCrawler(crawler_module.GoogleMapsImageCrawler):
+        def _setup_driver(self, headless=True):
+            raise SystemExit(1)
+
+    pool = ProfilePool(tmp_path / "profiles", size=1)
+    with pytest.raises(SystemExit):
+        BrokenCrawler(download_dir=tmp_path / "images", profiles=pool)
+    assert pool.in_use == set()
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""분산 작업 큐: 임대 만료, 회수, 재시도와 다시 대기시키기"""
+
+import queue
+
+import pytest
+
+import crawler_queue
+from crawler_manifest import STATUS_COMPLETE, STATUS_PARTIAL
+from crawler_queue import JOB_DONE, JOB_FAILED, LeaseQueue, SqliteWorkQueue, open_work_queue
+
+
+class FakeClock:
+    """임대 만료 시각 계산용 벽시계 대역"""
+
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(crawler_queue, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def work_queue(tmp_path):
+    work_queue = SqliteWorkQueue(tmp_path / "queue.sqlite", max_attempts=2)
+    work_queue.enqueue([{"english_name": "a"}, {"english_name": "b"}])
+    yield work_queue
+    work_queue.close()
+
+
+def test_enqueue_ignores_known_keys_unless_reset(work_queue):
+    assert work_queue.enqueue([{"english_name": "a"}, {"english_name": "c"}]) == 1
+    key, _, _ = work_queue.lease("w1")
+    work_queue.complete(key, "w1")
+    assert work_queue.enqueue([{"english_name": key}], reset=True) == 1
+    assert work_queue.status()["counts"] == {"pending": 3}
+
+
+def test_expired_lease_is_reclaimed_by_another_worker(work_queue, clock):
+    assert work_queue.lease("w1", timeout=10)[0] == "a"
+    assert work_queue.lease("w2", timeout=10)[0] == "b"
+    assert work_queue.lease("w2", timeout=10) is None
+
+    # 하트비트가 끊기고 만료 시각이 지나면 다른 워커가 가져감
+    clock.now += 11
+    assert work_queue.status()["expired"] == 2
+    assert work_queue.lease("w2", timeout=10) == ("a", {"english_name": "a"}, 2)
+
+    # 임대를 잃은 워커의 보고는 무시됨
+    assert not work_queue.heartbeat("a", "w1")
+    assert not work_queue.complete("a", "w1")
+    assert work_queue.complete("a", "w2")
+
+
+def test_lease_expiring_past_max_attempts_marks_failed(work_queue, clock):
+    for attempt in (1, 2):
+        assert [work_queue.lease("w1", timeout=10)[2] for _ in range(2)] == [attempt, attempt]
+        clock.now += 11
+
+    # 두 장소 모두 시도 횟수를 다 쓴 채로 또 만료되어 다시 내주지 않고 실패로 남김
+    assert work_queue.lease("w1", timeout=10) is None
+    assert work_queue.status()["counts"] == {JOB_FAILED: 2}
+
+
+def test_fail_retries_until_max_attempts_then_requeue(work_queue):
+    key, _, _ = work_queue.lease("w1")
+    work_queue.fail(key, "w1", "timeout")
+    assert work_queue.lease("w1")[0] == key
+    work_queue.fail(key, "w1", "timeout")
+    assert work_queue.status()["counts"][JOB_FAILED] == 1
+
+    assert work_queue.requeue() == 1
+    assert work_queue.lease("w1") == (key, {"english_name": key}, 1)
+
+
+def test_release_returns_lease_without_spending_attempt(work_queue):
+    work_queue.lease("w1")
+    assert work_queue.release("a", "w1")
+    assert work_queue.lease("w2") == ("a", {"english_name": "a"}, 1)
+
+
+def test_lease_queue_reports_results_and_returns_unfinished(work_queue):
+    leases = LeaseQueue(work_queue, owner="w1", lease_timeout=60, wait_for_leases=False)
+    (first, attempts), (second, _) = leases.get_nowait(), leases.get_nowait()
+    assert attempts == 1
+    with pytest.raises(queue.Empty):
+        leases.get_nowait()
+
+    leases.finish(first["english_name"], STATUS_COMPLETE, {"files": 3})
+    leases.finish(second["english_name"], STATUS_PARTIAL)
+    assert leases.stats["done"] == 1 and leases.stats["retried"] == 1
+
+    # 다시 가져간 작업은 close()에서 반납
+    leases.get_nowait()
+    leases.close()
+    assert work_queue.status()["counts"] == {JOB_DONE: 1, "pending": 1}
+
+
+def test_open_work_queue_parses_urls(tmp_path):
+    work_queue = open_work_queue(f"sqlite:///{tmp_path}/q.sqlite")
+    assert work_queue.path == tmp_path / "q.sqlite"
+    work_queue.close()
+    with pytest.raises(ValueError):
+        open_work_queue("redis://localhost/0")
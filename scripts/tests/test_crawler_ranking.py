@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+"""후보 사진 점수: 선명하고 노출이 맞는 가로 사진이 흐린/어두운/극단 비율 사진보다 앞서야 함"""
+
+import io
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from crawler_ranking import GRID, THUMBNAIL_EDGE, decode_thumbnail, score_thumbnails
+
+LANDSCAPE = (THUMBNAIL_EDGE, THUMBNAIL_EDGE * 2 // 3)
+
+
+def texture(seed=0):
+    """중간 밝기(0.2~0.8)의 잘게 변하는 장면"""
+    rng = np.random.default_rng(seed)
+    return (0.2 + 0.6 * rng.random((GRID, GRID))).astype(np.float32)
+
+
+def blur(gray, radius=4):
+    """가로/세로 상자 필터를 여러 번 걸어 흐리게 만든 장면"""
+    kernel = np.ones(2 * radius + 1, dtype=np.float32) / (2 * radius + 1)
+    for _ in range(3):
+        gray = np.apply_along_axis(lambda row: np.convolve(row, kernel, mode='same'), 1, gray)
+        gray = np.apply_along_axis(lambda col: np.convolve(col, kernel, mode='same'), 0, gray)
+    # 가장자리 0 패딩 영향을 빼고 원래 평균 밝기로 맞춤
+    return np.clip(gray - gray[8:-8, 8:-8].mean() + 0.5, 0, 1).astype(np.float32)
+
+
+CANDIDATES = {
+    "sharp": (LANDSCAPE, texture()),
+    "blurred": (LANDSCAPE, blur(texture())),
+    "dark": (LANDSCAPE, texture() * 0.05),
+    "blown_out": (LANDSCAPE, np.clip(texture() + 0.7, 0, 1)),
+    "panorama": ((THUMBNAIL_EDGE, THUMBNAIL_EDGE // 6), texture()),
+    "portrait": ((THUMBNAIL_EDGE * 9 // 16, THUMBNAIL_EDGE), texture()),
+    "icon": ((48, 48), texture()),
+}
+
+
+def score(names):
+    sizes = [CANDIDATES[name][0] for name in names]
+    grays = np.stack([CANDIDATES[name][1] for name in names])
+    return score_thumbnails(sizes, grays)
+
+
+def test_sharp_landscape_ranks_first():
+    names = list(CANDIDATES)
+    scores = score(names)
+    order = [names[i] for i in np.argsort(-scores["total"], kind='stable')]
+
+    assert order[0] == "sharp"
+    for name in scores:
+        assert ((scores[name] >= 0) & (scores[name] <= 1)).all(), name
+
+
+@pytest.mark.parametrize("worse, component", [
+    ("blurred", "sharpness"),
+    ("dark", "exposure"),
+    ("blown_out", "exposure"),
+    ("panorama", "aspect"),
+    ("portrait", "aspect"),
+    ("icon", "resolution"),
+])
+def test_each_defect_lowers_its_own_component(worse, component):
+    scores = score(["sharp", worse])
+
+    assert scores[component][0] > scores[component][1]
+    assert scores["total"][0] > scores["total"][1]
+
+
+def test_sharpness_is_normalized_within_batch():
+    scores = score(["blurred", "sharp"])
+    assert scores["sharpness"][1] == pytest.approx(1.0)
+
+    # 단색 이미지만 있는 묶음은 0으로 나누지 않음
+    flat = score_thumbnails([LANDSCAPE], np.full((1, GRID, GRID), 0.5, dtype=np.float32))
+    assert flat["sharpness"][0] == 0
+
+
+def test_decode_thumbnail_keeps_original_size():
+    buffer = io.BytesIO()
+    Image.fromarray((texture() * 255).astype(np.uint8)).resize(LANDSCAPE).save(buffer, format='PNG')
+
+    size, gray = decode_thumbnail(buffer.getvalue())
+    assert size == LANDSCAPE
+    assert gray.shape == (GRID, GRID)
+    assert 0.3 < gray.mean() < 0.7
+    assert decode_thumbnail(b'<html></html>') is None
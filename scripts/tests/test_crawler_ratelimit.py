@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+"""요청 속도 제어: 토큰 버킷 AIMD와 회로 차단기 멈춤 시간"""
+
+import pytest
+
+import crawler_ratelimit
+from crawler_ratelimit import (
+    DEFAULT_CEILING, CircuitBreaker, RateLimiter, TokenBucket, host_of, retry_after_seconds
+)
+
+
+class FakeClock:
+    """time.monotonic/time.sleep 대역 (sleep하면 시계만 앞으로 감)"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(crawler_ratelimit, 'time', clock)
+    return clock
+
+
+def test_token_bucket_halves_on_failure_and_recovers_additively(clock):
+    bucket = TokenBucket(rate=8, max_rate=8, min_rate=1)
+
+    for expected in (4, 2, 1, 1):
+        bucket.slow_down()
+        assert bucket.rate == expected
+
+    # 성공할 때마다 max_rate / 20 씩 올라가고 max_rate에서 멈춤
+    bucket.speed_up()
+    assert bucket.rate == pytest.approx(1.4)
+    for _ in range(40):
+        bucket.speed_up()
+    assert bucket.rate == 8
+
+
+def test_token_bucket_probes_above_starting_rate_by_default(clock):
+    bucket = TokenBucket(rate=0.5)
+    assert bucket.max_rate == 0.5 * DEFAULT_CEILING
+    for _ in range(100):
+        bucket.speed_up()
+    assert bucket.rate == 0.5 * DEFAULT_CEILING
+
+
+@pytest.mark.parametrize("max_rate", [-1, 0.1])
+def test_token_bucket_ceiling_never_below_starting_rate(clock, max_rate):
+    bucket = TokenBucket(rate=0.5, max_rate=max_rate)
+    bucket.speed_up()
+    assert bucket.rate == 0.5
+    assert bucket.acquire() == 0
+
+
+def test_token_bucket_paces_requests_by_rate(clock):
+    bucket = TokenBucket(rate=2, burst=2)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+
+
+def test_token_bucket_honours_retry_after_pause(clock):
+    bucket = TokenBucket(rate=10, burst=5)
+    bucket.slow_down(pause=30)
+    assert bucket.acquire() >= 30
+    assert clock.slept[0] == pytest.approx(30)
+
+
+def test_rate_limiter_keeps_one_bucket_per_host(clock):
+    limiter = RateLimiter(default_rate=4, rates={"www.google.com": 0.5})
+    assert limiter.bucket("https://www.google.com/maps/search/x").rate == 0.5
+    assert limiter.bucket("www.google.com") is limiter.bucket("https://www.google.com/maps")
+    assert limiter.bucket("https://lh3.googleusercontent.com/p/abc").rate == 4
+
+    # 지정한 호스트는 기본 배수, 나머지(이미지 호스트)는 default_max_rate를 상한으로
+    limiter = RateLimiter(default_rate=4, rates={"www.google.com": 0.5}, default_max_rate=10)
+    assert limiter.bucket("www.google.com").max_rate == 0.5 * DEFAULT_CEILING
+    assert limiter.bucket("lh3.googleusercontent.com").max_rate == 10
+
+    limiter.failure("https://www.google.com/maps")
+    assert limiter.stats["slowdowns"] == 1
+    assert limiter.bucket("www.google.com").rate == 0.25
+
+
+def test_circuit_breaker_trips_and_doubles_cooldown(clock):
+    breaker = CircuitBreaker(window=4, threshold=0.5, min_calls=4, cooldown=10, max_cooldown=30)
+
+    for ok in (True, True, False):
+        assert not breaker.record(ok)
+    assert breaker.record(False)
+    assert breaker.trips == 1
+    assert breaker.open_until == clock.now + 10
+    assert breaker.wait() == 10
+
+    # 다시 열릴 때마다 멈춤 시간이 두 배 (상한 30초)
+    for expected in (20, 30):
+        assert [breaker.record(False) for _ in range(4)] == [False, False, False, True]
+        assert breaker.open_until == clock.now + expected
+        breaker.wait()
+    assert breaker.trips == 3
+    assert breaker.cooldown == 30
+
+
+def test_circuit_breaker_resets_cooldown_after_clean_run(clock):
+    breaker = CircuitBreaker(window=4, threshold=0.5, min_calls=2, cooldown=10)
+    breaker.record(False)
+    assert breaker.record(False)
+    assert breaker.cooldown == 20
+
+    breaker.wait()
+    breaker.record(True)
+    assert breaker.cooldown == 10
+
+
+def test_helpers_parse_hosts_and_retry_after():
+    assert host_of("https://lh3.googleusercontent.com/p/abc") == "lh3.googleusercontent.com"
+    assert host_of("www.google.com") == "www.google.com"
+    assert retry_after_seconds("12") == 12.0
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") is None
+
+
+@pytest.mark.parametrize("argv", [
+    ["--rate", "0.5", "--max-rate", "-1"],
+    ["--rate", "0.5", "--max-rate", "0.2"],
+    ["--image-rate", "8", "--max-image-rate", "4"],
+])
+def test_cli_rejects_ceiling_below_starting_rate(crawler_module, monkeypatch, argv):
+    monkeypatch.setattr('sys.argv', ["google-maps-crawler.py", *argv])
+    with pytest.raises(SystemExit) as exit_info:
+        crawler_module.parse_args()
+    assert exit_info.value.code == 2
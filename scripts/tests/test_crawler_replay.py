@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+"""크롤링 기록/재생: 보관소 저장과 다시 읽기, 기록한 응답을 네트워크 없이 재생"""
+
+import requests
+
+from crawler_benchmark import PHOTO_PREFIX, FixtureServer
+from crawler_network import normalize_photo_url
+from crawler_replay import ReplayArchive, mount_archive
+
+PHOTO = "https://lh3.googleusercontent.com/p/AF1Qip"
+
+
+def test_put_stores_each_content_once(tmp_path):
+    archive = ReplayArchive(tmp_path)
+    first = archive.put("<html>같은 내용</html>")
+    assert archive.put("<html>같은 내용</html>".encode('utf-8')) == first
+    assert archive.get(first).decode('utf-8') == "<html>같은 내용</html>"
+    assert archive.get("0" * 64) is None
+    assert (archive.stats["stored"], archive.stats["reused"]) == (1, 1)
+
+
+def test_places_and_responses_survive_save_and_reload(tmp_path):
+    archive = ReplayArchive(tmp_path)
+    archive.record_place(
+        "osechill", "오센칠", "서울", True,
+        pages={"list": "", "place": "<div>패널</div>"},
+        extraction={"images": [{"src": f"{PHOTO}=w408-h306-k-no"}]},
+        candidates=[f"{PHOTO}=w1200"],
+    )
+    archive.record_response(f"{PHOTO}=w1200", 200, {"Content-Type": "image/jpeg", "Age": "5"}, b"\xff\xd8\xff")
+    archive.save()
+
+    reloaded = ReplayArchive(tmp_path)
+    assert reloaded.place("osechill")["candidates"] == [f"{PHOTO}=w1200"]
+    assert reloaded.page("osechill") == "<div>패널</div>"
+    assert reloaded.page("osechill", "list") is None
+    assert reloaded.response(f"{PHOTO}=w1200") == (200, {"Content-Type": "image/jpeg"}, b"\xff\xd8\xff")
+    assert reloaded.place("missing") is None
+    assert (reloaded.stats["hits"], reloaded.stats["misses"]) == (2, 1)
+
+
+def test_recorded_responses_replay_without_network(tmp_path):
+    with FixtureServer(latency=0, image_latency=0, jitter=0) as server:
+        url = f"http://127.0.0.1:{server.port}{PHOTO_PREFIX}osechill-1=w408-h306-k-no"
+        archive = ReplayArchive(tmp_path)
+        session = requests.Session()
+        mount_archive(session, archive, 'record')
+        # 조건부 헤더는 기록할 때 빠지므로 304가 아닌 본문이 보관됨
+        recorded = session.get(url, headers={"If-None-Match": '"osechill-1-408x306"'}, timeout=10)
+        assert recorded.status_code == 200
+        archive.save()
+
+    # 서버가 내려간 뒤에도 같은 응답
+    replay = ReplayArchive(tmp_path)
+    session = requests.Session()
+    mount_archive(session, replay, 'replay')
+    response = session.get(url)
+    assert response.status_code == 200
+    assert response.content == recorded.content
+    assert response.headers["Content-Length"] == str(len(recorded.content))
+
+    etag = response.headers["ETag"]
+    assert session.get(url, headers={"If-None-Match": etag}).status_code == 304
+    assert session.get(url.replace("osechill-1", "osechill-2")).status_code == 404
+
+
+def test_replay_crawler_reparses_recorded_extraction(crawler_module, tmp_path):
+    archive = ReplayArchive(tmp_path / "replay")
+    archive.record_place("osechill", "오센칠", "서울", True, extraction={"images": [
+        {"src": f"{PHOTO}a=w408-h306-k-no"},
+        {"src": f"{PHOTO}a=w80-h80-k-no"},
+        {"src": f"{PHOTO}b=w408-h306-k-no"},
+    ]})
+
+    crawler = crawler_module.ReplayCrawler(archive, download_dir=tmp_path / "images")
+    assert crawler.open_place("오센칠", "서울", cache_key="osechill")
+    assert crawler.get_place_images(3) == [normalize_photo_url(f"{PHOTO}a"), normalize_photo_url(f"{PHOTO}b")]
+    assert not crawler.open_place("없는 곳", cache_key="missing")
+    crawler.close()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""셀렉터 상태: 최근 성공률(EMA) 순서, 연속 실패한 셀렉터는 맨 뒤로, 원자적 저장과 다시 읽기"""
+
+import pytest
+
+from crawler_selectors import DEAD_AFTER_MISSES, RECENT_WEIGHT, UNKNOWN_RATE, SelectorHealth
+
+SELECTORS = ["button.primary", "div.fallback", "a.legacy"]
+
+
+@pytest.fixture
+def health(tmp_path):
+    return SelectorHealth(tmp_path / "selector_health.json")
+
+
+def test_record_updates_ema_and_latency(health):
+    health.record("image", "div.fallback", True, seconds=0.2)
+    health.record("image", "div.fallback", False)
+    health.record("image", "div.fallback", True, seconds=0.1)
+
+    stats = health.groups["image"]["div.fallback"]
+    rate = UNKNOWN_RATE
+    for hit in (1.0, 0.0, 1.0):
+        rate = (1 - RECENT_WEIGHT) * rate + RECENT_WEIGHT * hit
+    assert stats["recent_rate"] == pytest.approx(rate)
+    assert stats["avg_ms"] == pytest.approx((1 - RECENT_WEIGHT) * 200 + RECENT_WEIGHT * 100)
+    assert (stats["hits"], stats["misses"], stats["consecutive_misses"]) == (2, 1, 0)
+
+
+def test_unknown_selectors_keep_original_order(health):
+    assert health.rank("image", SELECTORS) == SELECTORS
+
+
+def test_rank_prefers_recent_success_then_speed(health):
+    health.record("image", "a.legacy", True, seconds=0.05)
+    health.record("image", "div.fallback", True, seconds=0.3)
+    health.record("image", "button.primary", False)
+
+    # 성공률이 같은 두 셀렉터는 빠른 쪽이 먼저, 실패한 셀렉터는 처음 보는 셀렉터보다도 뒤
+    assert health.rank("image", SELECTORS + ["span.new"]) == ["a.legacy", "div.fallback", "span.new", "button.primary"]
+
+
+def test_dead_selector_moves_last_until_it_hits_again(health):
+    for _ in range(DEAD_AFTER_MISSES - 1):
+        health.record("image", "button.primary", False)
+    for _ in range(DEAD_AFTER_MISSES + 1):
+        health.record("image", "div.fallback", False)
+    assert not health.is_dead("image", "button.primary")
+    assert health.is_dead("image", "div.fallback")
+
+    # 한 번 더 실패하면 button.primary도 죽은 셀렉터 - 성공률과 상관없이 살아있는 셀렉터 뒤로
+    health.record("image", "button.primary", False)
+    health.record("image", "a.legacy", False)
+    assert health.rank("image", SELECTORS) == ["a.legacy", "button.primary", "div.fallback"]
+
+    health.record("image", "button.primary", True, seconds=0.1)
+    assert not health.is_dead("image", "button.primary")
+    assert health.rank("image", SELECTORS)[-1] == "div.fallback"
+
+
+def test_save_and_reload(health, tmp_path):
+    health.record("search", "input#q", True, seconds=0.02)
+    for _ in range(DEAD_AFTER_MISSES):
+        health.record("image", "a.legacy", False)
+    health.save()
+
+    assert [p.name for p in tmp_path.iterdir()] == ["selector_health.json"]
+    reloaded = SelectorHealth(tmp_path / "selector_health.json")
+    assert reloaded.groups == health.groups
+    assert reloaded.is_dead("image", "a.legacy")
+    assert reloaded.rank("image", SELECTORS)[-1] == "a.legacy"
+
+
+def test_corrupt_file_starts_fresh(tmp_path, capsys):
+    path = tmp_path / "selector_health.json"
+    path.write_text('{"image": {', encoding='utf-8')
+
+    health = SelectorHealth(path)
+    assert health.groups == {}
+    assert "새로 시작" in capsys.readouterr().out
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""준비 상태 대기: 상한선 파싱과 대기 기록 집계"""
+
+import pytest
+
+from crawler_waits import DEFAULT_CEILINGS, Readiness, parse_ceilings, summarize_timings
+
+
+def test_parse_ceilings_reads_name_seconds_pairs():
+    assert parse_ceilings(["photos=5", "search_results=2.5"]) == {"photos": 5.0, "search_results": 2.5}
+    assert parse_ceilings(None) == {}
+
+
+@pytest.mark.parametrize("value", ["photos", "unknown=3", "photos=fast"])
+def test_parse_ceilings_rejects_bad_values(value):
+    with pytest.raises(ValueError):
+        parse_ceilings([value])
+
+
+def test_readiness_ceilings_override_defaults():
+    readiness = Readiness(driver=None, ceilings={"photos": 2})
+    assert readiness.ceilings["photos"] == 2
+    assert readiness.ceilings["place_pane"] == DEFAULT_CEILINGS["place_pane"]
+
+
+def test_summarize_timings_counts_timeouts():
+    summary = summarize_timings([
+        {"name": "photos", "seconds": 1.0, "ok": True},
+        {"name": "photos", "seconds": 3.0, "ok": False},
+    ])
+    assert summary["photos"] == {"count": 2, "timeouts": 1, "total": 4.0, "max": 3.0}
@@ -1,4 +1,103 @@
 // 공간별 이미지 파일 이름 자동 생성 및 관리 유틸리티
+import placeImageCatalog from '@/data/placeImages.json';
+
+/**
+ * 이미지가 로딩되기 전에 바로 그릴 수 있는 플레이스홀더 (scripts/crawler_placeholders.py)
+ * lqip는 next/image의 blurDataURL로, color는 배경색으로 바로 사용
+ */
+export interface PlaceImagePlaceholder {
+  blurhash: string;
+  color: string;
+  lqip: string;
+}
+
+/**
+ * 크롤러가 실행 끝에 만드는 장소별 이미지 카탈로그의 이미지 한 장
+ * (scripts/crawler_catalog.py - 실제로 저장된 파일, 크기, 후처리 변형, 내용 해시)
+ */
+export interface PlaceImageEntry {
+  file: string;
+  hash: string;
+  bytes: number;
+  width?: number;
+  height?: number;
+  formats?: Record<string, number[]>;
+  placeholder?: PlaceImagePlaceholder;
+}
+
+interface PlaceImageCatalog {
+  version: number;
+  base_path: string;
+  places: Record<string, { images: PlaceImageEntry[] }>;
+  ids: Record<string, string>;
+}
+
+// 이 버전의 카탈로그만 읽음 (형식이 바뀌면 HEAD 확인으로 돌아감)
+const SUPPORTED_CATALOG_VERSION = 1;
+
+const catalog = placeImageCatalog as PlaceImageCatalog;
+const catalogReady = catalog.version === SUPPORTED_CATALOG_VERSION && Object.keys(catalog.places).length > 0;
+
+// 카탈로그에 있는 모든 이미지 경로 (존재 여부를 요청 없이 한 번의 조회로 확인)
+const catalogPaths = new Set(
+  Object.values(catalog.places).flatMap(place =>
+    place.images.map(image => `${catalog.base_path}/${image.file}`)
+  )
+);
+
+/**
+ * 카탈로그에서 공간의 이미지 목록을 찾는 함수 (공간 id, 영문 파일 이름, 공간 이름 순으로 찾음)
+ * 카탈로그가 없거나 해당 공간이 없으면 null
+ */
+export function getPlaceImageEntries(spaceIdOrName: string): PlaceImageEntry[] | null {
+  if (!catalogReady) {
+    return null;
+  }
+
+  const key = catalog.ids[spaceIdOrName]
+    ?? (catalog.places[spaceIdOrName] ? spaceIdOrName : generateImageFileName(spaceIdOrName));
+  return catalog.places[key]?.images ?? null;
+}
+
+/**
+ * 카탈로그에서 이미지 경로로 이미지 항목을 찾는 함수 (없으면 undefined)
+ */
+function findCatalogImage(imagePath: string): PlaceImageEntry | undefined {
+  if (!catalogReady) {
+    return undefined;
+  }
+
+  const file = imagePath.split('/').pop() ?? '';
+  const key = file.replace(/\.jpg$/, '').replace(/-\d+$/, '');
+  return catalog.places[key]?.images.find(image => image.file === file);
+}
+
+/**
+ * 이미지의 플레이스홀더와 크기를 가져오는 함수 (레이아웃 이동 없이 자리를 잡고 바로 색/흐린 미리보기를 그림)
+ * 예: <Image src={path} placeholder="blur" blurDataURL={getImagePlaceholder(path)?.lqip} ... />
+ */
+export function getImagePlaceholder(
+  imagePath: string
+): (PlaceImagePlaceholder & { width?: number; height?: number }) | null {
+  const entry = findCatalogImage(imagePath);
+  if (!entry?.placeholder) {
+    return null;
+  }
+
+  return { ...entry.placeholder, width: entry.width, height: entry.height };
+}
+
+/**
+ * 후처리된 반응형 변형으로 srcset 문자열을 만드는 함수 (변형이 없으면 빈 문자열)
+ * 예: getImageSrcSet('/images/places/osechill-1.jpg', 'webp') -> '.../osechill-1-320w.webp 320w, ...'
+ */
+export function getImageSrcSet(imagePath: string, format: string = 'webp'): string {
+  const stem = (imagePath.split('/').pop() ?? '').replace(/\.jpg$/, '');
+  const entry = findCatalogImage(imagePath);
+  const widths = entry?.formats?.[format] ?? [];
+
+  return widths.map(width => `${catalog.base_path}/${stem}-${width}w.${format} ${width}w`).join(', ');
+}
 
 /**
  * 공간 이름을 영문 파일 이름으로 변환하는 함수
@@ -139,6 +238,13 @@ export function generateImageFileName(spaceName: string): string {
  */
 export function generateImagePaths(spaceId: string, imageCount: number = 3): string[] {
   const basePath = '/images/places';
+
+  // 카탈로그가 있으면 실제로 저장된 이미지만 사용
+  const entries = getPlaceImageEntries(spaceId);
+  if (entries) {
+    return entries.slice(0, imageCount).map(image => `${catalog.base_path}/${image.file}`);
+  }
+
   const fileName = generateImageFileName(spaceId);
   
   const paths: string[] = [];
@@ -153,6 +259,12 @@ export function generateImagePaths(spaceId: string, imageCount: number = 3): str
  * 이미지 파일이 존재하는지 확인하는 함수
  */
 export async function checkImageExists(imagePath: string): Promise<boolean> {
+  // 크롤러가 저장한 이미지는 카탈로그로 확인 (공간 카드마다 HEAD 요청을 보내지 않음)
+  // 카탈로그에 없는 이미지(직접 올린 파일, 카탈로그 갱신 전 이미지)는 HEAD 요청으로 확인
+  if (catalogReady && catalogPaths.has(imagePath)) {
+    return true;
+  }
+
   try {
     const response = await fetch(imagePath, { method: 'HEAD' });
     return response.ok;